@@ -0,0 +1,48 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import sys
+import os
+
+
+MODULE_DIR = os.path.dirname( os.path.abspath(__file__) )
+SRC_DIR    = os.path.abspath( os.path.join( MODULE_DIR, os.pardir ) )
+
+# #### add as first source root
+sys.path.insert(0, SRC_DIR )
+
+
+SAMPLES_DIR  = os.path.abspath( os.path.join( SRC_DIR, os.pardir, "exmple", "samples" ) )
+TEST_DATA_DIR = os.path.join( SRC_DIR, "testxodrpy", "data" )
+
+## reference report compared by default by 'runbench.py'
+BASELINE_PATH = os.path.join( MODULE_DIR, "baseline.json" )
+
+
+def get_default_maps():
+    """Return list of maps used by benchmarks: bundled samples and 'town1'."""
+    ret_list = []
+    if os.path.isdir( SAMPLES_DIR ):
+        ret_list.extend( os.path.join( SAMPLES_DIR, item ) for item in sorted( os.listdir( SAMPLES_DIR ) ) if item.endswith( ".xodr" ) )
+    ret_list.append( os.path.join( TEST_DATA_DIR, "town1.xodr" ) )
+    return ret_list
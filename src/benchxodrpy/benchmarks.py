@@ -0,0 +1,249 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import sys
+import subprocess
+import logging
+import time
+import tempfile
+import shutil
+import tracemalloc
+from typing import List, Dict, Callable
+
+from xodrpy.xodr import load
+from xodrpy.mapscan import scan
+from xodrpy.draw import draw_data
+
+from benchxodrpy import SRC_DIR
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+## ===========================================================
+
+
+##
+class MapContext():
+    """Data of benchmarked map shared by benchmarks (map is loaded once)."""
+
+    def __init__(self, xodr_path):
+        self.xodr_path = xodr_path
+        self.name      = os.path.basename( xodr_path )
+        self.opendrive = load( xodr_path )
+        self.temp_dir  = tempfile.mkdtemp( prefix="xodrbench_" )
+
+    def close(self):
+        shutil.rmtree( self.temp_dir, ignore_errors=True )
+
+
+## benchmark is function taking 'MapContext' and returning number of processed items
+def bench_load( context: MapContext ):
+    load( context.xodr_path )
+    return os.path.getsize( context.xodr_path )
+
+
+def bench_scan( context: MapContext ):
+    scan( context.xodr_path )
+    return os.path.getsize( context.xodr_path )
+
+
+def bench_bounding_box( context: MapContext ):
+    context.opendrive.boundingBox()
+    return context.opendrive.roadsNumber()
+
+
+def bench_line_approx( context: MapContext ):
+    counter = 0
+    for road in context.opendrive.roads():
+        for geom in road.geometries():
+            geom.lineApprox( 1.0 )
+            counter += 1
+    return counter
+
+
+def bench_road_position( context: MapContext, samples_num=10 ):
+    counter = 0
+    for road in context.opendrive.roads():
+        length = road.length()
+        for i in range( 0, samples_num ):
+            road.position( length * i / samples_num, 0.0, 0.0 )
+            counter += 1
+    return counter
+
+
+def bench_positions( context: MapContext, samples_num=1000 ):
+    """Vectorized counterpart of 'bench_road_position()'."""
+    road_ids = []
+    s_coords = []
+    for road in context.opendrive.roads():
+        length = road.length()
+        road_ids.extend( [ road.id() ] * samples_num )
+        s_coords.extend( length * i / samples_num for i in range( 0, samples_num ) )
+    context.opendrive.positions( road_ids, s_coords, [ 0.0 ] * len( s_coords ) )
+    return len( s_coords )
+
+
+def bench_signal_lookups( context: MapContext ):
+    opendrive = context.opendrive
+    counter = 0
+    for sig_id in opendrive.signalIDList():
+        opendrive.signalById( sig_id )
+        counter += 1
+    for sig_uuid in opendrive.signalUUIDList():
+        opendrive.signalByUUID( sig_uuid )
+        counter += 1
+    for sig_id in opendrive.signalIDList():
+        opendrive.signalReferencesByID( sig_id )
+        counter += 1
+    return counter
+
+
+def bench_draw_data( context: MapContext ):
+    draw_data( context.opendrive, os.path.join( context.temp_dir, context.name + ".svg" ) )
+    return context.opendrive.roadsNumber()
+
+
+## name -> (function, unit of items)
+BENCHMARKS: Dict[ str, tuple ] = {
+    "load":           ( bench_load, "bytes" ),
+    "scan":           ( bench_scan, "bytes" ),
+    "boundingBox":    ( bench_bounding_box, "roads" ),
+    "lineApprox":     ( bench_line_approx, "geometries" ),
+    "Road.position":  ( bench_road_position, "points" ),
+    "positions":      ( bench_positions, "points" ),
+    "signalLookups":  ( bench_signal_lookups, "lookups" ),
+    "draw_data":      ( bench_draw_data, "roads" ),
+}
+
+
+## ===========================================================
+
+
+def measure( bench_function: Callable, context: MapContext, repeats=3, memory=True ):
+    """Run benchmark given number of times and return dict of measurements.
+
+    Time is measured without memory tracing, peak memory is measured in separate run.
+    """
+    times = []
+    items = 0
+    for _ in range( 0, max( repeats, 1 ) ):
+        start_time = time.perf_counter()
+        items = bench_function( context )
+        times.append( time.perf_counter() - start_time )
+    best_time = min( times )
+    result = { "time":       best_time,
+               "mean":       sum( times ) / len( times ),
+               "repeats":    len( times ),
+               "items":      items,
+               "throughput": items / best_time if best_time > 0.0 else None,
+               "peak_memory": None }
+    if memory:
+        tracemalloc.start()
+        try:
+            bench_function( context )
+            result[ "peak_memory" ] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmarks( maps_list: List[ str ], bench_names=None, repeats=3, memory=True ) -> List[ dict ]:
+    """Run benchmarks on given maps. Return list of results (one per map and benchmark)."""
+    if bench_names is None:
+        bench_names = list( BENCHMARKS.keys() )
+    ret_list = []
+    for xodr_path in maps_list:
+        context = MapContext( xodr_path )
+        try:
+            for bench_name in bench_names:
+                bench_function, unit = BENCHMARKS[ bench_name ]
+                result = measure( bench_function, context, repeats, memory )
+                result[ "map" ]       = context.name
+                result[ "benchmark" ] = bench_name
+                result[ "unit" ]      = unit
+                _LOGGER.info( "%s %s: %.6fs", context.name, bench_name, result[ "time" ] )
+                ret_list.append( result )
+        finally:
+            context.close()
+    return ret_list
+
+
+def compare_results( results: List[ dict ], baseline: List[ dict ], threshold=0.2 ) -> List[ dict ]:
+    """Compare results with baseline.
+
+    Return list of dicts (map, benchmark, time, baseline time, ratio, regression flag) of benchmarks
+    present in both lists. Benchmark is regression if it is slower than baseline by more than 'threshold'.
+    """
+    baseline_dict = { ( item[ "map" ], item[ "benchmark" ] ): item for item in baseline }
+    ret_list = []
+    for item in results:
+        base_item = baseline_dict.get( ( item[ "map" ], item[ "benchmark" ] ), None )
+        if base_item is None or not base_item[ "time" ]:
+            continue
+        ratio = item[ "time" ] / base_item[ "time" ]
+        ret_list.append( { "map":        item[ "map" ],
+                           "benchmark":  item[ "benchmark" ],
+                           "time":       item[ "time" ],
+                           "baseline":   base_item[ "time" ],
+                           "ratio":      ratio,
+                           "regression": ratio > 1.0 + threshold } )
+    return ret_list
+
+
+## ===========================================================
+
+
+## modules measured by import time benchmark
+IMPORT_MODULES = ( "xodrpy", "xodrpy.rrdata", "xodrpy.xodr", "xodrpy.draw" )
+
+IMPORT_MAP_NAME = "<import>"
+
+
+def measure_import( module_name, repeats=3 ):
+    """Measure time of importing module in fresh interpreter. Return dict of measurements."""
+    code = f"import time; start = time.perf_counter(); import {module_name}; print( time.perf_counter() - start )"
+    env = dict( os.environ )
+    env[ "PYTHONPATH" ] = os.pathsep.join( item for item in ( SRC_DIR, env.get( "PYTHONPATH" ) ) if item )
+    times = []
+    for _ in range( 0, max( repeats, 1 ) ):
+        result = subprocess.run( [ sys.executable, "-c", code ], env=env, cwd=SRC_DIR,
+                                 capture_output=True, text=True, check=True )
+        times.append( float( result.stdout.strip() ) )
+    best_time = min( times )
+    return { "map":         IMPORT_MAP_NAME,
+             "benchmark":   module_name,
+             "unit":        "imports",
+             "time":        best_time,
+             "mean":        sum( times ) / len( times ),
+             "repeats":     len( times ),
+             "items":       1,
+             "throughput":  1.0 / best_time if best_time > 0.0 else None,
+             "peak_memory": None }
+
+
+def run_import_benchmarks( modules_list=None, repeats=3 ) -> List[ dict ]:
+    if modules_list is None:
+        modules_list = IMPORT_MODULES
+    return [ measure_import( module_name, repeats ) for module_name in modules_list ]
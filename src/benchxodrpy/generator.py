@@ -0,0 +1,636 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import sys
+import math
+import copy
+import uuid
+import random
+import logging
+from typing import List, Dict, Tuple
+from dataclasses import dataclass
+from xml.sax.saxutils import quoteattr
+
+import xmltodict
+
+## package initialization adds source directory to 'sys.path'
+import benchxodrpy  # noqa: F401  # pylint: disable=W0611
+from xodrpy.types import ClothoidGeometry
+from xodrpy.xodr import load
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+## ===========================================================
+
+
+@dataclass
+class GeneratorConfig():
+    """Parameters of generated map.
+
+    Map is grid of 'columns' x 'rows' junctions connected by roads. Each road consists of
+    curved patterns (line, arc or spiral selected with weights of 'geometry_mix') mirrored
+    around middle line, so road always ends in neighbour junction.
+    """
+    columns: int = 4
+    rows: int = 4
+    spacing: float = 200.0              ## distance between junctions centers
+    junction_radius: float = 20.0
+    geometry_mix: Tuple[ float, float, float ] = ( 0.4, 0.3, 0.3 )     ## weights of line, arc and spiral
+    patterns: int = 2                   ## number of patterns in each half of road
+    curvature: float = 0.01
+    lane_sections: int = 2
+    lanes: int = 2                      ## number of lanes on each side of road
+    lane_width: float = 3.5
+    signals: bool = True
+    controllers: bool = True
+    seed: int = 0
+
+
+def count_roads( config: GeneratorConfig ):
+    """Return number of roads (including connecting roads) of map generated with given config."""
+    counter = 0
+    for row in range( 0, config.rows ):
+        for col in range( 0, config.columns ):
+            degree = len( node_arms( config, col, row ) )
+            counter += degree * ( degree - 1 )
+    counter += ( config.columns - 1 ) * config.rows + config.columns * ( config.rows - 1 )
+    return counter
+
+
+def config_for_roads( roads_num, **kwargs ) -> GeneratorConfig:
+    """Return config of square grid having at least given number of roads."""
+    config = GeneratorConfig( **kwargs )
+    size = 2
+    while True:
+        config.columns = size
+        config.rows    = size
+        if count_roads( config ) >= roads_num:
+            return config
+        size += 1
+
+
+## arms directions: east, north, west, south
+ARMS_DIRECTIONS = ( ( 1, 0 ), ( 0, 1 ), ( -1, 0 ), ( 0, -1 ) )
+
+
+def node_arms( config: GeneratorConfig, col, row ) -> List[ int ]:
+    """Return indexes of directions of existing roads of given grid node."""
+    ret_list = []
+    for index, ( dcol, drow ) in enumerate( ARMS_DIRECTIONS ):
+        if 0 <= col + dcol < config.columns and 0 <= row + drow < config.rows:
+            ret_list.append( index )
+    return ret_list
+
+
+## ===========================================================
+
+
+def format_number( value ):
+    return f"{value:.16e}"
+
+
+def format_attribs( attribs: dict ):
+    ret_list = []
+    for key, value in attribs.items():
+        if isinstance( value, float ):
+            value = format_number( value )
+        ret_list.append( f"{key}={quoteattr( str( value ) )}" )
+    return " ".join( ret_list )
+
+
+def signal_uuid( index, group=0 ):
+    """Return deterministic UUID in format of RoadRunner meta data."""
+    return f"{{00000000-0000-0000-{group:04x}-{index:012x}}}"
+
+
+def road_geometries( config: GeneratorConfig, rand: random.Random, start, heading, distance ) -> List[ Tuple ]:
+    """Return list of geometries tuples (type, s, x, y, hdg, length, curvature start, curvature end).
+
+    Geometries start at 'start' point and end in point distant by 'distance' in direction of 'heading'.
+    """
+    pattern_length = distance / ( 2 * config.patterns + 1 )
+    max_curv = min( config.curvature, math.pi / 4 / pattern_length )
+    half_list = []
+    for _ in range( 0, config.patterns ):
+        kind = rand.choices( ( "line", "arc", "spiral" ), weights=config.geometry_mix )[0]
+        curv = max_curv * rand.uniform( 0.5, 1.0 ) * rand.choice( ( -1.0, 1.0 ) )
+        half_list.append( ( kind, curv ) )
+
+    ## segments: (type, length, curvature start, curvature end)
+    segments = []
+    for kind, curv in half_list:
+        segments.extend( pattern_segments( kind, pattern_length, curv ) )
+    segments.append( ( "line", pattern_length, 0.0, 0.0 ) )
+    for kind, curv in half_list:
+        ## mirrored pattern cancels lateral offset
+        segments.extend( pattern_segments( kind, pattern_length, -curv ) )
+
+    ## first half covers less than its length, so extend middle line to reach end point
+    pos_x, pos_y, hdg = 0.0, 0.0, 0.0
+    for kind, length, curv_start, curv_end in segments:
+        pos_x, pos_y, hdg = segment_end( kind, pos_x, pos_y, hdg, length, curv_start, curv_end )
+    forward = pos_x
+    middle_index = len( segments ) // 2
+    middle_length = pattern_length + distance - forward
+    segments[ middle_index ] = ( "line", middle_length, 0.0, 0.0 )
+
+    ret_list = []
+    s_coord = 0.0
+    pos_x, pos_y, hdg = start[0], start[1], heading
+    for kind, length, curv_start, curv_end in segments:
+        ret_list.append( ( kind, s_coord, pos_x, pos_y, hdg, length, curv_start, curv_end ) )
+        pos_x, pos_y, hdg = segment_end( kind, pos_x, pos_y, hdg, length, curv_start, curv_end )
+        s_coord += length
+    return ret_list
+
+
+def pattern_segments( kind, length, curv ):
+    """Return segments of pattern. Each pattern keeps heading (heading at end is the same as at start)."""
+    if kind == "line":
+        return [ ( "line", length, 0.0, 0.0 ) ]
+    if kind == "arc":
+        return [ ( "arc", length / 2, curv, curv ), ( "arc", length / 2, -curv, -curv ) ]
+    part = length / 4
+    return [ ( "spiral", part, 0.0, curv ), ( "spiral", part, curv, 0.0 ),
+             ( "spiral", part, 0.0, -curv ), ( "spiral", part, -curv, 0.0 ) ]
+
+
+def segment_end( kind, pos_x, pos_y, hdg, length, curv_start, curv_end ):
+    """Return tuple (x, y, heading) of end of segment."""
+    if kind == "line":
+        return ( pos_x + length * math.cos( hdg ), pos_y + length * math.sin( hdg ), hdg )
+    if kind == "arc":
+        end_hdg = hdg + curv_start * length
+        end_x = pos_x + ( math.sin( end_hdg ) - math.sin( hdg ) ) / curv_start
+        end_y = pos_y + ( math.cos( hdg ) - math.cos( end_hdg ) ) / curv_start
+        return ( end_x, end_y, end_hdg )
+    geom = ClothoidGeometry()
+    geom.initialize( { "@s": "0.0", "@x": str( pos_x ), "@y": str( pos_y ), "@hdg": str( hdg ),
+                       "@length": str( length ), "@curvStart": str( curv_start ), "@curvEnd": str( curv_end ) } )
+    end_point = geom.positionByOffsetRaw( length )
+    return ( end_point[0], end_point[1], geom.headingByOffsetRaw( length ) )
+
+
+## ===========================================================
+
+
+class MapWriter():
+    """Writes OpenDRIVE elements to text file."""
+
+    def __init__(self, out_file):
+        self.out_file = out_file
+        self.indent   = 0
+
+    def begin(self, tag, attribs=None):
+        self._write( tag, attribs, ">" )
+        self.indent += 1
+
+    def end(self, tag):
+        self.indent -= 1
+        self.out_file.write( f"{'    ' * self.indent}</{tag}>\n" )
+
+    def element(self, tag, attribs=None):
+        self._write( tag, attribs, "/>" )
+
+    def _write(self, tag, attribs, closing):
+        indent = '    ' * self.indent
+        if attribs:
+            self.out_file.write( f"{indent}<{tag} {format_attribs( attribs )}{closing}\n" )
+        else:
+            self.out_file.write( f"{indent}<{tag}{closing}\n" )
+
+
+class MapGenerator():
+    """Generates grid map described by 'GeneratorConfig'."""
+
+    def __init__(self, config: GeneratorConfig):
+        self.config = config
+        self.rand   = random.Random( config.seed )
+        self.roads_counter   = 0
+        self.signals_counter = 0
+        ## (col, row, arm index) -> (road id, contact point)
+        self.arms_dict: Dict[ Tuple[ int, int, int ], Tuple[ str, str ] ] = {}
+        ## junction id -> list of signal ids
+        self.junction_signals: Dict[ str, List[ str ] ] = {}
+
+    def junctionId(self, col, row):
+        return str( row * self.config.columns + col + 1 )
+
+    def armPoint(self, col, row, arm):
+        config = self.config
+        dcol, drow = ARMS_DIRECTIONS[ arm ]
+        return ( col * config.spacing + dcol * config.junction_radius,
+                 row * config.spacing + drow * config.junction_radius )
+
+    def nextRoadId(self):
+        self.roads_counter += 1
+        return str( self.roads_counter )
+
+    def write(self, out_file):
+        writer = MapWriter( out_file )
+        config = self.config
+        out_file.write( '<?xml version="1.0" standalone="yes"?>\n' )
+        writer.begin( "OpenDRIVE" )
+        writer.element( "header", { "revMajor": "1", "revMinor": "4", "name": "generated", "version": "1.00" } )
+
+        ## roads between junctions
+        for row in range( 0, config.rows ):
+            for col in range( 0, config.columns ):
+                for arm in ( 0, 1 ):
+                    dcol, drow = ARMS_DIRECTIONS[ arm ]
+                    if col + dcol >= config.columns or row + drow >= config.rows:
+                        continue
+                    self.writeRoad( writer, col, row, arm )
+
+        ## connecting roads
+        junctions_list = []
+        for row in range( 0, config.rows ):
+            for col in range( 0, config.columns ):
+                connections = self.writeConnectingRoads( writer, col, row )
+                junctions_list.append( ( self.junctionId( col, row ), connections ) )
+
+        for junc_id, connections in junctions_list:
+            self.writeJunction( writer, junc_id, connections )
+
+        if config.controllers:
+            for junc_id, _ in junctions_list:
+                signals_list = self.junction_signals.get( junc_id, [] )
+                if not signals_list:
+                    continue
+                writer.begin( "controller", { "name": f"ctrl{junc_id}", "id": junc_id, "sequence": "0" } )
+                for sig_id in signals_list:
+                    writer.element( "control", { "signalId": sig_id, "type": "0" } )
+                writer.end( "controller" )
+
+        writer.end( "OpenDRIVE" )
+
+    def writeRoad(self, writer: MapWriter, col, row, arm):
+        config = self.config
+        dcol, drow = ARMS_DIRECTIONS[ arm ]
+        end_col, end_row = col + dcol, row + drow
+        opposite = ( arm + 2 ) % 4
+        road_id  = self.nextRoadId()
+        start    = self.armPoint( col, row, arm )
+        heading  = math.atan2( drow, dcol )
+        distance = config.spacing - 2 * config.junction_radius
+        geoms    = road_geometries( config, self.rand, start, heading, distance )
+        length   = geoms[-1][1] + geoms[-1][5]
+
+        start_junc = self.junctionId( col, row )
+        end_junc   = self.junctionId( end_col, end_row )
+        self.arms_dict[ ( col, row, arm ) ]               = ( road_id, "start" )
+        self.arms_dict[ ( end_col, end_row, opposite ) ] = ( road_id, "end" )
+
+        writer.begin( "road", { "name": f"Road {road_id}", "length": length, "id": road_id, "junction": "-1" } )
+        writer.begin( "link" )
+        writer.element( "predecessor", { "elementType": "junction", "elementId": start_junc } )
+        writer.element( "successor", { "elementType": "junction", "elementId": end_junc } )
+        writer.end( "link" )
+        self.writePlanView( writer, geoms )
+        self.writeLanes( writer, length, config.lane_sections )
+
+        if config.signals:
+            lanes_offset = config.lanes * config.lane_width
+            signals = [ ( length - 10.0, -lanes_offset - 1.0, "+", -1, end_junc ),
+                        ( 10.0, lanes_offset + 1.0, "-", 1, start_junc ) ]
+            self.writeSignals( writer, signals )
+        writer.end( "road" )
+
+    def writeConnectingRoads(self, writer: MapWriter, col, row):
+        """Write connecting roads of junction. Return list of connections data."""
+        config = self.config
+        junc_id = self.junctionId( col, row )
+        arms = node_arms( config, col, row )
+        radius = config.junction_radius
+        connections = []
+        for in_arm in arms:
+            for out_arm in arms:
+                if in_arm == out_arm:
+                    continue
+                in_road, in_contact   = self.arms_dict[ ( col, row, in_arm ) ]
+                out_road, out_contact = self.arms_dict[ ( col, row, out_arm ) ]
+                start   = self.armPoint( col, row, in_arm )
+                heading = math.atan2( ARMS_DIRECTIONS[ in_arm ][1], ARMS_DIRECTIONS[ in_arm ][0] ) + math.pi
+                turn    = ( out_arm - in_arm ) % 4
+                if turn == 2:
+                    geom = ( "line", 0.0, start[0], start[1], heading, 2 * radius, 0.0, 0.0 )
+                else:
+                    ## turn 1 is right turn, turn 3 is left turn
+                    curv = -1.0 / radius if turn == 1 else 1.0 / radius
+                    geom = ( "arc", 0.0, start[0], start[1], heading, math.pi * radius / 2, curv, curv )
+                length = geom[5]
+                road_id = self.nextRoadId()
+                writer.begin( "road", { "name": f"Road {road_id}", "length": length, "id": road_id, "junction": junc_id } )
+                writer.begin( "link" )
+                writer.element( "predecessor", { "elementType": "road", "elementId": in_road, "contactPoint": in_contact } )
+                writer.element( "successor", { "elementType": "road", "elementId": out_road, "contactPoint": out_contact } )
+                writer.end( "link" )
+                self.writePlanView( writer, [ geom ] )
+                ## lanes entering junction are right lanes at end of road and left lanes at start of road
+                in_sign = -1 if in_contact == "end" else 1
+                ## lanes leaving junction are right lanes at start of road and left lanes at end of road
+                out_sign = -1 if out_contact == "start" else 1
+                lanes_links = { -lane: ( in_sign * lane, out_sign * lane ) for lane in range( 1, config.lanes + 1 ) }
+                self.writeLanes( writer, length, 1, right_only=True, lanes_links=lanes_links )
+                writer.end( "road" )
+                lane_links = [ ( in_sign * lane, -lane ) for lane in range( 1, config.lanes + 1 ) ]
+                connections.append( ( in_road, road_id, lane_links ) )
+        return connections
+
+    def writeJunction(self, writer: MapWriter, junc_id, connections):
+        writer.begin( "junction", { "name": "", "id": junc_id } )
+        for index, ( in_road, conn_road, lane_links ) in enumerate( connections ):
+            writer.begin( "connection", { "id": str( index ), "incomingRoad": in_road, "connectingRoad": conn_road,
+                                          "contactPoint": "start" } )
+            for from_lane, to_lane in lane_links:
+                writer.element( "laneLink", { "from": str( from_lane ), "to": str( to_lane ) } )
+            writer.end( "connection" )
+        if self.config.controllers and self.junction_signals.get( junc_id ):
+            writer.element( "controller", { "id": junc_id, "type": "0", "sequence": "0" } )
+        writer.end( "junction" )
+
+    def writePlanView(self, writer: MapWriter, geoms):
+        writer.begin( "planView" )
+        for kind, s_coord, pos_x, pos_y, hdg, length, curv_start, curv_end in geoms:
+            writer.begin( "geometry", { "s": s_coord, "x": pos_x, "y": pos_y, "hdg": hdg, "length": length } )
+            if kind == "line":
+                writer.element( "line" )
+            elif kind == "arc":
+                writer.element( "arc", { "curvature": curv_start } )
+            else:
+                writer.element( "spiral", { "curvStart": curv_start, "curvEnd": curv_end } )
+            writer.end( "geometry" )
+        writer.end( "planView" )
+
+    def writeLanes(self, writer: MapWriter, length, sections_num, right_only=False, lanes_links=None):
+        """Write lanes of road.
+
+        'lanes_links' is optional dict: lane id -> (predecessor lane id, successor lane id) on other roads.
+        """
+        config = self.config
+        writer.begin( "lanes" )
+        for section in range( 0, sections_num ):
+            writer.begin( "laneSection", { "s": length * section / sections_num } )
+            sides = [ ( "right", [ -lane for lane in range( 1, config.lanes + 1 ) ] ) ]
+            if not right_only:
+                sides.insert( 0, ( "left", list( range( config.lanes, 0, -1 ) ) ) )
+            for side_name, lanes_ids in sides:
+                if side_name == "right":
+                    writer.begin( "center" )
+                    writer.element( "lane", { "id": "0", "type": "none", "level": "false" } )
+                    writer.end( "center" )
+                writer.begin( side_name )
+                for lane_id in lanes_ids:
+                    writer.begin( "lane", { "id": str( lane_id ), "type": "driving", "level": "false" } )
+                    if lanes_links and lane_id in lanes_links:
+                        pred_id, succ_id = lanes_links[ lane_id ]
+                        writer.begin( "link" )
+                        writer.element( "predecessor", { "id": str( pred_id ) } )
+                        writer.element( "successor", { "id": str( succ_id ) } )
+                        writer.end( "link" )
+                    elif sections_num > 1:
+                        writer.begin( "link" )
+                        if section > 0:
+                            writer.element( "predecessor", { "id": str( lane_id ) } )
+                        if section < sections_num - 1:
+                            writer.element( "successor", { "id": str( lane_id ) } )
+                        writer.end( "link" )
+                    writer.element( "width", { "sOffset": 0.0, "a": config.lane_width, "b": 0.0, "c": 0.0, "d": 0.0 } )
+                    writer.end( "lane" )
+                writer.end( side_name )
+            writer.end( "laneSection" )
+        writer.end( "lanes" )
+
+    def writeSignals(self, writer: MapWriter, signals):
+        """Write signals and references ('gates'). Signal is tuple (s, t, orientation, lane id, junction id)."""
+        writer.begin( "signals" )
+        refs_list = []
+        for s_coord, t_coord, orientation, lane_id, junc_id in signals:
+            self.signals_counter += 1
+            sig_id   = str( self.signals_counter )
+            sig_uuid = signal_uuid( self.signals_counter )
+            self.junction_signals.setdefault( junc_id, [] ).append( sig_id )
+            writer.begin( "signal", { "s": s_coord, "t": t_coord, "id": sig_id, "name": "", "dynamic": "yes",
+                                      "orientation": orientation, "zOffset": 3.0, "type": "1000001",
+                                      "country": "OpenDRIVE", "subtype": "-1", "value": -1.0, "hOffset": 0.0 } )
+            self.writeSignalMeta( writer, { "signalId": sig_uuid } )
+            writer.end( "signal" )
+            ref_s = s_coord + 1.0 if orientation == "+" else s_coord - 1.0
+            refs_list.append( ( ref_s, lane_id, sig_id, sig_uuid, orientation ) )
+        for ref_s, lane_id, sig_id, sig_uuid, orientation in refs_list:
+            lane_t = math.copysign( self.config.lane_width / 2, lane_id )
+            writer.begin( "signalReference", { "s": ref_s, "t": lane_t, "id": sig_id, "orientation": orientation } )
+            writer.element( "validity", { "fromLane": str( lane_id ), "toLane": str( lane_id ) } )
+            gate_uuid = signal_uuid( int( sig_id ), 1 )
+            self.writeSignalMeta( writer, { "signalId": sig_uuid, "gateId": gate_uuid, "turnRelation": "straight" } )
+            writer.end( "signalReference" )
+        writer.end( "signals" )
+
+    def writeSignalMeta(self, writer: MapWriter, attribs):
+        writer.begin( "userData", { "code": "vectorSignal" } )
+        writer.element( "vectorSignal", attribs )
+        writer.end( "userData" )
+
+
+def generate_map( out_path, config: GeneratorConfig = None ):
+    """Write generated map to file. Same config always produces the same file."""
+    if config is None:
+        config = GeneratorConfig()
+    generator = MapGenerator( config )
+    with open( out_path, 'w', encoding="utf-8" ) as out_file:
+        generator.write( out_file )
+    return generator.roads_counter
+
+
+## ===========================================================
+
+
+## (element path, attribute, kind of value)
+TILE_REMAP = [
+    ( ( "road", ), "@id", "id" ),
+    ( ( "road", ), "@junction", "id" ),
+    ( ( "road", "link", "predecessor" ), "@elementId", "id" ),
+    ( ( "road", "link", "successor" ), "@elementId", "id" ),
+    ( ( "road", "planView", "geometry" ), "@x", "x" ),
+    ( ( "road", "planView", "geometry" ), "@y", "y" ),
+    ( ( "road", "signals", "signal" ), "@id", "id" ),
+    ( ( "road", "signals", "signal", "userData", "vectorSignal" ), "@signalId", "uuid" ),
+    ( ( "road", "signals", "signalReference" ), "@id", "id" ),
+    ( ( "road", "signals", "signalReference", "userData", "vectorSignal" ), "@signalId", "uuid" ),
+    ( ( "road", "signals", "signalReference", "userData", "vectorSignal" ), "@gateId", "uuid" ),
+    ( ( "road", "objects", "object" ), "@id", "id" ),
+    ( ( "junction", ), "@id", "id" ),
+    ( ( "junction", "connection" ), "@incomingRoad", "id" ),
+    ( ( "junction", "connection" ), "@connectingRoad", "id" ),
+    ( ( "junction", "controller" ), "@id", "id" ),
+    ( ( "controller", ), "@id", "id" ),
+    ( ( "controller", "control" ), "@signalId", "id" ),
+]
+
+
+def as_list( value ):
+    if value is None:
+        return []
+    if isinstance( value, list ):
+        return value
+    return [ value ]
+
+
+def path_elements( data_dict, path ):
+    """Return list of elements found under given path."""
+    elements = [ data_dict ]
+    for key in path:
+        found = []
+        for elem in elements:
+            if isinstance( elem, dict ):
+                found.extend( item for item in as_list( elem.get( key ) ) if isinstance( item, dict ) )
+        elements = found
+    return elements
+
+
+def max_numeric_id( root_dict ):
+    ret_value = 0
+    for path, attr, kind in TILE_REMAP:
+        if kind != "id":
+            continue
+        for elem in path_elements( root_dict, path ):
+            value = elem.get( attr )
+            if value is not None and value.isdigit():
+                ret_value = max( ret_value, int( value ) )
+    return ret_value
+
+
+def tile_map( source_path, out_path, columns=2, rows=2, margin=50.0 ):
+    """Write map made of copies of source map placed on grid.
+
+    Identifiers of copies are shifted (numeric ones) or suffixed with tile index, so each copy is
+    separate, unconnected pattern. Return number of written roads.
+    """
+    with open( source_path, 'r', encoding="utf-8" ) as source_file:
+        root_dict = xmltodict.parse( source_file.read() )[ "OpenDRIVE" ]
+    bbox = load( source_path ).boundingBox()
+    tile_width  = bbox[1][0] - bbox[0][0] + margin
+    tile_height = bbox[1][1] - bbox[0][1] + margin
+    id_stride   = 10 ** len( str( max_numeric_id( root_dict ) ) )
+
+    roads_counter = 0
+    with open( out_path, 'w', encoding="utf-8" ) as out_file:
+        out_file.write( '<?xml version="1.0" standalone="yes"?>\n<OpenDRIVE>\n' )
+        header = root_dict.get( "header" )
+        if header is not None:
+            write_element( out_file, "header", header )
+        for tile_index in range( 0, columns * rows ):
+            offset = ( ( tile_index % columns ) * tile_width, ( tile_index // columns ) * tile_height )
+            tile_dict = { key: copy.deepcopy( root_dict.get( key ) ) for key in ( "road", "junction", "controller" ) }
+            remap_tile( tile_dict, tile_index, id_stride, offset )
+            for key in ( "road", "junction", "controller" ):
+                for elem in as_list( tile_dict[ key ] ):
+                    write_element( out_file, key, elem )
+            roads_counter += len( as_list( tile_dict[ "road" ] ) )
+        out_file.write( '</OpenDRIVE>\n' )
+    return roads_counter
+
+
+def remap_tile( tile_dict, tile_index, id_stride, offset ):
+    def remap_id( value ):
+        if value in ( None, "-1" ):
+            return value
+        if value.isdigit():
+            return str( int( value ) + tile_index * id_stride )
+        return f"{value}_{tile_index}"
+
+    for path, attr, kind in TILE_REMAP:
+        for elem in path_elements( tile_dict, path ):
+            value = elem.get( attr )
+            if value is None:
+                continue
+            if kind == "id":
+                elem[ attr ] = remap_id( value )
+            elif kind == "x":
+                elem[ attr ] = format_number( float( value ) + offset[0] )
+            elif kind == "y":
+                elem[ attr ] = format_number( float( value ) + offset[1] )
+            elif kind == "uuid":
+                elem[ attr ] = "{" + str( uuid.uuid5( uuid.NAMESPACE_OID, f"{tile_index}:{value}" ) ) + "}"
+
+
+def write_element( out_file, tag, elem ):
+    content = xmltodict.unparse( { tag: elem }, full_document=False, pretty=True, indent="    " )
+    out_file.write( content )
+    out_file.write( "\n" )
+
+
+## ============================= main section ===================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic OpenDRIVE map')
+    parser.add_argument('-la', '--logall', action='store_true', help='Log all messages' )
+    parser.add_argument('--out', action='store', required=True, help='Path to output XODR file' )
+    parser.add_argument('--roads', action='store', type=int, default=None,
+                        help='Minimal number of roads (overrides grid size)' )
+    parser.add_argument('--columns', action='store', type=int, default=4, help='Number of junctions in row' )
+    parser.add_argument('--rows', action='store', type=int, default=4, help='Number of junctions in column' )
+    parser.add_argument('--mix', nargs=3, type=float, default=[ 0.4, 0.3, 0.3 ],
+                        help='Weights of line, arc and spiral patterns' )
+    parser.add_argument('--patterns', action='store', type=int, default=2, help='Number of patterns in half of road' )
+    parser.add_argument('--sections', action='store', type=int, default=2, help='Number of lane sections of road' )
+    parser.add_argument('--lanes', action='store', type=int, default=2, help='Number of lanes on each side of road' )
+    parser.add_argument('--nosignals', action='store_true', help='Do not generate signals' )
+    parser.add_argument('--nocontrollers', action='store_true', help='Do not generate controllers' )
+    parser.add_argument('--seed', action='store', type=int, default=0, help='Random seed' )
+    parser.add_argument('--tile', action='store', default=None,
+                        help='Instead of generating grid tile given XODR file ("--columns" x "--rows" copies)' )
+
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    if args.logall is True:
+        logging.getLogger().setLevel( logging.DEBUG )
+    else:
+        logging.getLogger().setLevel( logging.ERROR )
+
+    if args.tile:
+        roads_num = tile_map( args.tile, args.out, args.columns, args.rows )
+        print( f"written {roads_num} roads to {args.out}" )
+        return 0
+
+    params = { "geometry_mix": tuple( args.mix ), "patterns": args.patterns, "lane_sections": args.sections,
+               "lanes": args.lanes, "signals": not args.nosignals, "controllers": not args.nocontrollers,
+               "seed": args.seed }
+    if args.roads:
+        config = config_for_roads( args.roads, **params )
+    else:
+        config = GeneratorConfig( columns=args.columns, rows=args.rows, **params )
+    roads_num = generate_map( args.out, config )
+    print( f"written {roads_num} roads to {args.out}" )
+    return 0
+
+
+if __name__ == '__main__':
+    import argparse
+
+    sys.exit( main() )
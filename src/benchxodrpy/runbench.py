@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+try:
+    ## following import success only when file is directly executed from command line
+    ## otherwise will throw exception when executing as parameter for "python -m"
+    # pylint: disable=W0611
+    import __init__
+except ImportError:
+    ## when import fails then it means that the script was executed indirectly
+    ## in this case __init__ is already loaded
+    pass
+
+
+import sys
+import os
+import platform
+import json
+import tempfile
+
+import logging
+import argparse
+
+import numpy
+
+from benchxodrpy import get_default_maps, BASELINE_PATH
+from benchxodrpy.benchmarks import BENCHMARKS, run_benchmarks, run_import_benchmarks, compare_results
+from benchxodrpy.generator import config_for_roads, generate_map
+
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def results_meta():
+    return { "python":   platform.python_version(),
+             "numpy":    numpy.__version__,
+             "platform": platform.platform(),
+             "machine":  platform.machine() }
+
+
+def load_report( report_path ):
+    with open( report_path, "r", encoding="utf-8" ) as report_file:
+        return json.load( report_file )
+
+
+def save_report( report, report_path ):
+    with open( report_path, "w", encoding="utf-8" ) as report_file:
+        json.dump( report, report_file, indent=2 )
+
+
+def generate_maps( roads_list, out_dir ):
+    """Generate synthetic maps with given numbers of roads. Return list of paths."""
+    ret_list = []
+    for roads_num in roads_list:
+        out_path = os.path.join( out_dir, f"generated_{roads_num}.xodr" )
+        generate_map( out_path, config_for_roads( roads_num ) )
+        ret_list.append( out_path )
+    return ret_list
+
+
+def print_results( results_list ):
+    for item in results_list:
+        throughput = item[ "throughput" ]
+        throughput_str = "-" if throughput is None else f"{throughput:.1f} {item['unit']}/s"
+        peak_memory = item[ "peak_memory" ]
+        memory_str = "-" if peak_memory is None else f"{peak_memory / 1024:.1f} KiB"
+        print( f"{item['map']:32} {item['benchmark']:16} {item['time']:10.6f}s  {throughput_str:>24}  {memory_str:>14}" )
+
+
+def print_comparison( compare_list ):
+    for item in compare_list:
+        flag = "REGRESSION" if item[ "regression" ] else ""
+        print( f"{item['map']:32} {item['benchmark']:16} {item['ratio']:6.2f}x  {flag}" )
+
+
+## ============================= main section ===================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark runner')
+    parser.add_argument('-la', '--logall', action='store_true', help='Log all messages' )
+    parser.add_argument('--maps', nargs="+", default=None, help='Maps to benchmark (default: samples and town1)' )
+    parser.add_argument('--generate', nargs="+", type=int, default=None,
+                        help='Benchmark also synthetic maps with given numbers of roads' )
+    parser.add_argument('--bench', nargs="+", default=None, choices=list( BENCHMARKS.keys() ),
+                        help='Benchmarks to run (default: all)' )
+    parser.add_argument('-r', '--repeat', action='store', type=int, default=3, help='Repeat each benchmark given number of times' )
+    parser.add_argument('--imports', action='store_true', help='Measure also import time of package modules' )
+    parser.add_argument('--nomemory', action='store_true', help='Do not measure peak memory' )
+    parser.add_argument('--out', action='store', default=None, help='Path to output JSON report' )
+    parser.add_argument('--baseline', action='store', default=BASELINE_PATH,
+                        help='Path to baseline JSON report to compare with (default: stored reference report)' )
+    parser.add_argument('--nobaseline', action='store_true', help='Do not compare results with baseline' )
+    parser.add_argument('--threshold', action='store', type=float, default=0.2,
+                        help='Allowed relative slowdown against baseline (default: 0.2)' )
+
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    if args.logall is True:
+        logging.getLogger().setLevel( logging.DEBUG )
+    else:
+        logging.getLogger().setLevel( logging.ERROR )
+
+    maps_list = args.maps
+    if not maps_list:
+        maps_list = get_default_maps()
+
+    with tempfile.TemporaryDirectory() as generated_dir:
+        if args.generate:
+            maps_list = maps_list + generate_maps( args.generate, generated_dir )
+        results_list = run_benchmarks( maps_list, args.bench, args.repeat, not args.nomemory )
+    if args.imports:
+        results_list.extend( run_import_benchmarks( repeats=args.repeat ) )
+    print_results( results_list )
+
+    report = { "meta": results_meta(), "results": results_list }
+    if args.out:
+        save_report( report, args.out )
+
+    if args.nobaseline or not args.baseline:
+        return 0
+    if not os.path.isfile( args.baseline ):
+        print( "\nbaseline not found:", args.baseline )
+        return 0
+
+    baseline = load_report( args.baseline )
+    compare_list = compare_results( results_list, baseline[ "results" ], args.threshold )
+    print( "\ncomparison with baseline:", args.baseline )
+    print_comparison( compare_list )
+    regressions = [ item for item in compare_list if item[ "regression" ] ]
+    if regressions:
+        print( f"found {len( regressions )} regression(s)" )
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit( main() )
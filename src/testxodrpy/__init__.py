@@ -32,8 +32,13 @@ SRC_DIR    = os.path.abspath( os.path.join( MODULE_DIR, os.pardir ) )
 sys.path.insert(0, SRC_DIR )
 
 
-DATA_DIR = os.path.join( MODULE_DIR, "data" )
+DATA_DIR    = os.path.join( MODULE_DIR, "data" )
+SAMPLES_DIR = os.path.abspath( os.path.join( SRC_DIR, os.pardir, "exmple", "samples" ) )
 
 
 def get_data_path( file_path ):
     return os.path.join( DATA_DIR, file_path )
+
+
+def get_sample_path( file_path ):
+    return os.path.join( SAMPLES_DIR, file_path )
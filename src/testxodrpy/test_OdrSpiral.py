@@ -24,6 +24,8 @@
 import unittest
 
 from xodrpy.utils import Vector2D
+import numpy as np
+
 from xodrpy.OdrSpiral import OdrSpiral
 
 
@@ -43,3 +45,15 @@ class OdrSpiralTest(unittest.TestCase):
         self.assertAlmostEqual( 0.0, x )
         self.assertAlmostEqual( 0.0, y )
         self.assertAlmostEqual( 0.0, t )
+
+    def test_odrSpiralArray(self):
+        spiral = OdrSpiral()
+        s_values    = [ 0.0, 0.5, 3.0, 10.0, -4.0, 1.0e5 ]
+        cdot_values = [ 0.001, -0.01, 0.2, 0.03, 0.1, 0.2 ]
+        (x, y, t) = spiral.odrSpiralArray( s_values, cdot_values )
+        for i in range( 0, len( s_values ) ):
+            expected = spiral.odrSpiral( s_values[i], cdot_values[i] )
+            self.assertAlmostEqual( expected[0], x[i] )
+            self.assertAlmostEqual( expected[1], y[i] )
+            self.assertAlmostEqual( expected[2], t[i] )
+
@@ -0,0 +1,100 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import sys
+import json
+import subprocess
+import unittest
+from testxodrpy import get_data_path, SRC_DIR
+
+from benchxodrpy import get_default_maps, BASELINE_PATH
+from benchxodrpy.benchmarks import BENCHMARKS, IMPORT_MODULES, run_benchmarks, compare_results, measure_import
+
+
+##
+class BenchmarksTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_run_benchmarks(self):
+        xodr_path = get_data_path( "town1_road1.xodr" )
+        results = run_benchmarks( [ xodr_path ], [ "load", "lineApprox", "Road.position" ], repeats=1 )
+        self.assertEqual( 3, len( results ) )
+        item = results[1]
+        self.assertEqual( "town1_road1.xodr", item[ "map" ] )
+        self.assertEqual( "lineApprox", item[ "benchmark" ] )
+        self.assertGreater( item[ "items" ], 0 )
+        self.assertGreater( item[ "peak_memory" ], 0 )
+
+    def test_compare_results(self):
+        baseline = [ { "map": "a", "benchmark": "load", "time": 1.0 },
+                     { "map": "a", "benchmark": "draw", "time": 1.0 } ]
+        results  = [ { "map": "a", "benchmark": "load", "time": 1.1 },
+                     { "map": "a", "benchmark": "draw", "time": 1.5 },
+                     { "map": "b", "benchmark": "load", "time": 1.5 } ]
+        compare_list = compare_results( results, baseline, threshold=0.2 )
+        self.assertEqual( 2, len( compare_list ) )
+        self.assertFalse( compare_list[0][ "regression" ] )
+        self.assertTrue( compare_list[1][ "regression" ] )
+        self.assertAlmostEqual( 1.5, compare_list[1][ "ratio" ] )
+
+    def test_baseline(self):
+        with open( BASELINE_PATH, "r", encoding="utf-8" ) as report_file:
+            baseline = json.load( report_file )
+        measured = set( ( item[ "map" ], item[ "benchmark" ] ) for item in baseline[ "results" ] )
+        for xodr_path in get_default_maps():
+            for bench_name in BENCHMARKS:
+                self.assertIn( ( os.path.basename( xodr_path ), bench_name ), measured )
+        for module_name in IMPORT_MODULES:
+            self.assertIn( ( "<import>", module_name ), measured )
+
+    def test_measure_import(self):
+        result = measure_import( "xodrpy", repeats=1 )
+        self.assertEqual( "xodrpy", result[ "benchmark" ] )
+        self.assertGreater( result[ "time" ], 0.0 )
+
+
+##
+class LazyImportTest(unittest.TestCase):
+
+    def test_package_attributes(self):
+        code = ( "import sys, xodrpy; assert 'numpy' not in sys.modules; assert 'xmltodict' not in sys.modules; "
+                 "from xodrpy import load; assert 'numpy' in sys.modules; "
+                 "import xodrpy.draw; assert 'svgwrite' not in sys.modules" )
+        subprocess.run( [ sys.executable, "-c", code ], cwd=SRC_DIR, check=True )
+
+    def test_types_accessors(self):
+        code = ( "import sys, xodrpy.types; assert 'xodrpy.lanegraph' not in sys.modules; "
+                 "assert 'xodrpy.maptables' not in sys.modules; assert 'xodrpy.horizon' not in sys.modules" )
+        subprocess.run( [ sys.executable, "-c", code ], cwd=SRC_DIR, check=True )
+
+    def test_unknown_attribute(self):
+        import xodrpy
+        with self.assertRaises( AttributeError ):
+            getattr( xodrpy, "unknown_attribute" )
@@ -0,0 +1,152 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import re
+import tempfile
+from xml.etree import ElementTree
+from testxodrpy import get_data_path
+
+import numpy as np
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy.spatialindex import clip_polyline
+from xodrpy.draw import draw_data, draw_data_stream, draw_files
+
+
+def svg_points( svg_path ):
+    """Return array of all points of polylines of SVG file."""
+    root = ElementTree.parse( svg_path ).getroot()
+    points = []
+    for item in root.iter( "{http://www.w3.org/2000/svg}polyline" ):
+        values = [ float( value ) for value in re.split( r"[ ,]+", item.get( "points" ).strip() ) ]
+        points.extend( np.array( values ).reshape( -1, 2 ).tolist() )
+    return np.array( points ).reshape( -1, 2 )
+
+
+##
+class ClipPolylineTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_clip(self):
+        points = np.array( [ [ -1.0, 0.5 ], [ 0.5, 0.5 ], [ 0.7, 0.7 ], [ 2.0, 0.7 ],
+                             [ 2.0, 2.0 ], [ 0.5, 2.0 ], [ 0.5, 0.2 ] ] )
+        clipped = clip_polyline( points, ( 0.0, 0.0 ), ( 1.0, 1.0 ) )
+        self.assertEqual( 2, len( clipped ) )
+        self.assertTrue( np.allclose( [ [ 0.0, 0.5 ], [ 0.5, 0.5 ], [ 0.7, 0.7 ], [ 1.0, 0.7 ] ], clipped[0] ) )
+        self.assertTrue( np.allclose( [ [ 0.5, 1.0 ], [ 0.5, 0.2 ] ], clipped[1] ) )
+
+        ## inside and outside
+        self.assertEqual( 1, len( clip_polyline( points * 0.1 + 0.5, ( 0.0, 0.0 ), ( 1.0, 1.0 ) ) ) )
+        self.assertEqual( [], clip_polyline( points + 10.0, ( 0.0, 0.0 ), ( 1.0, 1.0 ) ) )
+
+
+##
+class DrawViewportTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_roadsInBox(self):
+        opendrive: OpenDRIVE = load( get_data_path( "town1.xodr" ) )
+        viewport = ( ( 50.0, 50.0 ), ( 150.0, 120.0 ) )
+        found = set( road.id() for road in opendrive.roadsInBox( viewport ) )
+        expected = set()
+        for road in opendrive.roads():
+            points = np.concatenate( road.lineLOD().strips( 0 ) )
+            inside = ( points >= viewport[0] ).all( axis=1 ) & ( points <= viewport[1] ).all( axis=1 )
+            if inside.any():
+                expected.add( road.id() )
+        self.assertTrue( expected.issubset( found ) )
+        self.assertLess( len( found ), opendrive.roadsNumber() )
+
+    def test_draw_viewport(self):
+        opendrive: OpenDRIVE = load( get_data_path( "town1.xodr" ) )
+        viewport = ( ( 50.0, 50.0 ), ( 150.0, 120.0 ) )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            svg_path = os.path.join( temp_dir, "region.svg" )
+            draw_data( opendrive, svg_path, viewport=viewport )
+            root = ElementTree.parse( svg_path ).getroot()
+            self.assertEqual( 100.0, float( root.get( "width" ) ) )
+            self.assertEqual( 70.0, float( root.get( "height" ) ) )
+            points = svg_points( svg_path )
+            self.assertGreater( len( points ), 0 )
+            ## drawn region is moved to origin and clipped
+            self.assertGreaterEqual( points.min(), -1.0e-9 )
+            self.assertLessEqual( points[:, 0].max(), 100.0 + 1.0e-9 )
+            self.assertLessEqual( points[:, 1].max(), 70.0 + 1.0e-9 )
+
+            stream_path = os.path.join( temp_dir, "region_stream.svg" )
+            draw_data_stream( opendrive, stream_path, scale=2.0, viewport=viewport )
+            root = ElementTree.parse( stream_path ).getroot()
+            self.assertEqual( 200.0, float( root.get( "width" ) ) )
+            self.assertGreater( len( root.findall( ".//{http://www.w3.org/2000/svg}path" ) ), 0 )
+            ## streaming does not keep levels of detail in roads
+            for road in opendrive.roads():
+                self.assertIsNone( road._lod )           # pylint: disable=W0212
+
+
+##
+class DrawFilesTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_draw_files(self):
+        input_dir = get_data_path( "" )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_dir   = os.path.join( temp_dir, "out" )
+            cache_dir = os.path.join( temp_dir, "cache" )
+            inputs = [ input_dir, os.path.join( temp_dir, "missing.xodr" ) ]
+            results = draw_files( inputs, out_dir, ".svgz", workers=2, cache_dir=cache_dir )
+
+            input_files = sorted( item for item in os.listdir( input_dir ) if item.endswith( ".xodr" ) )
+            self.assertEqual( len( input_files ) + 1, len( results ) )
+            self.assertEqual( [ os.path.join( input_dir, item ) for item in input_files ],
+                              [ item[ "input" ] for item in results[ :-1 ] ] )
+            for result in results[ :-1 ]:
+                self.assertEqual( None, result[ "error" ] )
+                self.assertTrue( os.path.isfile( result[ "output" ] ) )
+                self.assertGreater( result[ "draw" ], 0.0 )
+            self.assertNotEqual( None, results[-1][ "error" ] )
+            self.assertEqual( len( input_files ), len( os.listdir( cache_dir ) ) )
+
+            ## second run uses snapshots
+            results = draw_files( [ input_dir ], out_dir, ".svgz", workers=1, cache_dir=cache_dir )
+            self.assertEqual( [ None ] * len( input_files ), [ item[ "error" ] for item in results ] )
@@ -0,0 +1,116 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import tempfile
+from testxodrpy import get_data_path
+
+from xodrpy.xodr import load
+from benchxodrpy.generator import GeneratorConfig, generate_map, count_roads, config_for_roads, tile_map
+
+
+##
+class GeneratorTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_generate_map(self):
+        config = GeneratorConfig( columns=3, rows=2, lane_sections=3 )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_path = os.path.join( temp_dir, "generated.xodr" )
+            roads_num = generate_map( out_path, config )
+            self.assertEqual( count_roads( config ), roads_num )
+
+            opendrive = load( out_path )
+            self.assertEqual( roads_num, opendrive.roadsNumber() )
+            self.assertEqual( 6, len( opendrive.junctions() ) )
+            self.assertEqual( 6, len( opendrive.controllers() ) )
+            self.assertEqual( 14, len( opendrive.signalIDList() ) )
+            self.assertEqual( 3, len( opendrive.roads()[0].laneSections() ) )
+
+            ## connecting roads touch ends of linked roads
+            roads_dict = { road.id(): road for road in opendrive.roads() }
+            for road in opendrive.roads():
+                if road.junctionId() == "-1":
+                    continue
+                _, prev_id, prev_contact = road.predecessorData()
+                prev_road = roads_dict[ prev_id ]
+                prev_s = 0.0 if prev_contact == "start" else prev_road.length()
+                start = road.position( 0.0, 0.0, 0.0 )
+                prev_end = prev_road.position( prev_s, 0.0, 0.0 )
+                self.assertAlmostEqual( start.x, prev_end.x, 6 )
+                self.assertAlmostEqual( start.y, prev_end.y, 6 )
+
+    def test_route_across_junction(self):
+        config = GeneratorConfig( columns=3, rows=3 )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_path = os.path.join( temp_dir, "generated.xodr" )
+            generate_map( out_path, config )
+            opendrive = load( out_path )
+
+        graph = opendrive.laneGraph()
+        for node_index in range( 0, graph.nodesNumber() ):
+            self.assertTrue( graph.successors( node_index ), f"dead end lane: {graph.node( node_index )}" )
+
+        roads_dict = { road.id(): road for road in opendrive.roads() }
+        source = graph.nodeIndex( "1", 0, -1 )
+        last_road = [ road for road in opendrive.roads() if road.junctionId() == "-1" ][-1]
+        target = graph.nodeIndex( last_road.id(), 0, -1 )
+        found = graph.shortestPath( source, target )
+        self.assertIsNotNone( found )
+        route_roads = [ graph.node( item )[0] for item in found[1] ]
+        junction_roads = [ road_id for road_id in route_roads if roads_dict[ road_id ].junctionId() != "-1" ]
+        self.assertGreater( len( junction_roads ), 0 )
+
+    def test_generate_deterministic(self):
+        config = GeneratorConfig( columns=2, rows=2, seed=7 )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path1 = os.path.join( temp_dir, "map1.xodr" )
+            path2 = os.path.join( temp_dir, "map2.xodr" )
+            generate_map( path1, config )
+            generate_map( path2, config )
+            with open( path1, 'r', encoding="utf-8" ) as file1, open( path2, 'r', encoding="utf-8" ) as file2:
+                self.assertEqual( file1.read(), file2.read() )
+
+    def test_config_for_roads(self):
+        config = config_for_roads( 100 )
+        self.assertGreaterEqual( count_roads( config ), 100 )
+        self.assertEqual( config.columns, config.rows )
+
+    def test_tile_map(self):
+        source_path = get_data_path( "signalization.xodr" )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            out_path = os.path.join( temp_dir, "tiled.xodr" )
+            tile_map( source_path, out_path, columns=2, rows=1 )
+            source = load( source_path )
+            opendrive = load( out_path )
+            self.assertEqual( 2 * source.roadsNumber(), opendrive.roadsNumber() )
+            self.assertEqual( 2 * len( source.signalIDList() ), len( opendrive.signalIDList() ) )
+            self.assertEqual( 2 * len( source.signalUUIDList() ), len( opendrive.signalUUIDList() ) )
+            self.assertEqual( 2 * len( source.junctions() ), len( opendrive.junctions() ) )
@@ -0,0 +1,86 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_data_path
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy.lanegraph import LaneGraph
+
+
+##
+class LaneGraphTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_build_simple(self):
+        ## 0 -> 1 -> 2, 0 -> 2
+        graph = LaneGraph( [ ("0", 0, -1), ("1", 0, -1), ("2", 0, -1) ],
+                           [ 10.0, 5.0, 1.0 ],
+                           [ (0.0, 0.0), (10.0, 0.0), (15.0, 0.0) ],
+                           [ 0, 2, 3, 3 ],
+                           [ 1, 2, 2 ] )
+        self.assertEqual( 3, graph.nodesNumber() )
+        self.assertEqual( 3, graph.edgesNumber() )
+        self.assertEqual( [1, 2], graph.successors( 0 ) )
+        self.assertEqual( 1, graph.nodeIndex( "1", 0, -1 ) )
+        self.assertEqual( -1, graph.nodeIndex( "1", 0, 1 ) )
+        self.assertEqual( [10.0, 10.0, 5.0], graph.weights.tolist() )
+
+        route = graph.shortestPath( 0, 2 )
+        self.assertEqual( (11.0, [0, 2]), route )
+
+        routes = graph.kShortestPaths( 0, 2, 5 )
+        self.assertEqual( [ (11.0, [0, 2]), (16.0, [0, 1, 2]) ], routes )
+
+        self.assertEqual( None, graph.shortestPath( 2, 0 ) )
+
+    def test_laneGraph_town1(self):
+        input_path = get_data_path( "town1.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        graph = opendrive.laneGraph()
+        self.assertIs( graph, opendrive.laneGraph() )
+        self.assertEqual( 124, graph.nodesNumber() )
+        self.assertEqual( 158, graph.edgesNumber() )
+
+        source = graph.nodeIndex( "0", 0, 1 )
+        target = graph.nodeIndex( "25", 0, 1 )
+        astar    = graph.shortestPath( source, target )
+        dijkstra = graph.shortestPath( source, target, heuristic=False )
+        self.assertAlmostEqual( dijkstra[0], astar[0] )
+        self.assertEqual( ("22", 0, -1), graph.node( astar[1][1] ) )
+
+        routes = graph.kShortestPaths( source, target, 3 )
+        self.assertEqual( 3, len( routes ) )
+        self.assertEqual( astar[1], routes[0][1] )
+        lengths = [ item[0] for item in routes ]
+        self.assertEqual( sorted( lengths ), lengths )
+
+        opendrive.invalidateCache()
+        self.assertIsNot( graph, opendrive.laneGraph() )
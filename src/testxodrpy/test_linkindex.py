@@ -0,0 +1,106 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import shutil
+import tempfile
+from testxodrpy import get_data_path
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy import rrdata
+from xodrpy.linkindex import build_link_index, load_link_index, cached_link_index
+
+
+##
+class LinkIndexTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_build(self):
+        opendrive: OpenDRIVE = load( get_data_path( "signalization.xodr" ) )
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        index = build_link_index( opendrive, metadata )
+
+        self.assertEqual( "11", index.signalId( "{00000000-0000-0000-0000-000000000011}" ) )
+        self.assertEqual( "{00000000-0000-0000-0000-000000000020}", index.signalUUID( "20" ) )
+        self.assertEqual( None, index.signalId( "unknown" ) )
+
+        self.assertEqual( "200", index.junctionId( "{00000000-0000-0000-0000-000000000902}" ) )
+        self.assertEqual( [ "{00000000-0000-0000-0000-000000000901}", "{00000000-0000-0000-0000-000000000903}" ],
+                          index.junctionUUIDs( "100" ) )
+
+        self.assertEqual( ( "2", "20", 1 ), index.gateReference( "{00000000-0000-0000-0000-0000000000b0}" ) )
+        self.assertEqual( [ "{00000000-0000-0000-0000-0000000000a0}" ], index.gateUUIDs( "1", "10" ) )
+        reference = index.signalReference( opendrive, "{00000000-0000-0000-0000-0000000000b0}" )
+        self.assertEqual( "{00000000-0000-0000-0000-0000000000b0}", reference.gateUUID() )
+
+        ## phases resolved by index are the same as matched ones
+        self.assertEqual( metadata.getPhasesDict( opendrive ), metadata.getPhasesDict( link_index=index ) )
+
+    def test_cached(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            xodr_path   = os.path.join( temp_dir, "signalization.xodr" )
+            rrdata_path = os.path.join( temp_dir, "signalization.rrdata" )
+            shutil.copyfile( get_data_path( "signalization.xodr" ), xodr_path )
+            shutil.copyfile( get_data_path( "signalization.rrdata" ), rrdata_path )
+            index_path  = os.path.join( temp_dir, "links.json" )
+
+            index = cached_link_index( xodr_path, rrdata_path, index_path )
+            self.assertTrue( os.path.isfile( index_path ) )
+            loaded = load_link_index( index_path, xodr_path, rrdata_path )
+            self.assertEqual( index.toDict(), loaded.toDict() )
+            self.assertEqual( index.reference_gates, loaded.reference_gates )
+
+            ## content change invalidates index
+            with open( rrdata_path, 'a', encoding="utf-8" ) as rrdata_file:
+                rrdata_file.write( "\n" )
+            self.assertEqual( None, load_link_index( index_path, xodr_path, rrdata_path ) )
+            rebuilt = cached_link_index( xodr_path, rrdata_path, index_path )
+            self.assertNotEqual( index.rrdata_hash, rebuilt.rrdata_hash )
+            self.assertEqual( index.junction_ids, rebuilt.junction_ids )
+
+    def test_cached_dir(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir  = os.path.join( temp_dir, "data" )
+            cache_dir = os.path.join( temp_dir, "cache" )
+            os.makedirs( data_dir )
+            xodr_path   = os.path.join( data_dir, "signalization.xodr" )
+            rrdata_path = os.path.join( data_dir, "signalization.rrdata" )
+            shutil.copyfile( get_data_path( "signalization.xodr" ), xodr_path )
+            shutil.copyfile( get_data_path( "signalization.rrdata" ), rrdata_path )
+
+            ## without cache directory nothing is written next to input files
+            index = cached_link_index( xodr_path, rrdata_path )
+            self.assertEqual( [ "signalization.rrdata", "signalization.xodr" ], sorted( os.listdir( data_dir ) ) )
+
+            cached = cached_link_index( xodr_path, rrdata_path, cache_dir=cache_dir )
+            self.assertEqual( [ "signalization.rrdata", "signalization.xodr" ], sorted( os.listdir( data_dir ) ) )
+            self.assertEqual( 1, len( os.listdir( cache_dir ) ) )
+            self.assertEqual( index.toDict(), cached.toDict() )
@@ -0,0 +1,55 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_data_path
+
+from xodrpy.xodr import load
+from xodrpy.loadstats import load_with_stats
+
+
+##
+class LoadStatsTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_load_with_stats(self):
+        xodr_path = get_data_path( "town1_road1.xodr" )
+        opendrive, stats = load_with_stats( xodr_path )
+        expected = load( xodr_path )
+        self.assertEqual( expected.roadsNumber(), opendrive.roadsNumber() )
+        self.assertEqual( len( expected.roads()[0].geometries() ), len( opendrive.roads()[0].geometries() ) )
+
+        self.assertEqual( [ "read", "parse", "convert" ], list( stats.stages.keys() ) )
+        self.assertEqual( stats.nodesNumber(), stats.lookup_calls )
+        self.assertEqual( 1, stats.node_counts[ "OpenDRIVE/road" ] )
+        self.assertEqual( 1, stats.converter_calls[ "convert_to_Road" ] )
+        self.assertEqual( 1, stats.converter_calls[ "convert_to_OpenDRIVE" ] )
+        self.assertEqual( 4, stats.converter_calls[ "LineGeometry" ] )
+        self.assertIn( "convert_to_Road", stats.report() )
+        self.assertIn( "node_counts", stats.toDict() )
@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_sample_path
+
+import numpy as np
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy.lod import simplify_polyline, segment_distances, select_level, road_strips_by_scale, LOD_TOLERANCES
+
+
+##
+class LODTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_simplify_polyline(self):
+        points = np.array( [ [ 0.0, 0.0 ], [ 1.0, 0.05 ], [ 2.0, 0.0 ], [ 3.0, 1.0 ], [ 4.0, 0.0 ] ] )
+        self.assertEqual( [ 0, 1, 2, 3, 4 ], simplify_polyline( points, 0.01 ).tolist() )
+        self.assertEqual( [ 0, 2, 3, 4 ], simplify_polyline( points, 0.1 ).tolist() )
+        self.assertEqual( [ 0, 4 ], simplify_polyline( points, 2.0 ).tolist() )
+        self.assertEqual( [ 0, 1 ], simplify_polyline( points[:2], 2.0 ).tolist() )
+
+    def test_select_level(self):
+        self.assertEqual( 0, select_level( LOD_TOLERANCES, None ) )
+        self.assertEqual( 0, select_level( LOD_TOLERANCES, 1000.0 ) )
+        self.assertEqual( len( LOD_TOLERANCES ) - 1, select_level( LOD_TOLERANCES, 0.001 ) )
+        level = select_level( LOD_TOLERANCES, 1.0 )
+        self.assertLessEqual( LOD_TOLERANCES[ level ], 0.5 )
+        self.assertGreater( LOD_TOLERANCES[ level + 1 ], 0.5 )
+
+    def test_road_lod(self):
+        opendrive: OpenDRIVE = load( get_sample_path( "CrossingComplex8Course.xodr" ) )
+        road = opendrive.roads()[0]
+        lod = road.lineLOD()
+        self.assertIs( lod, road.lineLOD() )
+        self.assertEqual( len( LOD_TOLERANCES ), lod.levelsNumber() )
+
+        points_num = [ lod.pointsNumber( level ) for level in range( lod.levelsNumber() ) ]
+        self.assertEqual( sorted( points_num, reverse=True ), points_num )
+        self.assertGreater( points_num[0], points_num[-1] )
+
+        ## simplified lines stay within tolerance of base approximation
+        base = np.concatenate( lod.strips( 0 ) )
+        for level in range( 1, lod.levelsNumber() ):
+            for strip in lod.strips( level ):
+                distances = np.array( [ min( segment_distances( point[ None, : ], strip[i], strip[i + 1] )[0]
+                                             for i in range( len( strip ) - 1 ) ) for point in base ] )
+                self.assertLessEqual( distances.max(), LOD_TOLERANCES[ level ] + 1.0e-9 )
+
+        opendrive.invalidateCache()
+        self.assertIsNot( lod, road.lineLOD() )
+
+    def test_road_strips_by_scale(self):
+        opendrive: OpenDRIVE = load( get_sample_path( "CrossingComplex8Course.xodr" ) )
+        road = opendrive.roads()[0]
+        for scale in ( None, 1.0, 0.001 ):
+            strips = road_strips_by_scale( road, scale )
+            self.assertIsNone( road._lod )           # pylint: disable=W0212
+            expected = road.lineLOD().stripsByScale( scale )
+            self.assertEqual( len( expected ), len( strips ) )
+            for strip, expected_strip in zip( strips, expected ):
+                self.assertTrue( np.array_equal( expected_strip, strip ) )
+            opendrive.invalidateCache()
@@ -0,0 +1,72 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_data_path
+
+from xodrpy.xodr import load
+from xodrpy.mapscan import scan
+
+
+##
+class ScanTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_scan(self):
+        xodr_path = get_data_path( "town1.xodr" )
+        summary   = scan( xodr_path )
+        opendrive = load( xodr_path )
+        self.assertEqual( opendrive.getStandardVesion(), summary.getStandardVesion() )
+        self.assertEqual( opendrive.getDataVesion(), summary.getDataVesion() )
+        self.assertEqual( opendrive.roadsNumber(), summary.roadsNumber() )
+        self.assertEqual( len( opendrive.junctions() ), summary.junctionsNumber() )
+        self.assertEqual( 291, summary.count( "geometry" ) )
+        self.assertNotIn( "OpenDRIVE", summary.counts )
+        roads_length = sum( road.length() for road in opendrive.roads() )
+        self.assertAlmostEqual( roads_length, summary.roads_length, 6 )
+
+        min_pos, max_pos = summary.boundingBox()
+        bbox = opendrive.boundingBox()
+        self.assertGreaterEqual( min_pos[0], bbox[0][0] )
+        self.assertGreaterEqual( min_pos[1], bbox[0][1] )
+        self.assertLessEqual( max_pos[0], bbox[1][0] )
+        self.assertLessEqual( max_pos[1], bbox[1][1] )
+
+    def test_scan_signals(self):
+        summary = scan( get_data_path( "signalization.xodr" ) )
+        self.assertEqual( "1.4", summary.getStandardVesion() )
+        self.assertEqual( 4, summary.count( "signal" ) )
+        self.assertEqual( 2, summary.junctionsNumber() )
+        self.assertEqual( "signalization", summary.toDict()[ "header" ][ "name" ] )
+
+        ## controllers referenced by junctions are not top level controllers
+        opendrive = load( get_data_path( "signalization.xodr" ) )
+        self.assertEqual( len( opendrive.controllers() ), summary.count( "controller" ) )
+        self.assertEqual( 2, summary.count( "junction/controller" ) )
+        self.assertEqual( 1, summary.count( "header" ) )
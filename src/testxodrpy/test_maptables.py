@@ -0,0 +1,155 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_data_path, get_sample_path
+
+import numpy as np
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy.maptables import MapTables, GEOM_SPIRAL
+
+
+##
+class MapTablesTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_positions(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        tables: MapTables = opendrive.mapTables()
+        self.assertIs( tables, opendrive.mapTables() )
+        self.assertEqual( opendrive.roadsNumber(), tables.roadsNumber() )
+        self.assertTrue( np.any( tables.geom_type == GEOM_SPIRAL ) )
+
+        for road in opendrive.roads():
+            s_coords = np.linspace( 0.0, road.length(), 7 )
+            t_coords = np.linspace( -3.0, 3.0, 7 )
+            z_coords = np.linspace( 0.0, 1.0, 7 )
+            road_indexes = tables.roadIndexes( [ road.id() ] * 7 )
+            positions, headings = tables.positions( road_indexes, s_coords, t_coords, z_coords )
+            for i in range( 0, 7 ):
+                expected = road.position( s_coords[i], t_coords[i], z_coords[i] )
+                self.assertAlmostEqual( expected.x, positions[i][0], places=6 )
+                self.assertAlmostEqual( expected.y, positions[i][1], places=6 )
+                self.assertAlmostEqual( expected.z, positions[i][2], places=6 )
+                self.assertAlmostEqual( road.heading( s_coords[i] ), headings[i], places=6 )
+
+    def test_positions_unknown_road(self):
+        input_path = get_data_path( "town1_road1_simple.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        tables: MapTables = opendrive.mapTables()
+        road_indexes = tables.roadIndexes( [ "0", "unknown" ] )
+        self.assertEqual( [0, -1], road_indexes.tolist() )
+        positions, _ = tables.positions( road_indexes, [ 5.0, 5.0 ], [ 2.0, 2.0 ], [ 1.0, 1.0 ] )
+        self.assertEqual( [15.0, 12.0, 1.0], positions[0].tolist() )
+        self.assertTrue( np.all( np.isnan( positions[1] ) ) )
+
+    def test_project(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        tables: MapTables = opendrive.mapTables()
+        points_num   = 7 * tables.roadsNumber()
+        road_indexes = np.repeat( np.arange( tables.roadsNumber() ), 7 )
+        s_coords = np.tile( np.linspace( 0.0, 1.0, 7 ), tables.roadsNumber() ) * tables.road_length[ road_indexes ]
+        t_coords = np.tile( np.linspace( -3.0, 3.0, 7 ), tables.roadsNumber() )
+        positions, _ = tables.positions( road_indexes, s_coords, t_coords )
+        proj_s, proj_t = tables.project( road_indexes, positions[:, 0], positions[:, 1] )
+        self.assertEqual( ( points_num, ), proj_s.shape )
+        np.testing.assert_allclose( s_coords, proj_s, atol=1.0e-6 )
+        np.testing.assert_allclose( t_coords, proj_t, atol=1.0e-6 )
+
+        ## point beyond start of road is clamped, unknown road gives NaN
+        start, headings = tables.positions( [ 0 ], [ 0.0 ], [ 0.0 ] )
+        before_x = start[0][0] - 5.0 * np.cos( headings[0] )
+        before_y = start[0][1] - 5.0 * np.sin( headings[0] )
+        proj_s, proj_t = tables.project( [ 0, -1 ], [ before_x, 0.0 ], [ before_y, 0.0 ] )
+        self.assertAlmostEqual( 0.0, proj_s[0] )
+        self.assertAlmostEqual( 0.0, proj_t[0] )
+        self.assertTrue( np.isnan( proj_s[1] ) )
+        self.assertTrue( np.isnan( proj_t[1] ) )
+
+    def test_signalPoses(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        positions, headings = opendrive.signalPoses()
+        signals = opendrive.signalsView()
+        self.assertEqual( ( len( signals ), 3 ), positions.shape )
+        for i, sig in enumerate( signals ):
+            expected = sig.position()
+            self.assertAlmostEqual( expected.x, positions[i][0], places=6 )
+            self.assertAlmostEqual( expected.y, positions[i][1], places=6 )
+            self.assertAlmostEqual( expected.z, positions[i][2], places=6 )
+            self.assertAlmostEqual( sig.heading(), headings[i], places=6 )
+
+        positions, headings = opendrive.signalReferencePoses()
+        for i, sig in enumerate( opendrive.signalReferencesView() ):
+            expected = sig.position()
+            self.assertAlmostEqual( expected.x, positions[i][0], places=6 )
+            self.assertAlmostEqual( expected.y, positions[i][1], places=6 )
+            self.assertAlmostEqual( sig.heading(), headings[i], places=6 )
+
+        positions, headings = opendrive.objectPoses()
+        self.assertEqual( ( 0, 3 ), positions.shape )
+
+    def test_objectPoses(self):
+        ## objects placed along straight road and arc
+        opendrive: OpenDRIVE = load( get_data_path( "objects.xodr" ) )
+        objects = opendrive.objectsView()
+        self.assertEqual( [ "1", "2", "3", "4" ], [ obj.id() for obj in objects ] )
+        positions, headings = opendrive.objectPoses()
+        self.assertEqual( ( 4, 3 ), positions.shape )
+        self.assertEqual( ( 4, ), headings.shape )
+        for i, obj in enumerate( objects ):
+            road = opendrive.roadById( opendrive.mapIndex().object_roads[i] )
+            s_coord = float( obj.attr("s") )
+            expected = road.position( s_coord, float( obj.attr("t") ), obj.zOffset() )
+            self.assertAlmostEqual( expected.x, positions[i][0], places=6 )
+            self.assertAlmostEqual( expected.y, positions[i][1], places=6 )
+            self.assertAlmostEqual( expected.z, positions[i][2], places=6 )
+            self.assertAlmostEqual( road.heading( s_coord ) + obj.headingRaw(), headings[i], places=6 )
+            self.assertAlmostEqual( obj.heading(), headings[i], places=6 )
+
+        ## object on arc: heading of road grows with curvature
+        self.assertAlmostEqual( 0.5 + 0.01 * 30.0 + 1.0, headings[2], places=6 )
+        self.assertAlmostEqual( 0.5 + 0.01 * 80.0 - 0.5, headings[3], places=6 )
+
+    def test_geometryBounds(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        min_pos, max_pos = opendrive.mapTables().geometryBounds()
+        geom_index = 0
+        for road in opendrive.roads():
+            for geom in road.geometries():
+                points = np.array( [ ( point.x, point.y ) for point in geom.lineApprox( 0.05 ) ] )
+                self.assertTrue( ( points.min( axis=0 ) >= min_pos[ geom_index ] - 1.0e-9 ).all() )
+                self.assertTrue( ( points.max( axis=0 ) <= max_pos[ geom_index ] + 1.0e-9 ).all() )
+                geom_index += 1
+        self.assertEqual( geom_index, len( min_pos ) )
@@ -0,0 +1,128 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import time
+from testxodrpy import get_data_path
+
+from xodrpy.xodr import load
+from xodrpy.types import Road, OpenDRIVE
+from xodrpy.queryprofile import QueryProfiler, profile_queries
+
+
+##
+class QueryProfilerTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_profile_queries(self):
+        opendrive = load( get_data_path( "town1_road1.xodr" ) )
+        road = opendrive.roads()[0]
+        original = Road.position
+        expected = road.position( 10.0, 1.0, 0.0 )
+
+        with profile_queries() as profiler:
+            self.assertTrue( profiler.isEnabled() )
+            self.assertIsNot( original, Road.position )
+            position = road.position( 10.0, 1.0, 0.0 )
+            road.position( 20.0, 1.0, 0.0 )
+            opendrive.signalByUUID( "unknown" )
+
+        self.assertFalse( profiler.isEnabled() )
+        self.assertIs( original, Road.position )
+        self.assertEqual( expected, position )
+
+        report = profiler.toDict()
+        self.assertEqual( 2, report[ "Road.position" ][0] )
+        self.assertEqual( 1, report[ "OpenDRIVE.signalByUUID" ][0] )
+        self.assertGreater( report[ "Road.position" ][1], 0.0 )
+        self.assertIn( "Road.position", profiler.report() )
+
+        ## disabled profiler does not count
+        road.position( 10.0, 1.0, 0.0 )
+        self.assertEqual( 2, profiler.calls[ "Road.position" ] )
+
+    def test_classes(self):
+        profiler = QueryProfiler()
+        with profile_queries( [ OpenDRIVE ], profiler ):
+            opendrive = load( get_data_path( "town1_road1.xodr" ) )
+            opendrive.roads()[0].position( 10.0, 1.0, 0.0 )
+        self.assertNotIn( "Road.position", profiler.calls )
+        self.assertIn( "OpenDRIVE.roads", profiler.calls )
+
+    def test_reset_enabled(self):
+        opendrive = load( get_data_path( "town1_road1.xodr" ) )
+        road = opendrive.roads()[0]
+        with profile_queries( [ Road ] ) as profiler:
+            road.position( 10.0, 1.0, 0.0 )
+            profiler.reset()
+            self.assertEqual( {}, profiler.toDict() )
+            road.position( 10.0, 1.0, 0.0 )
+        self.assertEqual( 1, profiler.toDict()[ "Road.position" ][0] )
+
+    def test_single_enabled(self):
+        original = Road.position
+        with profile_queries( [ Road ] ):
+            other = QueryProfiler()
+            self.assertRaises( RuntimeError, other.enable, [ Road ] )
+            self.assertFalse( other.isEnabled() )
+        self.assertIs( original, Road.position )
+
+        ## profiler can be enabled after previous one is disabled
+        with profile_queries( [ Road ] ) as profiler:
+            self.assertTrue( profiler.isEnabled() )
+        self.assertIs( original, Road.position )
+
+    def test_enable_no_methods(self):
+        profiler = QueryProfiler()
+        profiler.enable( [] )
+        try:
+            self.assertTrue( profiler.isEnabled() )
+            ## enabling again is no-op
+            profiler.enable( [] )
+            self.assertRaises( RuntimeError, QueryProfiler().enable, [] )
+        finally:
+            profiler.disable()
+        self.assertFalse( profiler.isEnabled() )
+
+    def test_generator_methods(self):
+        opendrive = load( get_data_path( "signalization.xodr" ) )
+        expected = list( opendrive.iterSignals() )
+        with profile_queries( [ OpenDRIVE ] ) as profiler:
+            signals = []
+            for sig in opendrive.iterSignals():
+                ## time of consumer is not counted
+                time.sleep( 0.02 )
+                signals.append( sig )
+        self.assertEqual( expected, signals )
+        calls, total_time = profiler.toDict()[ "OpenDRIVE.iterSignals" ]
+        self.assertEqual( 1, calls )
+        self.assertGreater( total_time, 0.0 )
+        self.assertLess( total_time, 0.02 )
+        ## steps of iteration include nested query
+        self.assertIn( "OpenDRIVE.mapIndex", profiler.calls )
@@ -0,0 +1,118 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import shutil
+import tempfile
+from testxodrpy import get_data_path
+
+from xodrpy.xodr import load
+from xodrpy.registry import MapRegistry, estimate_memory
+
+
+##
+class MapRegistryTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.temp_dir = tempfile.mkdtemp()
+        self.loaded = []
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        shutil.rmtree( self.temp_dir, ignore_errors=True )
+
+    def counting_loader(self, xodr_path ):
+        self.loaded.append( os.path.basename( xodr_path ) )
+        return load( xodr_path )
+
+    def copy_data(self, file_name ):
+        target = os.path.join( self.temp_dir, file_name )
+        shutil.copyfile( get_data_path( file_name ), target )
+        return target
+
+    def test_estimate_memory(self):
+        small = load( get_data_path( "town1_road1.xodr" ) )
+        large = load( get_data_path( "town1.xodr" ) )
+        small_size = estimate_memory( small )
+        self.assertGreater( small_size, 0 )
+        self.assertGreater( estimate_memory( large ), 10 * small_size )
+        ## shared objects counted once
+        self.assertLess( estimate_memory( [ small, small ] ), small_size + 100 )
+
+    def test_cache_hit(self):
+        xodr_path = self.copy_data( "town1_road1.xodr" )
+        registry = MapRegistry( cache_dir=self.temp_dir, loader=self.counting_loader )
+        opendrive = registry.get( xodr_path )
+        self.assertIs( opendrive, registry.get( xodr_path ) )
+        self.assertEqual( 1, registry.hits )
+        self.assertEqual( 1, registry.misses )
+        self.assertEqual( [ "town1_road1.xodr" ], self.loaded )
+        self.assertGreater( registry.memoryUsage(), 0 )
+
+    def test_snapshots(self):
+        xodr_path = self.copy_data( "town1_road1.xodr" )
+        ## without cache directory nothing is written next to map
+        registry = MapRegistry( loader=self.counting_loader )
+        self.assertFalse( registry.snapshots )
+        registry.get( xodr_path )
+        self.assertEqual( [ "town1_road1.xodr" ], os.listdir( self.temp_dir ) )
+
+        cache_dir = os.path.join( self.temp_dir, "cache" )
+        registry = MapRegistry( cache_dir=cache_dir, loader=self.counting_loader )
+        self.assertTrue( registry.snapshots )
+        registry.get( xodr_path )
+        self.assertEqual( [ "town1_road1.xodr" ], [ item for item in os.listdir( self.temp_dir ) if item != "cache" ] )
+        self.assertGreater( len( os.listdir( cache_dir ) ), 0 )
+
+    def test_evict(self):
+        small_path = self.copy_data( "town1_road1.xodr" )
+        large_path = self.copy_data( "town1.xodr" )
+        small_size = estimate_memory( load( small_path ) )
+        registry = MapRegistry( memory_budget=small_size * 2, cache_dir=self.temp_dir, loader=self.counting_loader )
+
+        registry.get( small_path )
+        registry.get( large_path )
+        ## small map evicted, large kept although exceeds budget
+        self.assertEqual( 1, registry.mapsNumber() )
+        self.assertFalse( registry.contains( small_path ) )
+        self.assertTrue( registry.contains( large_path ) )
+        self.assertEqual( 1, registry.evictions )
+
+        ## reloaded from snapshot
+        opendrive = registry.get( small_path )
+        self.assertEqual( 1, opendrive.roadsNumber() )
+        self.assertEqual( [ "town1_road1.xodr", "town1.xodr" ], self.loaded )
+        self.assertFalse( registry.contains( large_path ) )
+
+    def test_modified_file(self):
+        xodr_path = self.copy_data( "town1_road1.xodr" )
+        registry = MapRegistry( cache_dir=self.temp_dir, loader=self.counting_loader )
+        registry.get( xodr_path )
+        shutil.copyfile( get_data_path( "signalization.xodr" ), xodr_path )
+        stat = os.stat( xodr_path )
+        os.utime( xodr_path, ns=( stat.st_atime_ns, stat.st_mtime_ns + 1000000000 ) )
+        opendrive = registry.get( xodr_path )
+        self.assertEqual( 2, registry.misses )
+        self.assertEqual( 1, registry.mapsNumber() )
+        self.assertEqual( 2, len( opendrive.junctions() ) )
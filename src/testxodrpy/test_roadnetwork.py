@@ -0,0 +1,81 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_data_path
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy.roadnetwork import JunctionPath
+
+
+##
+class RoadNetworkTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_roadNetwork_town1(self):
+        input_path = get_data_path( "town1.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        network = opendrive.roadNetwork()
+        self.assertIs( network, opendrive.roadNetwork() )
+        self.assertEqual( opendrive.roadsNumber(), network.roadsNumber() )
+
+        self.assertEqual( ( "22", ), network.neighbours( "0" ) )
+        self.assertEqual( [ ( "start", "22", "start", None ) ], network.links( "0" ) )
+        self.assertEqual( (), network.neighbours( "unknown" ) )
+
+        ## links are symmetrical
+        for road_from, road_to in network.edgesList():
+            self.assertIn( road_from, network.neighbours( road_to ) )
+
+    def test_junctionPaths(self):
+        input_path = get_data_path( "town1.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        network = opendrive.roadNetwork()
+
+        junc = opendrive.junctions()[0]
+        paths = network.junctionPaths( junc.id() )
+        self.assertEqual( len( junc.connectionsList() ), len( paths ) )
+
+        path: JunctionPath = paths[0]
+        self.assertIn( path, network.pathsFromRoad( path.incoming_id ) )
+        self.assertIn( path.connecting_id, network.connectingRoads( path.incoming_id ) )
+        self.assertIn( path.connecting_id, network.neighbours( path.incoming_id ) )
+
+    def test_adjacencyCSR(self):
+        input_path = get_data_path( "town1.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        network = opendrive.roadNetwork()
+
+        road_ids, indptr, indices = network.adjacencyCSR()
+        self.assertEqual( len( road_ids ) + 1, len( indptr ) )
+        self.assertEqual( len( network.edgesList() ), len( indices ) )
+        adjacency = network.adjacencyDict()
+        first_neighbours = [ road_ids[ item ] for item in indices[ indptr[0]:indptr[1] ] ]
+        self.assertEqual( adjacency[ road_ids[0] ], first_neighbours )
@@ -0,0 +1,124 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import copy
+import os
+import tempfile
+from testxodrpy import get_data_path
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy import rrdata
+
+
+##
+class RRMetadataTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_getConfigurationDict(self):
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        config_dict = metadata.getConfigurationDict()
+        self.assertEqual( 2, len( config_dict ) )
+        light_cfg = config_dict[ "{00000000-0000-0000-0000-00000000000a}" ]
+        self.assertEqual( "TrafficLight", light_cfg["type"] )
+        self.assertEqual( [ "Red", "Yellow", "Green" ], light_cfg["cfg"] )
+
+    def test_getPhasesDict_noxodr(self):
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        phases = metadata.getPhasesDict()
+        self.assertEqual( 3, len( phases ) )
+        self.assertEqual( [ None, None, None ], [ item["id"] for item in phases ] )
+
+        first_phases = phases[0]["phases"]
+        self.assertEqual( [ "10", "3", "12" ], [ item["duration"] for item in first_phases ] )
+        self.assertEqual( [ "Green", "Red" ], [ item["state"] for item in first_phases[0]["signals"] ] )
+        self.assertEqual( "Walk", first_phases[2]["signals"][1]["state"] )
+        self.assertEqual( "Pedestrian", first_phases[2]["signals"][1]["type"] )
+
+    def test_getPhasesDict_junctions(self):
+        opendrive: OpenDRIVE = load( get_data_path( "signalization.xodr" ) )
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        phases = metadata.getPhasesDict( opendrive )
+
+        self.assertEqual( [ "{00000000-0000-0000-0000-000000000901}",
+                            "{00000000-0000-0000-0000-000000000902}",
+                            "{00000000-0000-0000-0000-000000000903}" ], [ item["uuid"] for item in phases ] )
+        ## first two junctions match fully, third one partially matches both junctions
+        self.assertEqual( [ "100", "200", "100" ], [ item["id"] for item in phases ] )
+        signal_ids = [ item["id"] for item in phases[1]["phases"][0]["signals"] ]
+        self.assertEqual( [ "20", "21" ], signal_ids )
+
+    def test_getPhasesDict_partial(self):
+        opendrive: OpenDRIVE = load( get_data_path( "signalization.xodr" ) )
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        ## only partial matches are left
+        del metadata["Signalization"]["Junction"][0:2]
+        phases = metadata.getPhasesDict( opendrive )
+        self.assertEqual( 1, len( phases ) )
+        self.assertEqual( "100", phases[0]["id"] )
+
+    def test_getPhasesDict_exhausted(self):
+        opendrive: OpenDRIVE = load( get_data_path( "signalization.xodr" ) )
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        junction_list = metadata["Signalization"]["Junction"]
+        del junction_list[0:2]
+        ## additional junctions partially matching the same XODR junctions
+        for rr_id in ( "904", "905" ):
+            extra_junc = copy.deepcopy( junction_list[0] )
+            extra_junc["ID"] = "{00000000-0000-0000-0000-000000000%s}" % rr_id
+            junction_list.append( extra_junc )
+
+        phases = metadata.getPhasesDict( opendrive )
+        ## no junction left for last one
+        self.assertEqual( [ "100", "200", None ], [ item["id"] for item in phases ] )
+
+    def test_load_stream(self):
+        input_path = get_data_path( "signalization.rrdata" )
+        metadata = rrdata.load( input_path )
+        streamed = rrdata.load_stream( input_path )
+        self.assertEqual( metadata.getConfigurationDict(), streamed.getConfigurationDict() )
+        self.assertEqual( metadata.getSerializationDict(), streamed.getSerializationDict() )
+        self.assertEqual( metadata.getJunctionUUIDs(), streamed.getJunctionUUIDs() )
+        self.assertEqual( metadata.getSignalizationSignalUUIDs(), streamed.getSignalizationSignalUUIDs() )
+        self.assertEqual( metadata.getPhasesDict(), streamed.getPhasesDict() )
+
+        ## tables are cached
+        self.assertIs( streamed.getConfigurationDict(), streamed.getConfigurationDict() )
+        streamed.invalidateCache()
+        self.assertEqual( 3, len( streamed.getSerializationDict() ) )
+
+    def test_load_cached(self):
+        input_path = get_data_path( "signalization.rrdata" )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            metadata = rrdata.load_cached( input_path, cache_dir=cache_dir )
+            self.assertEqual( 1, len( os.listdir( cache_dir ) ) )
+            restored = rrdata.load_cached( input_path, cache_dir=cache_dir )
+            self.assertIsNot( metadata, restored )
+            self.assertEqual( metadata.getSerializationDict(), restored.getSerializationDict() )
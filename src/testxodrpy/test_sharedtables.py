@@ -0,0 +1,120 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from testxodrpy import get_data_path
+
+import numpy as np
+
+from xodrpy.xodr import load
+from xodrpy.sharedtables import publish_tables, publish_map, attach_tables, detach_tables
+
+
+def worker_positions( descriptor, road_ids, s_coords ):
+    tables, _ = attach_tables( descriptor )
+    try:
+        road_indexes = tables.roadIndexes( road_ids )
+        positions, _ = tables.positions( road_indexes, s_coords, np.zeros( len( s_coords ) ) )
+        return positions.copy()
+    finally:
+        detach_tables( tables )
+
+
+def worker_project( descriptor, road_ids, points ):
+    tables, _ = attach_tables( descriptor )
+    try:
+        road_indexes = tables.roadIndexes( road_ids )
+        s_coords, t_coords = tables.project( road_indexes, points[:, 0], points[:, 1] )
+        return ( s_coords.copy(), t_coords.copy() )
+    finally:
+        detach_tables( tables )
+
+
+##
+class SharedTablesTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.opendrive = load( get_data_path( "town1.xodr" ) )
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_attach(self):
+        tables = self.opendrive.mapTables()
+        with publish_tables( tables ) as shared:
+            attached, extra = attach_tables( shared.descriptor() )
+            self.assertEqual( {}, extra )
+            self.assertEqual( tables.road_ids, attached.road_ids )
+            self.assertFalse( attached.geom_x.flags.owndata )
+            self.assertFalse( attached.geom_x.flags.writeable )
+            np.testing.assert_array_equal( tables.geom_curv_end, attached.geom_curv_end )
+            np.testing.assert_array_equal( tables.elev_coeffs, attached.elev_coeffs )
+
+            road_indexes = np.arange( tables.roadsNumber() )
+            s_coords     = tables.road_length / 2
+            expected = tables.positions( road_indexes, s_coords, np.ones( len( s_coords ) ) )
+            result   = attached.positions( road_indexes, s_coords, np.ones( len( s_coords ) ) )
+            np.testing.assert_array_equal( expected[0], result[0] )
+            np.testing.assert_array_equal( expected[1], result[1] )
+            detach_tables( attached )
+            self.assertIsNone( attached.buffer_owner )
+
+    def test_publish_map(self):
+        opendrive = load( get_data_path( "signalization.xodr" ) )
+        with publish_map( opendrive ) as shared:
+            descriptor = shared.descriptor()
+            attached, extra = attach_tables( descriptor )
+            positions, headings = opendrive.signalPoses()
+            np.testing.assert_array_equal( positions, extra[ "signal_positions" ] )
+            np.testing.assert_array_equal( headings, extra[ "signal_headings" ] )
+            self.assertEqual( [ "10", "11", "20", "21" ], descriptor[ "signal_ids" ] )
+            detach_tables( attached, extra )
+            self.assertIsNone( attached.buffer_owner )
+            self.assertEqual( {}, extra )
+
+    def test_workers(self):
+        tables = self.opendrive.mapTables()
+        road_ids = tables.road_ids[ :10 ]
+        s_coords = np.full( len( road_ids ), 1.0 )
+        expected, _ = tables.positions( tables.roadIndexes( road_ids ), s_coords, np.zeros( len( road_ids ) ) )
+        with publish_tables( tables ) as shared:
+            with ProcessPoolExecutor( max_workers=2 ) as executor:
+                futures = [ executor.submit( worker_positions, shared.descriptor(), road_ids, s_coords ) for _ in range( 2 ) ]
+                for future in futures:
+                    np.testing.assert_array_equal( expected, future.result() )
+
+    def test_workers_project(self):
+        tables = self.opendrive.mapTables()
+        road_ids = tables.road_ids[ :10 ]
+        road_indexes = tables.roadIndexes( road_ids )
+        s_coords = tables.road_length[ road_indexes ] / 2
+        t_coords = np.full( len( road_ids ), 1.5 )
+        points, _ = tables.positions( road_indexes, s_coords, t_coords )
+        with publish_tables( tables ) as shared:
+            with ProcessPoolExecutor( max_workers=2 ) as executor:
+                future = executor.submit( worker_project, shared.descriptor(), road_ids, points )
+                proj_s, proj_t = future.result()
+        np.testing.assert_allclose( s_coords, proj_s, atol=1.0e-6 )
+        np.testing.assert_allclose( t_coords, proj_t, atol=1.0e-6 )
@@ -0,0 +1,87 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_data_path
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy import rrdata
+from xodrpy.signaltimeline import build_signal_timeline
+
+
+##
+class SignalTimelineTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_stateAt(self):
+        opendrive: OpenDRIVE = load( get_data_path( "signalization.xodr" ) )
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        timeline = metadata.getSignalTimeline( opendrive )
+        self.assertEqual( 3, timeline.junctionsNumber() )
+        self.assertEqual( [ "10", "11", "20", "21" ], timeline.signal_ids )
+        self.assertEqual( 25.0, timeline.cycleLength( 0 ) )
+
+        ## phases of first junction: 10s, 3s, 12s
+        self.assertEqual( "Green", timeline.stateAt( "10", 0.0 ) )
+        self.assertEqual( "Green", timeline.stateAt( "10", 9.99 ) )
+        self.assertEqual( "Yellow", timeline.stateAt( "10", 10.0 ) )
+        self.assertEqual( "Red", timeline.stateAt( "10", 13.0 ) )
+        self.assertEqual( "Walk", timeline.stateAt( "11", 20.0 ) )
+        ## cycling
+        self.assertEqual( "Yellow", timeline.stateAt( "10", 25.0 * 4 + 11.0 ) )
+        self.assertEqual( "Red", timeline.stateAt( "10", -1.0 ) )
+        ## by UUID
+        self.assertEqual( "Red", timeline.stateAt( "{00000000-0000-0000-0000-000000000021}", 0.0 ) )
+        self.assertEqual( "Green", timeline.stateAt( "21", 20.0 ) )
+        self.assertEqual( None, timeline.stateAt( "unknown", 0.0 ) )
+
+    def test_statesAt(self):
+        metadata = rrdata.load( get_data_path( "signalization.rrdata" ) )
+        timeline = metadata.getSignalTimeline()
+        for time in [ 0.0, 5.0, 10.0, 12.5, 13.0, 24.9, 31.0, 47.0, 1000.0 ]:
+            states = timeline.statesAt( time ).tolist()
+            expected = [ timeline.stateAt( sig_id, time ) for sig_id in timeline.signal_ids ]
+            self.assertEqual( expected, states )
+        states_dict = timeline.statesDict( 0.0 )
+        self.assertEqual( "Green", states_dict[ "{00000000-0000-0000-0000-000000000010}" ] )
+
+    def test_unknown_state(self):
+        phases_config = [ { "uuid": "j1", "id": None,
+                            "phases": [ { "duration": "5", "signals": [ { "uuid": "s1", "id": None, "state": "Red" } ] },
+                                        { "duration": "0", "signals": [ { "uuid": "s1", "id": None, "state": "Yellow" } ] },
+                                        { "duration": "5", "signals": [ { "uuid": "s2", "id": None, "state": "Green" } ] } ] } ]
+        timeline = build_signal_timeline( phases_config )
+        self.assertEqual( "Red", timeline.stateAt( "s1", 4.0 ) )
+        ## zero length phase is never active
+        self.assertEqual( "unknown", timeline.stateAt( "s1", 5.0 ) )
+        self.assertEqual( [ "unknown", "Green" ], timeline.statesAt( 5.0 ).tolist() )
+
+        empty = build_signal_timeline( [] )
+        self.assertEqual( 0, len( empty.statesAt( 1.0 ) ) )
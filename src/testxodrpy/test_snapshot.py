@@ -0,0 +1,76 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import tempfile
+from testxodrpy import get_data_path
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy import snapshot
+
+
+##
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_outdated(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = os.path.join( temp_dir, "source.txt" )
+            with open( source_path, 'w', encoding="utf-8" ) as source_file:
+                source_file.write( "aaa" )
+            snapshot_file = snapshot.snapshot_path( source_path )
+            self.assertEqual( source_path + ".snapshot", snapshot_file )
+            self.assertEqual( None, snapshot.load_snapshot( snapshot_file, source_path ) )
+
+            snapshot.save_snapshot( { "value": 1 }, snapshot_file, source_path )
+            self.assertEqual( { "value": 1 }, snapshot.load_snapshot( snapshot_file, source_path ) )
+
+            with open( source_path, 'w', encoding="utf-8" ) as source_file:
+                source_file.write( "bbbb" )
+            self.assertEqual( None, snapshot.load_snapshot( snapshot_file, source_path ) )
+            ## source not checked
+            self.assertEqual( { "value": 1 }, snapshot.load_snapshot( snapshot_file ) )
+
+    def test_invalid(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snapshot_file = os.path.join( temp_dir, "data.snapshot" )
+            with open( snapshot_file, 'wb' ) as data_file:
+                data_file.write( b"invalid content" )
+            self.assertEqual( None, snapshot.load_snapshot( snapshot_file ) )
+
+    def test_opendrive(self):
+        input_path = get_data_path( "signalization.xodr" )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            opendrive: OpenDRIVE = snapshot.load_with_snapshot( input_path, load, cache_dir=cache_dir )
+            restored: OpenDRIVE = snapshot.load_with_snapshot( input_path, load, cache_dir=cache_dir )
+            self.assertIsNot( opendrive, restored )
+            self.assertEqual( opendrive.signalIDList(), restored.signalIDList() )
+            self.assertEqual( "10", restored.signalByUUID( "{00000000-0000-0000-0000-000000000010}" ).id() )
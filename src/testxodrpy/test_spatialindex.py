@@ -0,0 +1,161 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+from testxodrpy import get_data_path, get_sample_path
+
+import numpy as np
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy.spatialindex import GridIndex
+
+
+##
+class GridIndexTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_points(self):
+        generator = np.random.default_rng( 0 )
+        points = generator.uniform( -100.0, 100.0, ( 500, 2 ) )
+        grid = GridIndex( points, cell_size=7.0 )
+        self.assertEqual( 500, grid.size() )
+
+        found = grid.queryRadius( ( 10.0, -20.0 ), 25.0 )
+        distances = np.hypot( points[:, 0] - 10.0, points[:, 1] + 20.0 )
+        self.assertEqual( np.nonzero( distances <= 25.0 )[0].tolist(), found.tolist() )
+
+        found = grid.queryBox( ( -30.0, 0.0 ), ( 5.0, 50.0 ) )
+        inside = ( points[:, 0] >= -30.0 ) & ( points[:, 0] <= 5.0 ) & ( points[:, 1] >= 0.0 ) & ( points[:, 1] <= 50.0 )
+        self.assertEqual( np.nonzero( inside )[0].tolist(), found.tolist() )
+
+        found = grid.queryBox( ( -1000.0, -1000.0 ), ( 1000.0, 1000.0 ) )
+        self.assertEqual( list( range( 0, 500 ) ), found.tolist() )
+
+    def test_boxes(self):
+        grid = GridIndex( [ (0.0, 0.0), (20.0, 20.0) ], [ (15.0, 2.0), (21.0, 21.0) ], cell_size=5.0 )
+        self.assertEqual( [0], grid.queryBox( (12.0, -1.0), (13.0, 1.0) ).tolist() )
+        self.assertEqual( [0], grid.queryRadius( (10.0, 4.0), 2.5 ).tolist() )
+        self.assertEqual( [], grid.queryRadius( (10.0, 4.0), 1.5 ).tolist() )
+        self.assertEqual( [], GridIndex( [] ).queryRadius( (0.0, 0.0), 10.0 ).tolist() )
+
+
+##
+class SpatialQueriesTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_signalsNear(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        positions, _ = opendrive.signalPoses()
+        center = positions[0]
+
+        found = opendrive.signalsNear( center[0], center[1], 20.0 )
+        distances = np.hypot( positions[:, 0] - center[0], positions[:, 1] - center[1] )
+        signals = opendrive.signalsView()
+        expected = [ signals[ item ] for item in np.nonzero( distances <= 20.0 )[0] ]
+        self.assertEqual( expected, found )
+        self.assertIn( signals[0], found )
+
+        found = opendrive.signalsInBox( ( (center[0] - 0.1, center[1] - 0.1), (center[0] + 0.1, center[1] + 0.1) ) )
+        self.assertIn( signals[0], found )
+        self.assertEqual( [], opendrive.objectsInBox( ( (-1000.0, -1000.0), (1000.0, 1000.0) ) ) )
+
+    def test_objectsNear(self):
+        opendrive: OpenDRIVE = load( get_data_path( "objects.xodr" ) )
+        positions, _ = opendrive.objectPoses()
+        objects = opendrive.objectsView()
+        for center in positions:
+            for radius in ( 1.0, 60.0, 200.0 ):
+                found = opendrive.objectsNear( center[0], center[1], radius )
+                distances = np.hypot( positions[:, 0] - center[0], positions[:, 1] - center[1] )
+                expected = [ objects[ item ] for item in np.nonzero( distances <= radius )[0] ]
+                self.assertEqual( expected, found )
+
+        found = opendrive.objectsNear( positions[0][0], positions[0][1], 1.0 )
+        self.assertEqual( [ "1" ], [ obj.id() for obj in found ] )
+
+        ## box covering objects of arc road
+        min_pos = positions[2:, :2].min( axis=0 ) - 0.1
+        max_pos = positions[2:, :2].max( axis=0 ) + 0.1
+        found = opendrive.objectsInBox( ( min_pos, max_pos ) )
+        self.assertEqual( [ "3", "4" ], [ obj.id() for obj in found ] )
+        found = opendrive.objectsInBox( ( positions[1][:2] - 0.1, positions[1][:2] + 0.1 ) )
+        self.assertEqual( [ "2" ], [ obj.id() for obj in found ] )
+        self.assertEqual( [], opendrive.objectsInBox( ( (-100.0, -100.0), (-50.0, -50.0) ) ) )
+
+    def test_electronicHorizon_objects(self):
+        opendrive: OpenDRIVE = load( get_data_path( "objects.xodr" ) )
+        graph = opendrive.laneGraph()
+
+        ## along reference line: objects on both sides of road are reported
+        route = [ graph.nodeIndex( "1", 0, -1 ), graph.nodeIndex( "2", 0, -1 ) ]
+        self.assertEqual( route[1:], graph.successors( route[0] ) )
+        horizon = opendrive.electronicHorizon( route, max_distance=150.0 )
+        objects = horizon["objects"]
+        self.assertEqual( [ ( 20.0, "1" ), ( 70.0, "2" ), ( 130.0, "3" ) ],
+                          [ ( round( item[0], 6 ), item[1].id() ) for item in objects ] )
+        self.assertEqual( [], horizon["signals"] )
+
+        horizon = opendrive.electronicHorizon( route, start_s=30.0, max_distance=300.0, max_items=2 )
+        self.assertEqual( [ ( 40.0, "2" ), ( 100.0, "3" ) ],
+                          [ ( round( item[0], 6 ), item[1].id() ) for item in horizon["objects"] ] )
+
+        ## opposite direction
+        route = [ graph.nodeIndex( "2", 0, 1 ), graph.nodeIndex( "1", 0, 1 ) ]
+        horizon = opendrive.electronicHorizon( route )
+        self.assertEqual( [ ( 20.0, "4" ), ( 70.0, "3" ), ( 130.0, "2" ), ( 180.0, "1" ) ],
+                          [ ( round( item[0], 6 ), item[1].id() ) for item in horizon["objects"] ] )
+
+    def test_electronicHorizon(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        graph = opendrive.laneGraph()
+        route = [ graph.nodeIndex( "69", 0, -1 ), graph.nodeIndex( "71", 0, 1 ) ]
+
+        horizon = opendrive.electronicHorizon( route, max_distance=100.0 )
+        signals = horizon["signals"]
+        self.assertEqual( 1, len( signals ) )
+        self.assertEqual( ( 0.0, "113" ), ( signals[0][0], signals[0][1].id() ) )
+        references = horizon["references"]
+        self.assertEqual( 4, len( references ) )
+        self.assertEqual( [ 2.0, 2.0, 2.0 ], [ round( item[0], 3 ) for item in references[:3] ] )
+        self.assertEqual( [], horizon["objects"] )
+
+        ## start after signal
+        horizon = opendrive.electronicHorizon( route, start_s=1.0, max_distance=100.0, max_items=2 )
+        self.assertEqual( [], horizon["signals"] )
+        self.assertEqual( 2, len( horizon["references"] ) )
+        self.assertAlmostEqual( 1.0, horizon["references"][0][0] )
@@ -0,0 +1,110 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import re
+import gzip
+import tempfile
+from xml.etree import ElementTree
+from testxodrpy import get_data_path
+
+import numpy as np
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy.svgstream import path_data
+from xodrpy.draw import draw_data_stream
+
+
+def parse_path( data ):
+    """Return list of polylines of absolute points of path consisting of 'M', 'm' and 'l' commands."""
+    strips = []
+    curr   = np.zeros( 2 )
+    for command, values in re.findall( r"([Mml])([^Mml]*)", data ):
+        numbers = np.array( [ float( item ) for item in re.findall( r"-?\d*\.?\d+", values ) ] ).reshape( -1, 2 )
+        if command == "M":
+            curr = numbers[0]
+            strips.append( [ curr ] )
+        elif command == "m":
+            curr = curr + numbers[0]
+            strips.append( [ curr ] )
+        else:
+            for delta in numbers:
+                curr = curr + delta
+                strips[-1].append( curr )
+    return [ np.array( item ) for item in strips ]
+
+
+##
+class SvgStreamTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_path_data(self):
+        strips = [ np.array( [ [ 0.0, 0.0 ], [ 1.5, -0.25 ], [ 1.5, -0.25 ], [ 3.004, -1.0 ] ] ),
+                   np.array( [ [ 3.004, -1.0 ], [ 4.0, 0.0 ] ] ),
+                   np.array( [ [ 10.0, 10.0 ], [ 11.0, 10.0 ] ] ) ]
+        self.assertEqual( "M0 0l1.5-.25 1.5-.75 1 1m6 10l1 0", path_data( strips, 2 ) )
+        self.assertEqual( "M0 0l2 0 1-1 1 1m6 10l1 0", path_data( strips, 0 ) )
+        self.assertEqual( "", path_data( [], 2 ) )
+
+    def test_precision(self):
+        opendrive: OpenDRIVE = load( get_data_path( "town1.xodr" ) )
+        road = opendrive.roads()[5]
+        strips = road.lineLOD().strips( 0 )
+        points = np.concatenate( strips )
+        parsed = np.concatenate( parse_path( path_data( strips, 3 ) ) )
+        ## duplicated points are removed
+        _, unique_index = np.unique( np.rint( points * 1000.0 ), axis=0, return_index=True )
+        self.assertLessEqual( len( parsed ), len( points ) )
+        self.assertGreaterEqual( len( parsed ), len( unique_index ) )
+        ## no accumulation of rounding error
+        self.assertLess( np.abs( parsed[-1] - points[-1] ).max(), 0.0006 )
+
+    def test_draw_data_stream(self):
+        opendrive: OpenDRIVE = load( get_data_path( "town1.xodr" ) )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            svg_path = os.path.join( temp_dir, "town1.svgz" )
+            draw_data_stream( opendrive, svg_path )
+            with gzip.open( svg_path, 'rt', encoding="utf-8" ) as svg_file:
+                root = ElementTree.fromstring( svg_file.read() )
+            paths = root.findall( ".//{http://www.w3.org/2000/svg}path" )
+            self.assertEqual( opendrive.roadsNumber(), len( paths ) )
+
+    def test_draw_data_stream_scale(self):
+        opendrive: OpenDRIVE = load( get_data_path( "town1.xodr" ) )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            full_path  = os.path.join( temp_dir, "full.svg" )
+            thumb_path = os.path.join( temp_dir, "thumb.svg" )
+            draw_data_stream( opendrive, full_path )
+            draw_data_stream( opendrive, thumb_path, scale=0.25 )
+            self.assertLess( os.path.getsize( thumb_path ), os.path.getsize( full_path ) )
+            root = ElementTree.parse( thumb_path ).getroot()
+            view_box = [ float( item ) for item in root.get( "viewBox" ).split() ]
+            self.assertAlmostEqual( view_box[2] * 0.25, float( root.get( "width" ) ), 4 )
@@ -0,0 +1,100 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import tempfile
+from testxodrpy import get_data_path
+
+import numpy as np
+
+from xodrpy.xodr import load
+from xodrpy.maptables import TABLE_ARRAYS
+from xodrpy.tablesfile import save_tables_file, open_tables_file, ARRAY_ALIGNMENT
+
+
+##
+class TablesFileTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        self.temp_dir.cleanup()
+
+    def test_roundtrip(self):
+        opendrive = load( get_data_path( "town1.xodr" ) )
+        file_path = os.path.join( self.temp_dir.name, "town1.xodrtbl" )
+        save_tables_file( opendrive, file_path )
+        tables_file = open_tables_file( file_path )
+
+        expected = opendrive.mapTables()
+        tables   = tables_file.tables()
+        self.assertEqual( expected.road_ids, tables.road_ids )
+        for name in TABLE_ARRAYS:
+            np.testing.assert_array_equal( getattr( expected, name ), getattr( tables, name ) )
+            self.assertFalse( getattr( tables, name ).flags.writeable )
+        for offset, _, _ in tables_file.header[ "arrays" ].values():
+            self.assertEqual( 0, offset % ARRAY_ALIGNMENT )
+
+        road_indexes = np.arange( tables.roadsNumber() )
+        s_coords = expected.road_length / 3
+        np.testing.assert_array_equal( expected.positions( road_indexes, s_coords, s_coords * 0 )[0],
+                                       tables.positions( road_indexes, s_coords, s_coords * 0 )[0] )
+
+    def test_polylines(self):
+        opendrive = load( get_data_path( "town1_road1.xodr" ) )
+        file_path = os.path.join( self.temp_dir.name, "road.xodrtbl" )
+        save_tables_file( opendrive, file_path, step=2.0 )
+        tables_file = open_tables_file( file_path )
+        road = opendrive.roads()[0]
+
+        line = tables_file.referenceLine( road.id() )
+        self.assertEqual( 2, line.shape[1] )
+        start = road.position( 0.0, 0.0, 0.0 )
+        end   = road.position( road.length(), 0.0, 0.0 )
+        self.assertAlmostEqual( start.x, line[0][0], 6 )
+        self.assertAlmostEqual( start.y, line[0][1], 6 )
+        self.assertAlmostEqual( end.x, line[-1][0], 6 )
+        self.assertAlmostEqual( end.y, line[-1][1], 6 )
+        self.assertIsNone( tables_file.referenceLine( "unknown" ) )
+
+        borders = tables_file.laneBorders( road.id() )
+        lanes_num = len( [ lane for lane in road.laneSections()[0].lanesList() if lane.id() != "0" ] )
+        self.assertEqual( lanes_num, len( borders ) )
+        section_index, lane_id, points = borders[-1]
+        self.assertEqual( 0, section_index )
+        ## outer border
+        min_offset, max_offset = road.laneSections()[0].minMaxTOffset( lane_id, 0.0 )
+        t_coord = max_offset if lane_id > 0 else min_offset
+        border_start = road.position( 0.0, t_coord, 0.0 )
+        self.assertAlmostEqual( border_start.x, points[0][0], 6 )
+        self.assertAlmostEqual( border_start.y, points[0][1], 6 )
+
+    def test_invalid_file(self):
+        file_path = os.path.join( self.temp_dir.name, "invalid.xodrtbl" )
+        with open( file_path, 'wb' ) as out_file:
+            out_file.write( b"not a tables file at all" )
+        with self.assertRaises( RuntimeError ):
+            open_tables_file( file_path )
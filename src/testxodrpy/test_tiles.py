@@ -0,0 +1,132 @@
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import unittest
+import os
+import struct
+import zlib
+import tempfile
+from testxodrpy import get_data_path
+
+import numpy as np
+
+from xodrpy.types import OpenDRIVE
+from xodrpy.xodr import load
+from xodrpy import tiles
+
+
+def decode_png( data ):
+    """Decode PNG written by 'encode_png()' (single IDAT, no filters)."""
+    position = 8
+    chunks = {}
+    while position < len( data ):
+        length = struct.unpack( ">I", data[ position:position + 4 ] )[0]
+        chunk_type = data[ position + 4:position + 8 ]
+        chunk_data = data[ position + 8:position + 8 + length ]
+        crc = struct.unpack( ">I", data[ position + 8 + length:position + 12 + length ] )[0]
+        assert crc == zlib.crc32( chunk_type + chunk_data ) & 0xFFFFFFFF
+        chunks[ chunk_type ] = chunk_data
+        position += 12 + length
+    width, height, _, color_type, _, _, _ = struct.unpack( ">IIBBBBB", chunks[ b"IHDR" ] )
+    channels = { 2: 3, 6: 4 }[ color_type ]
+    raw = np.frombuffer( zlib.decompress( chunks[ b"IDAT" ] ), dtype=np.uint8 ).reshape( height, -1 )
+    return raw[:, 1:].reshape( height, width, channels )
+
+
+##
+class TilesTest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_encode_png(self):
+        image = np.random.default_rng( 0 ).integers( 0, 255, ( 7, 5, 4 ), dtype=np.uint8 )
+        data = tiles.encode_png( image )
+        self.assertEqual( b"\x89PNG\r\n\x1a\n", data[:8] )
+        self.assertTrue( np.array_equal( image, decode_png( data ) ) )
+
+    def test_fill_polygon(self):
+        image = np.zeros( ( 10, 10, 4 ), dtype=np.uint8 )
+        square = np.array( [ [ 2.0, 2.0 ], [ 6.0, 2.0 ], [ 6.0, 5.0 ], [ 2.0, 5.0 ] ] )
+        tiles.fill_polygon( image, square, ( 1, 2, 3, 255 ) )
+        filled = image[:, :, 3] > 0
+        self.assertEqual( 12, filled.sum() )
+        self.assertTrue( filled[ 2:5, 2:6 ].all() )
+
+        ## partially outside
+        image = np.zeros( ( 10, 10, 4 ), dtype=np.uint8 )
+        tiles.fill_polygon( image, square - 4.0, ( 1, 2, 3, 255 ) )
+        self.assertEqual( 2, ( image[:, :, 3] > 0 ).sum() )
+
+    def test_draw_polyline(self):
+        image = np.zeros( ( 10, 10, 4 ), dtype=np.uint8 )
+        tiles.draw_polyline( image, np.array( [ [ 0.5, 0.5 ], [ 9.5, 0.5 ], [ 9.5, 20.0 ] ] ), ( 255, 0, 0, 255 ) )
+        drawn = image[:, :, 3] > 0
+        self.assertTrue( drawn[ 0, : ].all() )
+        self.assertTrue( drawn[ :, 9 ].all() )
+        self.assertEqual( 19, drawn.sum() )
+
+    def test_render_tiles(self):
+        opendrive: OpenDRIVE = load( get_data_path( "town1.xodr" ) )
+        scene = tiles.build_tile_scene( opendrive )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            serial_dir   = os.path.join( temp_dir, "serial" )
+            parallel_dir = os.path.join( temp_dir, "parallel" )
+            serial   = tiles.render_tiles( opendrive, serial_dir, range( 3 ), 64, workers=1, scene=scene )
+            parallel = tiles.render_tiles( opendrive, parallel_dir, range( 3 ), 64, workers=2, scene=scene )
+            self.assertEqual( [ os.path.relpath( item, serial_dir ) for item in serial ],
+                              [ os.path.relpath( item, parallel_dir ) for item in parallel ] )
+            ## level 0 contains whole map
+            self.assertEqual( os.path.join( serial_dir, "0", "0", "0.png" ), serial[0] )
+            self.assertGreater( len( serial ), 4 )
+            for serial_path, parallel_path in zip( serial, parallel ):
+                with open( serial_path, 'rb' ) as serial_file, open( parallel_path, 'rb' ) as parallel_file:
+                    self.assertEqual( serial_file.read(), parallel_file.read() )
+
+            with open( serial[0], 'rb' ) as png_file:
+                image = decode_png( png_file.read() )
+            self.assertEqual( ( 64, 64, 4 ), image.shape )
+            self.assertTrue( ( image[:, :, :] == tiles.LINE_COLOR ).all( axis=2 ).any() )
+            self.assertTrue( ( image[:, :, :] == tiles.DRIVING_COLOR ).all( axis=2 ).any() )
+
+    def test_occupied_tiles(self):
+        opendrive: OpenDRIVE = load( get_data_path( "town1.xodr" ) )
+        scene = tiles.build_tile_scene( opendrive )
+        for level in range( 5 ):
+            tiles_num = 2 ** level
+            expected = set()
+            for tile_x in range( tiles_num ):
+                for tile_y in range( tiles_num ):
+                    min_box, max_box = scene.tileBox( level, tile_x, tile_y )
+                    if len( scene.grid.queryBox( min_box, max_box ) ) > 0:
+                        expected.add( ( tile_x, tile_y ) )
+            self.assertEqual( expected, tiles.occupied_tiles( scene, level ) )
+
+        empty_scene = tiles.TileScene( [], [], [] )
+        self.assertEqual( set(), tiles.occupied_tiles( empty_scene, 2 ) )
+        self.assertEqual( [], list( tiles.tile_tasks( empty_scene, range( 3 ), 64, "", True ) ) )
+        self.assertEqual( 16, len( list( tiles.tile_tasks( empty_scene, [ 2 ], 64, "", False ) ) ) )
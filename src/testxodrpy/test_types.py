@@ -22,7 +22,7 @@
 #
 
 import unittest
-from testxodrpy import get_data_path
+from testxodrpy import get_data_path, get_sample_path
 
 import math
 from xodrpy.utils import Vector2D, Vector3D
@@ -193,6 +193,21 @@ class ClothoidGeometryTest(unittest.TestCase):
         self.assertAlmostEqual( Vector2D(x=0.0, y=0.0), start_point )
         self.assertAlmostEqual( Vector2D(x=1.7672645240329674, y=6.400083840459464), end_point )
 
+    def test_headingByOffsetRaw(self):
+        data = { "@x": "0.0",
+                 "@y": "0.0",
+                 "@hdg": "0.5",
+                 "@length": "10.0",
+                 "@curvStart": "0.2",
+                 "@curvEnd": "0.4"
+            }
+        geom = ClothoidGeometry()
+        geom.initialize( data )
+
+        self.assertAlmostEqual( 0.5, geom.headingByOffsetRaw(  0.0 ) )
+        ## integral of curvature: 0.2 * 10 + 0.5 * 0.02 * 10^2
+        self.assertAlmostEqual( 3.5, geom.headingByOffsetRaw( 10.0 ) )
+
 
 ##
 class RoadTest(unittest.TestCase):
@@ -247,3 +262,154 @@ class RoadTest(unittest.TestCase):
         bbox = road.boundingBox()
         self.assertEqual( ((-197.22099855593865, -153.31995050960072, 0.0),
                            (-197.14107134062706, 154.3200554954873, 0.0)), bbox )
+
+
+##
+class OpenDRIVETest(unittest.TestCase):
+    def setUp(self):
+        ## Called before testfunction is executed
+        pass
+
+    def tearDown(self):
+        ## Called after testfunction was executed
+        pass
+
+    def test_lookups(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+
+        road: Road = opendrive.roadById( "72" )
+        self.assertEqual( "72", road.id() )
+        self.assertEqual( None, opendrive.roadById( "unknown" ) )
+
+        for sig in opendrive.signalList():
+            self.assertIs( sig, opendrive.signalById( sig.id() ) )
+        self.assertEqual( None, opendrive.signalById( "unknown" ) )
+
+        for controller in opendrive.controllers():
+            self.assertIs( controller, opendrive.controllerById( controller.id() ) )
+
+        refs_list = opendrive.signalReferenceList()
+        self.assertTrue( len( refs_list ) > 0 )
+        sig_ref = refs_list[0]
+        found = opendrive.signalReferencesByID( sig_ref.id() )
+        self.assertEqual( [ item for item in refs_list if item.id() == sig_ref.id() ], found )
+
+    def test_lookups_uuid(self):
+        input_path = get_data_path( "signalization.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        uuids_list = [ sig.uuid() for road in opendrive.roads() for sig in road.signalsList() ]
+        self.assertEqual( 4, len( uuids_list ) )
+        for sig_uuid in uuids_list:
+            self.assertIs( signal_by_scan( opendrive, sig_uuid ), opendrive.signalByUUID( sig_uuid ) )
+            self.assertEqual( references_by_scan( opendrive, sig_uuid ), opendrive.signalReferencesByUUID( sig_uuid ) )
+        self.assertEqual( 1, len( opendrive.signalReferencesByUUID( uuids_list[0] ) ) )
+        self.assertEqual( None, opendrive.signalByUUID( "unknown" ) )
+        self.assertEqual( [], opendrive.signalReferencesByUUID( "unknown" ) )
+
+        ## duplicated UUID - first signal in order of roads is found
+        last_signal = opendrive.roads()[-1].signalsList()[-1]
+        last_signal[ "userData" ][ "vectorSignal" ][ "@signalId" ] = uuids_list[0]
+        opendrive.invalidateCache()
+        found = opendrive.signalByUUID( uuids_list[0] )
+        self.assertEqual( "10", found.id() )
+        self.assertIs( signal_by_scan( opendrive, uuids_list[0] ), found )
+        self.assertEqual( None, opendrive.signalByUUID( uuids_list[-1] ) )
+
+    def test_lookups_object(self):
+        input_path = get_data_path( "objects.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        for obj_id in [ "1", "2", "3", "4" ]:
+            self.assertIs( object_by_scan( opendrive, obj_id ), opendrive.objectById( obj_id ) )
+        self.assertEqual( None, opendrive.objectById( "unknown" ) )
+
+        ## duplicated id - first object in order of roads is found
+        last_object = opendrive.roads()[-1].objectsList()[-1]
+        last_object[ "@id" ] = "1"
+        opendrive.invalidateCache()
+        found = opendrive.objectById( "1" )
+        self.assertEqual( "pole", found.name() )
+        self.assertIs( opendrive.roads()[0], found.road )
+        self.assertIs( object_by_scan( opendrive, "1" ), found )
+        self.assertEqual( None, opendrive.objectById( "4" ) )
+
+    def test_catalog(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+
+        signals_list = []
+        refs_list    = []
+        for road in opendrive.roads():
+            signals_list.extend( road.signalsList() )
+            refs_list.extend( road.signalReferencesList() )
+
+        self.assertEqual( signals_list, opendrive.signalList() )
+        self.assertEqual( refs_list, opendrive.signalReferenceList() )
+        self.assertEqual( set( item.id() for item in signals_list ), opendrive.signalIDList() )
+        self.assertEqual( tuple( signals_list ), opendrive.signalsView() )
+        self.assertIs( opendrive.signalsView(), opendrive.signalsView() )
+        self.assertEqual( signals_list, list( opendrive.iterSignals() ) )
+        self.assertEqual( refs_list, list( opendrive.iterSignalReferences() ) )
+        self.assertEqual( [], opendrive.signalGateList() )
+        self.assertEqual( 0, len( opendrive.objectsView() ) )
+
+        index = opendrive.mapIndex()
+        for sig, road_id in zip( index.signals_list, index.signal_roads ):
+            self.assertEqual( sig.road.id(), road_id )
+
+    def test_invalidateCache(self):
+        input_path = get_data_path( "town1_road1_simple.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        road: Road = opendrive.roadById("0")
+        self.assertTrue( road is not None )
+
+        opendrive.roads().remove( road )
+        opendrive.invalidateCache()
+        self.assertEqual( None, opendrive.roadById("0") )
+        self.assertEqual( 0, opendrive.roadsNumber() )
+
+    def test_positions(self):
+        input_path = get_sample_path( "CrossingComplex8Course.xodr" )
+        opendrive: OpenDRIVE = load( input_path )
+        road_ids = []
+        s_coords = []
+        for road in opendrive.roads()[ :20 ]:
+            for ratio in ( 0.0, 0.3, 0.9 ):
+                road_ids.append( road.id() )
+                s_coords.append( road.length() * ratio )
+        road_ids.append( "unknown" )
+        s_coords.append( 1.0 )
+        t_coords = [ 1.5 ] * len( s_coords )
+        z_coords = [ 0.5 ] * len( s_coords )
+
+        positions, headings = opendrive.positions( road_ids, s_coords, t_coords, z_coords )
+        self.assertEqual( ( len( road_ids ), 3 ), positions.shape )
+        for index in range( 0, len( road_ids ) - 1 ):
+            road = opendrive.roadById( road_ids[ index ] )
+            expected = road.position( s_coords[ index ], 1.5, 0.5 )
+            self.assertAlmostEqual( expected.x, positions[ index ][0], 6 )
+            self.assertAlmostEqual( expected.y, positions[ index ][1], 6 )
+            self.assertAlmostEqual( expected.z, positions[ index ][2], 6 )
+            self.assertAlmostEqual( road.heading( s_coords[ index ] ), headings[ index ], 6 )
+        self.assertTrue( math.isnan( positions[-1][0] ) )
+        self.assertTrue( math.isnan( headings[-1] ) )
+
+
+def signal_by_scan( opendrive: OpenDRIVE, signal_uuid ):
+    for road in opendrive.roads():
+        for sig in road.signalsList():
+            if sig.uuid() == signal_uuid:
+                return sig
+    return None
+
+
+def references_by_scan( opendrive: OpenDRIVE, signal_uuid ):
+    return [ sig for road in opendrive.roads() for sig in road.signalReferencesList() if sig.uuid() == signal_uuid ]
+
+
+def object_by_scan( opendrive: OpenDRIVE, object_id ):
+    for road in opendrive.roads():
+        for obj in road.objectsList():
+            if obj.id() == object_id:
+                return obj
+    return None
@@ -7,6 +7,8 @@
 
 import math
 
+import numpy as np
+
 
 # classs for spiral
 class OdrSpiral:
@@ -137,3 +139,53 @@ class OdrSpiral:
             y *= -1.0;
         t = s * s * cDot * 0.5;
         return (x, y, t)
+
+    def fresnelArray(self, xxa):
+        """Vectorized version of 'fresnel()' working on numpy arrays."""
+        xxa = np.asarray( xxa, dtype=np.float64 )
+        x   = np.abs( xxa )
+        x2  = x * x
+        ss  = np.full( x.shape, 0.5 )
+        cc  = np.full( x.shape, 0.5 )
+
+        small = x2 < 2.5625
+        if small.any():
+            xs  = x[ small ]
+            x2s = x2[ small ]
+            t   = x2s * x2s
+            ss[ small ] = xs * x2s * self.polevl( t, self.sn, 5 ) / self.p1evl( t, self.sd, 6 )
+            cc[ small ] = xs * self.polevl( t, self.cn, 5 ) / self.polevl( t, self.cd, 6 )
+
+        middle = ~small & ( x <= 36974.0 )
+        if middle.any():
+            xm  = x[ middle ]
+            x2m = x2[ middle ]
+            t = math.pi * x2m
+            u = 1.0 / ( t * t )
+            t = 1.0 / t
+            f = 1.0 - u * self.polevl( u, self.fn, 9 ) / self.p1evl( u, self.fd, 10 )
+            g = t * self.polevl( u, self.gn, 10 ) / self.p1evl( u, self.gd, 11 )
+
+            t = math.pi * 0.5 * x2m
+            c = np.cos( t )
+            s = np.sin( t )
+            t = math.pi * xm
+            cc[ middle ] = 0.5 + ( f * s - g * c ) / t
+            ss[ middle ] = 0.5 - ( f * c + g * s ) / t
+
+        negative = xxa < 0.0
+        cc[ negative ] = -cc[ negative ]
+        ss[ negative ] = -ss[ negative ]
+        return (ss, cc)
+
+    def odrSpiralArray(self, s, cDot):
+        """Vectorized version of 'odrSpiral()' ('s' and 'cDot' are numpy arrays)."""
+        s    = np.asarray( s, dtype=np.float64 )
+        cDot = np.asarray( cDot, dtype=np.float64 )
+        a = np.sqrt( math.pi ) / np.sqrt( np.abs( cDot ) )
+        (y, x) = self.fresnelArray( s / a )
+        y = y * a
+        x = x * a
+        y = np.where( cDot < 0.0, -y, y )
+        t = s * s * cDot * 0.5
+        return (x, y, t)
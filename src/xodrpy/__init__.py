@@ -1,3 +1,43 @@
 ##
 ##
 ##
+
+##
+## Public API is imported on first use (module '__getattr__'), so 'import xodrpy'
+## does not pull numpy, xmltodict nor svgwrite.
+##
+
+import importlib
+
+
+## attribute name -> submodule providing attribute
+_LAZY_ATTRIBUTES = {
+    "load":             "xodrpy.xodr",
+    "load_with_stats":  "xodrpy.loadstats",
+    "load_with_snapshot": "xodrpy.snapshot",
+    "scan":             "xodrpy.mapscan",
+    "MapRegistry":      "xodrpy.registry",
+    "OpenDRIVE":        "xodrpy.types",
+    "Road":             "xodrpy.types",
+    "Junction":         "xodrpy.types",
+    "RoadSignal":       "xodrpy.types",
+    "draw_data":        "xodrpy.draw",
+    "draw_data_stream": "xodrpy.draw",
+    "draw_files":       "xodrpy.draw",
+    "profile_queries":  "xodrpy.queryprofile",
+}
+
+__all__ = list( _LAZY_ATTRIBUTES.keys() )
+
+
+def __getattr__( name ):
+    module_name = _LAZY_ATTRIBUTES.get( name, None )
+    if module_name is None:
+        raise AttributeError( f"module {__name__!r} has no attribute {name!r}" )
+    value = getattr( importlib.import_module( module_name ), name )
+    globals()[ name ] = value
+    return value
+
+
+def __dir__():
+    return sorted( list( globals().keys() ) + __all__ )
@@ -26,6 +26,8 @@
 import os
 import sys
 import logging
+import time
+from typing import List, TYPE_CHECKING
 
 
 SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
@@ -38,10 +40,18 @@ if __name__ == '__main__':
 
 
 # import pprint
-import svgwrite
+import numpy as np
 
 from xodrpy.utils import move_strip
 from xodrpy.types import OpenDRIVE
+from xodrpy.svgstream import SvgStreamWriter, open_svg
+from xodrpy.spatialindex import clip_polyline
+from xodrpy.lod import road_strips_by_scale
+from xodrpy.snapshot import load_with_snapshot
+from xodrpy.xodr import load
+
+if TYPE_CHECKING:
+    from xodrpy.types import Road, GeometryBase
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -50,30 +60,85 @@ _LOGGER = logging.getLogger(__name__)
 ## ===========================================================
 
 
-def draw_data( opendrive: OpenDRIVE, outsvg_path=None ):
+def draw_data( opendrive: OpenDRIVE, outsvg_path=None, scale=None, viewport=None ):
+    """Draw reference lines of roads to SVG file.
+
+    If 'scale' [px/m] is given, then image size is scaled and reference lines are simplified
+    to level of detail matching the scale.
+    If 'viewport' box ( (min x, min y), (max x, max y) ) is given, then only given region is drawn.
+    """
 #     width   = "100%"
 #     height  = "100%"
 #     min_pos = (0, 0)
     
-    bbox = opendrive.boundingBox( 3.0 )
-    width  = bbox[1][0] - bbox[0][0]
-    height = bbox[1][1] - bbox[0][1]
-    min_pos = ( -bbox[0][0], -bbox[0][1] )
+    width, height, min_pos = draw_extent( opendrive, viewport )
     
     _LOGGER.info( "data size: %s", (width, height) )
     _LOGGER.info( "data offset: %s", min_pos )
-    
-    drawer = svgwrite.Drawing( outsvg_path, size=(width, height), profile='tiny' )
 
-    draw_svg( drawer, opendrive, min_pos, "red" )
+    ## svgwrite is heavy to import and not needed by streaming writer
+    import svgwrite
+
+    if scale is None:
+        drawer = svgwrite.Drawing( outsvg_path, size=(width, height), profile='tiny' )
+    else:
+        drawer = svgwrite.Drawing( outsvg_path, size=(width * scale, height * scale), profile='tiny' )
+        drawer.viewbox( 0, 0, width, height )
+
+    draw_svg( drawer, opendrive, min_pos, "red", scale, viewport )
 
     drawer.save( pretty=True )
 
 
-def draw_svg( drawer, opendrive: OpenDRIVE, move_offset=None, line_color="red" ):
+def draw_data_stream( opendrive: OpenDRIVE, outsvg_path, precision=2, scale=None, viewport=None ):
+    """Draw data writing SVG directly to file (one path per road), output is compressed if path ends with '.svgz'.
+
+    Meaning of 'scale' and 'viewport' is the same as in 'draw_data()'.
+    """
+    width, height, min_pos = draw_extent( opendrive, viewport )
+
+    _LOGGER.info( "data size: %s", (width, height) )
+    _LOGGER.info( "data offset: %s", min_pos )
+
+    with open_svg( outsvg_path ) as out_file:
+        if scale is None:
+            writer = SvgStreamWriter( out_file, (width, height), precision )
+        else:
+            writer = SvgStreamWriter( out_file, (width * scale, height * scale), precision, viewbox=(width, height) )
+        writer.beginGroup( stroke="red", fill="none" )
+        for road in visible_roads( opendrive, viewport ):
+            ## do not cache levels in roads - every road is visited once
+            strips = road_strips_by_scale( road, scale )
+            strips = clip_strips( strips, viewport )
+            strips = [ strip + min_pos for strip in strips ]
+            writer.addPath( strips )
+        writer.close()
+
+
+def draw_svg( drawer, opendrive: OpenDRIVE, move_offset=None, line_color="red", scale=None, viewport=None ):
     if move_offset is None:
         move_offset = (0.0, 0.0)
 
+    if scale is not None:
+        ## simplified reference lines
+        for road in visible_roads( opendrive, viewport ):
+            strips = road.lineLOD().stripsByScale( scale )
+            for strip in clip_strips( strips, viewport ):
+                line_strip = ( strip + move_offset ).tolist()
+                new_line = drawer.polyline( line_strip, stroke=line_color, fill="none" )
+                drawer.add( new_line )
+        return
+
+    if viewport is not None:
+        ## geometries found by spatial index
+        for _, geom in opendrive.geometriesInBox( viewport ):
+            points = np.array( [ ( point.x, point.y ) for point in geom.lineApprox( 1.0 ) ] )
+            for strip in clip_strips( [ points ], viewport ):
+                line_strip = ( strip + move_offset ).tolist()
+                new_line = drawer.polyline( line_strip, stroke=line_color, fill="none" )
+                drawer.add( new_line )
+        return
+
 #     road = opendrive.roadById( "508" )
 #     if road is not None:
     roads_list: List[ Road ] = opendrive.roads()
@@ -94,6 +159,102 @@ def draw_svg( drawer, opendrive: OpenDRIVE, move_offset=None, line_color="red" )
             drawer.add( new_line )
 
 
+def draw_extent( opendrive: OpenDRIVE, viewport=None ):
+    """Return tuple (width, height, offset moving drawn region to origin)."""
+    if viewport is None:
+        bbox = opendrive.boundingBox( 3.0 )
+    else:
+        bbox = viewport
+    width  = bbox[1][0] - bbox[0][0]
+    height = bbox[1][1] - bbox[0][1]
+    min_pos = ( -bbox[0][0], -bbox[0][1] )
+    return ( width, height, min_pos )
+
+
+def visible_roads( opendrive: OpenDRIVE, viewport=None ):
+    if viewport is None:
+        return opendrive.roads()
+    return opendrive.roadsInBox( viewport )
+
+
+def clip_strips( strips, viewport=None ):
+    if viewport is None:
+        return strips
+    ret_list = []
+    for strip in strips:
+        ret_list.extend( clip_polyline( strip, viewport[0], viewport[1] ) )
+    return ret_list
+
+
+## ===========================================================
+
+
+def draw_file( xodr_path, outsvg_path, cache_dir=None, stream=False, precision=2, scale=None, viewport=None ):
+    """Load and draw single file.
+
+    If 'cache_dir' is given, then parsed map is loaded from snapshot (and snapshot is stored if needed).
+    Return dict with input and output paths, load and draw durations in seconds and error message (or None).
+    """
+    result = { "input": xodr_path, "output": outsvg_path, "load": 0.0, "draw": 0.0, "error": None }
+    try:
+        start_time = time.perf_counter()
+        if cache_dir is None:
+            opendrive: OpenDRIVE = load( xodr_path )
+        else:
+            opendrive: OpenDRIVE = load_with_snapshot( xodr_path, load, cache_dir=cache_dir )
+        load_time = time.perf_counter()
+        result[ "load" ] = load_time - start_time
+        if stream or outsvg_path.endswith( ".svgz" ):
+            draw_data_stream( opendrive, outsvg_path, precision, scale, viewport )
+        else:
+            draw_data( opendrive, outsvg_path=outsvg_path, scale=scale, viewport=viewport )
+        result[ "draw" ] = time.perf_counter() - load_time
+    except Exception as exc:        # pylint: disable=W0703
+        _LOGGER.exception( "unable to draw file %s", xodr_path )
+        result[ "error" ] = str( exc )
+    return result
+
+
+def _draw_file_task( task ):
+    xodr_path, outsvg_path, cache_dir, options = task
+    return draw_file( xodr_path, outsvg_path, cache_dir, **options )
+
+
+def draw_files( xodr_paths, out_dir, extension=".svg", workers=None, cache_dir=None, **options ):
+    """Draw many files using pool of processes.
+
+    Inputs can be files or directories (all '*.xodr' files of directory are drawn). Output of
+    each file is written to 'out_dir' as '<input file name><extension>'. Remaining keyword
+    arguments are passed to 'draw_file()'. Return list of results of 'draw_file()' in order of inputs.
+    """
+    input_list = collect_inputs( xodr_paths )
+    os.makedirs( out_dir, exist_ok=True )
+    tasks = []
+    for xodr_path in input_list:
+        outsvg_path = os.path.join( out_dir, os.path.basename( xodr_path ) + extension )
+        tasks.append( ( xodr_path, outsvg_path, cache_dir, options ) )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max( min( workers, len( tasks ) ), 1 )
+    if workers == 1:
+        return [ _draw_file_task( task ) for task in tasks ]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor( max_workers=workers ) as executor:
+        return list( executor.map( _draw_file_task, tasks ) )
+
+
+def collect_inputs( paths ):
+    """Expand directories to sorted lists of '*.xodr' files."""
+    ret_list = []
+    for path in paths:
+        if os.path.isdir( path ):
+            dir_files = [ os.path.join( path, item ) for item in sorted( os.listdir( path ) ) if item.endswith( ".xodr" ) ]
+            ret_list.extend( dir_files )
+        else:
+            ret_list.append( path )
+    return ret_list
+
+
 ## ===========================================================
 
 
@@ -101,8 +262,17 @@ def main():
     parser = argparse.ArgumentParser(description='XODR drawer')
     parser.add_argument( '-la', '--logall', action='store_true', help='Log all messages' )
     # pylint: disable=C0301
-    parser.add_argument( '--xodr', action='store', required=False, default="", help="Input XODR file" )
-    parser.add_argument( '--outsvg', action='store', required=False, default="", help="SVG output" )
+    parser.add_argument( '--xodr', action='store', required=False, nargs="+", default=[], help="Input XODR files or directories" )
+    parser.add_argument( '--outsvg', action='store', required=False, default="", help="SVG output (single input)" )
+    parser.add_argument( '--outdir', action='store', required=False, default="", help="Output directory (many inputs)" )
+    parser.add_argument( '--ext', action='store', required=False, default=".svg", help="Extension of files written to output directory" )
+    parser.add_argument( '--workers', action='store', type=int, default=None, help="Number of worker processes (many inputs)" )
+    parser.add_argument( '--cache', action='store', required=False, default=None, help="Directory of parsed maps snapshots" )
+    parser.add_argument( '--stream', action='store_true', help="Write SVG directly to file (implied by '.svgz' output)" )
+    parser.add_argument( '--bbox', action='store', type=float, nargs=4, default=None, metavar=( "MINX", "MINY", "MAXX", "MAXY" ),
+                         help="Draw only given region of map" )
+    parser.add_argument( '--scale', action='store', type=float, default=None, help="Output scale in pixels per meter (enables simplification of lines)" )
+    parser.add_argument( '--precision', action='store', type=int, default=2, help="Number of decimal places of streamed SVG coordinates" )
 
     args = parser.parse_args()
 
@@ -112,16 +282,39 @@ def main():
     else:
         logging.getLogger().setLevel( logging.INFO )
 
-    opendrive: OpenDRIVE = load( args.xodr )
-    if opendrive is None:
-        _LOGGER.error( "unable to find file: %s", args.xodr )
+    viewport = None
+    if args.bbox is not None:
+        viewport = ( ( args.bbox[0], args.bbox[1] ), ( args.bbox[2], args.bbox[3] ) )
+    options = { "stream": args.stream, "precision": args.precision, "scale": args.scale, "viewport": viewport }
+
+    if args.outsvg:
+        if len( args.xodr ) != 1 or os.path.isdir( args.xodr[0] ):
+            _LOGGER.error( "'--outsvg' requires single input file, use '--outdir' instead" )
+            return 1
+        if not os.path.isfile( args.xodr[0] ):
+            _LOGGER.error( "unable to find file: %s", args.xodr[0] )
+            return 1
+        result = draw_file( args.xodr[0], args.outsvg, args.cache, **options )
+        return 0 if result[ "error" ] is None else 1
+
+    if not args.outdir:
+        _LOGGER.error( "output not given: use '--outsvg' or '--outdir'" )
         return 1
-    
-    draw_data( opendrive, outsvg_path=args.outsvg )
+
+    start_time = time.perf_counter()
+    results = draw_files( args.xodr, args.outdir, args.ext, args.workers, args.cache, **options )
+    failed = 0
+    for result in results:
+        if result[ "error" ] is not None:
+            failed += 1
+            _LOGGER.error( "%s: failed: %s", result[ "input" ], result[ "error" ] )
+            continue
+        _LOGGER.info( "%s: load %.3fs draw %.3fs", result[ "input" ], result[ "load" ], result[ "draw" ] )
+    _LOGGER.info( "drawn %s files (%s failed) in %.3fs", len( results ) - failed, failed, time.perf_counter() - start_time )
+    return 0 if failed == 0 else 1
 
 
 if __name__ == '__main__':
     import argparse
-    from xodrpy.xodr import load
 
-    main()
+    sys.exit( main() )
@@ -0,0 +1,166 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import os
+import logging
+from typing import List, Dict, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## kinds of road items
+ITEM_SIGNAL    = 0
+ITEM_REFERENCE = 1
+ITEM_OBJECT    = 2
+
+ITEM_KIND_NAMES = { ITEM_SIGNAL: "signals", ITEM_REFERENCE: "references", ITEM_OBJECT: "objects" }
+
+
+## ===========================================================
+
+
+##
+class RoadItemsIndex():
+    """Signals, signal references and objects of each road sorted by offset on road.
+
+    For each road there are aligned arrays: offsets, kinds, catalog indexes and orientations
+    (1 for "+", -1 for "-", 0 otherwise). Catalog index points to respective tuple of 'MapIndex'.
+    """
+
+    def __init__(self):
+        self.roads: Dict[ str, tuple ] = {}
+
+    def roadItems(self, road_id):
+        """Return tuple of arrays (offsets, kinds, catalog indexes, orientations) or None."""
+        return self.roads.get( road_id, None )
+
+    def itemsInRange(self, road_id, min_s, max_s):
+        """Return arrays of road items with offset in range '[min_s, max_s]'."""
+        items = self.roads.get( road_id, None )
+        if items is None:
+            return None
+        start = np.searchsorted( items[0], min_s, side="left" )
+        end   = np.searchsorted( items[0], max_s, side="right" )
+        return tuple( array[ start:end ] for array in items )
+
+
+def build_road_items_index( opendrive: 'OpenDRIVE' ) -> RoadItemsIndex:
+    index = opendrive.mapIndex()
+    rows_dict: Dict[ str, List ] = {}
+    catalog = ( ( ITEM_SIGNAL, index.signals_list, index.signal_roads ),
+                ( ITEM_REFERENCE, index.references_list, index.reference_roads ),
+                ( ITEM_OBJECT, index.objects_list, index.object_roads ) )
+    for kind, items_list, roads_list in catalog:
+        for item_index, ( item, road_id ) in enumerate( zip( items_list, roads_list ) ):
+            orientation = item.orientation()
+            orient_code = 0
+            if orientation == "+":
+                orient_code = 1
+            elif orientation == "-":
+                orient_code = -1
+            rows_dict.setdefault( road_id, [] ).append( ( float( item.attr("s") ), kind, item_index, orient_code ) )
+
+    items_index = RoadItemsIndex()
+    for road_id, rows in rows_dict.items():
+        rows.sort()
+        offsets      = np.array( [ row[0] for row in rows ], dtype=np.float64 )
+        kinds        = np.array( [ row[1] for row in rows ], dtype=np.int8 )
+        indexes      = np.array( [ row[2] for row in rows ], dtype=np.int64 )
+        orientations = np.array( [ row[3] for row in rows ], dtype=np.int8 )
+        items_index.roads[ road_id ] = ( offsets, kinds, indexes, orientations )
+    return items_index
+
+
+## ===========================================================
+
+
+def electronic_horizon( opendrive: 'OpenDRIVE', route: List[ int ], start_s=None, max_distance=300.0, max_items=None ):
+    """Find signals, signal references and objects ahead along lane route.
+
+    'route' is list of lane graph nodes (e.g. found by 'LaneGraph.shortestPath()'),
+    'start_s' is current offset on road of first lane of route (None means entry of lane).
+    Signals and references with orientation opposite to direction of travel are skipped.
+
+    Returns dict with keys "signals", "references" and "objects", each containing list of
+    tuples (distance, item) sorted by distance and truncated to 'max_items'.
+    """
+    graph       = opendrive.laneGraph()
+    items_index = opendrive.roadItemsIndex()
+    index       = opendrive.mapIndex()
+    catalog     = { ITEM_SIGNAL: index.signals_list, ITEM_REFERENCE: index.references_list, ITEM_OBJECT: index.objects_list }
+
+    found_dict  = { name: [] for name in ITEM_KIND_NAMES.values() }
+    found_set   = set()
+    travelled   = 0.0
+    for route_index, node_index in enumerate( route ):
+        if travelled > max_distance:
+            break
+        road_id, section_index, lane_id = graph.node( node_index )
+        road = opendrive.roadById( road_id )
+        min_s, max_s = road.laneSectionRange( section_index )
+        forward = lane_id < 0
+        if route_index == 0 and start_s is not None:
+            start_s = min( max( start_s, min_s ), max_s )
+            if forward:
+                min_s = start_s
+            else:
+                max_s = start_s
+        entry_s = min_s if forward else max_s
+
+        items = items_index.itemsInRange( road_id, min_s, max_s )
+        if items is not None and len( items[0] ) > 0:
+            offsets, kinds, indexes, orientations = items
+            if forward:
+                distances = travelled + offsets - entry_s
+                valid = orientations >= 0
+            else:
+                distances = travelled + entry_s - offsets
+                valid = orientations <= 0
+            ## orientation does not matter for objects
+            valid |= kinds == ITEM_OBJECT
+            valid &= distances <= max_distance
+            for distance, kind, item_index in zip( distances[ valid ].tolist(), kinds[ valid ].tolist(), indexes[ valid ].tolist() ):
+                key = ( kind, item_index )
+                if key in found_set:
+                    ## item on border of lane sections
+                    continue
+                found_set.add( key )
+                found_dict[ ITEM_KIND_NAMES[ kind ] ].append( ( distance, catalog[ kind ][ item_index ] ) )
+
+        travelled += max_s - min_s
+
+    for name, items_list in found_dict.items():
+        items_list.sort( key=lambda pair: pair[0] )
+        if max_items is not None:
+            del items_list[ max_items: ]
+    return found_dict
@@ -0,0 +1,314 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import logging
+from typing import List, Tuple, TYPE_CHECKING
+import heapq
+
+import math
+import numpy as np
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE, Road
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## lane types considered when building graph
+DRIVING_LANE_TYPES = ( "driving", "entry", "exit", "onRamp", "offRamp", "connectingRamp", "bidirectional" )
+
+
+## ===========================================================
+
+
+##
+class LaneGraph():
+    """Directed graph of lanes stored in CSR (compressed sparse row) arrays.
+
+    Graph node is lane in lane section described by tuple (road id, section index, lane id).
+    Right lanes (negative id) are traversed along reference line, left lanes (positive id)
+    in opposite direction. Weight of edge is length of source lane, so cost of route
+    is distance from entry of first lane to entry of last lane.
+    """
+
+    def __init__(self, nodes: List[ Tuple[str, int, int] ], lengths, entry_points, indptr, indices):
+        self.nodes        = nodes                                       ## list of tuples (road id, section index, lane id)
+        self.lengths      = np.asarray( lengths, dtype=np.float64 )     ## length of each lane
+        self.entry_points = np.asarray( entry_points, dtype=np.float64 ).reshape( -1, 2 )     ## entry point of each lane
+        self.indptr       = np.asarray( indptr, dtype=np.int64 )
+        self.indices      = np.asarray( indices, dtype=np.int64 )
+        ## weight of edge is length of source node
+        sources           = np.repeat( np.arange( len( nodes ) ), np.diff( self.indptr ) )
+        self.weights      = self.lengths[ sources ]
+
+        self._node_dict = { node: index for index, node in enumerate( nodes ) }
+
+        ## plain lists are significantly faster than numpy arrays for element access in search loops
+        self._indptr_list  = self.indptr.tolist()
+        self._indices_list = self.indices.tolist()
+        self._weights_list = self.weights.tolist()
+        self._lengths_list = self.lengths.tolist()
+        self._points_x     = self.entry_points[ :, 0 ].tolist()
+        self._points_y     = self.entry_points[ :, 1 ].tolist()
+
+    def nodesNumber(self):
+        return len( self.nodes )
+
+    def edgesNumber(self):
+        return len( self.indices )
+
+    def node(self, node_index) -> Tuple[str, int, int]:
+        return self.nodes[ node_index ]
+
+    def nodeIndex(self, road_id, section_index, lane_id) -> int:
+        """Return index of node or -1 if lane is not part of graph."""
+        return self._node_dict.get( ( str(road_id), int(section_index), int(lane_id) ), -1 )
+
+    def roadNodes(self, road_id) -> List[ int ]:
+        """Return indexes of nodes belonging to given road."""
+        road_id = str( road_id )
+        return [ index for index, node in enumerate( self.nodes ) if node[0] == road_id ]
+
+    def successors(self, node_index) -> List[ int ]:
+        start = self._indptr_list[ node_index ]
+        end   = self._indptr_list[ node_index + 1 ]
+        return self._indices_list[ start:end ]
+
+    def routeLength(self, path: List[int]):
+        """Return summed length of all lanes of route."""
+        lengths = self._lengths_list
+        return sum( lengths[ item ] for item in path )
+
+    def shortestPath(self, source, target, heuristic=True):
+        """Find shortest route between nodes using A* (or Dijkstra if 'heuristic' is False).
+
+        Returns tuple (route length, list of nodes indexes) or None if there is no route.
+        Route length includes length of 'target' lane.
+        """
+        found = self._search( source, target, heuristic )
+        if found is None:
+            return None
+        return ( found[0] + self._lengths_list[ target ], found[1] )
+
+    def kShortestPaths(self, source, target, k_num, heuristic=True):
+        """Find up to 'k_num' shortest loopless routes using Yen's algorithm.
+
+        Returns list of tuples (route length, list of nodes indexes) sorted by length.
+        """
+        if k_num < 1:
+            return []
+        first = self.shortestPath( source, target, heuristic )
+        if first is None:
+            return []
+        routes     = [ first ]
+        found_set  = { tuple( first[1] ) }
+        candidates = []
+        while len( routes ) < k_num:
+            last_path = routes[-1][1]
+            for spur_index in range( 0, len( last_path ) - 1 ):
+                root_path = last_path[ :spur_index + 1 ]
+                banned_edges = set()
+                for _, path in routes:
+                    if path[ :spur_index + 1 ] == root_path and len( path ) > spur_index + 1:
+                        banned_edges.add( ( path[ spur_index ], path[ spur_index + 1 ] ) )
+                banned_nodes = set( root_path[ :-1 ] )
+                spur = self._search( root_path[-1], target, heuristic, banned_nodes, banned_edges )
+                if spur is None:
+                    continue
+                total_path = root_path[ :-1 ] + spur[1]
+                path_key   = tuple( total_path )
+                if path_key in found_set:
+                    continue
+                found_set.add( path_key )
+                heapq.heappush( candidates, ( self.routeLength( total_path ), total_path ) )
+            if not candidates:
+                break
+            best = heapq.heappop( candidates )
+            routes.append( best )
+        return routes
+
+    def _search(self, source, target, heuristic=True, banned_nodes=None, banned_edges=None):
+        if source == target:
+            return ( 0.0, [ source ] )
+        indptr  = self._indptr_list
+        indices = self._indices_list
+        weights = self._weights_list
+        points_x = self._points_x
+        points_y = self._points_y
+        target_x = points_x[ target ]
+        target_y = points_y[ target ]
+
+        def estimate( node ):
+            if heuristic is False:
+                return 0.0
+            return math.hypot( points_x[ node ] - target_x, points_y[ node ] - target_y )
+
+        dist_dict = { source: 0.0 }
+        prev_dict = {}
+        closed    = set()
+        queue     = [ ( estimate( source ), 0.0, source ) ]
+        while queue:
+            _, curr_dist, curr_node = heapq.heappop( queue )
+            if curr_node == target:
+                path = [ target ]
+                while path[-1] != source:
+                    path.append( prev_dict[ path[-1] ] )
+                path.reverse()
+                return ( curr_dist, path )
+            if curr_node in closed:
+                continue
+            closed.add( curr_node )
+            for edge_index in range( indptr[ curr_node ], indptr[ curr_node + 1 ] ):
+                next_node = indices[ edge_index ]
+                if next_node in closed:
+                    continue
+                if banned_nodes and next_node in banned_nodes:
+                    continue
+                if banned_edges and ( curr_node, next_node ) in banned_edges:
+                    continue
+                next_dist = curr_dist + weights[ edge_index ]
+                if next_dist < dist_dict.get( next_node, math.inf ):
+                    dist_dict[ next_node ] = next_dist
+                    prev_dict[ next_node ] = curr_node
+                    heapq.heappush( queue, ( next_dist + estimate( next_node ), next_dist, next_node ) )
+        return None
+
+
+## ===========================================================
+
+
+def build_lane_graph( opendrive: 'OpenDRIVE', lane_types=DRIVING_LANE_TYPES ) -> LaneGraph:
+    """Build lane graph from road links, lane links and junction connections.
+
+    If 'lane_types' is None, then all lanes (except center lane) are included.
+    """
+    roads_list = opendrive.roads()
+    roads_dict = { road.id(): road for road in roads_list }
+
+    ## (junction id, incoming road id) -> list of (connecting road id, contact point, lane links)
+    connections_dict = {}
+    for junc in opendrive.junctions():
+        for incoming_id, connecting_id, contact_point, lane_links in junc.connectionsData():
+            key = ( junc.id(), incoming_id )
+            connections_dict.setdefault( key, [] ).append( ( connecting_id, contact_point, lane_links ) )
+
+    nodes        = []
+    node_dict    = {}
+    lanes_list   = []
+    lengths      = []
+    entry_points = []
+    for road in roads_list:
+        if not road.get( "lanes", None ):
+            continue
+        road_id = road.id()
+        for section_index, section in enumerate( road.laneSections() ):
+            start_s, end_s = road.laneSectionRange( section_index )
+            for lane in section.lanesList():
+                lane_id = int( lane.id() )
+                if lane_id == 0:
+                    continue
+                if lane_types is not None and lane.type() not in lane_types:
+                    continue
+                node = ( road_id, section_index, lane_id )
+                node_dict[ node ] = len( nodes )
+                nodes.append( node )
+                lanes_list.append( lane )
+                lengths.append( max( end_s - start_s, 0.0 ) )
+                entry_s = start_s if lane_id < 0 else end_s
+                entry_points.append( reference_point( road, entry_s ) )
+
+    def section_by_contact( road_id, contact_point ):
+        if contact_point == "start":
+            return 0
+        next_road = roads_dict.get( road_id, None )
+        if next_road is None or not next_road.get( "lanes", None ):
+            return -1
+        return len( next_road.laneSections() ) - 1
+
+    def road_link_targets( road, lane_id, link_data, lane_link_ids ):
+        if link_data is None:
+            return []
+        elem_type, elem_id, contact_point = link_data
+        if elem_type == "road":
+            section_index = section_by_contact( elem_id, contact_point )
+            return [ ( elem_id, section_index, int(item), contact_point ) for item in lane_link_ids ]
+        if elem_type == "junction":
+            ret_list = []
+            for connecting_id, conn_contact, lane_links in connections_dict.get( ( elem_id, road.id() ), [] ):
+                section_index = section_by_contact( connecting_id, conn_contact )
+                for from_id, to_id in lane_links:
+                    if int( from_id ) == lane_id:
+                        ret_list.append( ( connecting_id, section_index, int(to_id), conn_contact ) )
+            return ret_list
+        return []
+
+    indptr  = [ 0 ]
+    indices = []
+    for node_index, node in enumerate( nodes ):
+        road_id, section_index, lane_id = node
+        road = roads_dict[ road_id ]
+        lane = lanes_list[ node_index ]
+        sections_num = len( road.laneSections() )
+        targets = []
+        if lane_id < 0:
+            ## lane along reference line - exit at end of section
+            if section_index + 1 < sections_num:
+                targets = [ ( road_id, section_index + 1, int(item), "start" ) for item in lane.successorIds() ]
+            else:
+                targets = road_link_targets( road, lane_id, road.successorData(), lane.successorIds() )
+        else:
+            ## lane opposite to reference line - exit at start of section
+            if section_index > 0:
+                targets = [ ( road_id, section_index - 1, int(item), "end" ) for item in lane.predecessorIds() ]
+            else:
+                targets = road_link_targets( road, lane_id, road.predecessorData(), lane.predecessorIds() )
+
+        next_set = set()
+        for next_road, next_section, next_lane, contact_point in targets:
+            ## target lane have to be entered from given contact point
+            if contact_point == "start" and next_lane > 0:
+                continue
+            if contact_point == "end" and next_lane < 0:
+                continue
+            next_index = node_dict.get( ( next_road, next_section, next_lane ), -1 )
+            if next_index < 0:
+                continue
+            next_set.add( next_index )
+        indices.extend( sorted( next_set ) )
+        indptr.append( len( indices ) )
+
+    return LaneGraph( nodes, lengths, entry_points, indptr, indices )
+
+
+def reference_point( road: 'Road', offset_on_road ):
+    """Return tuple (x, y) of point on reference line of road."""
+    geom = road.geometryByOffset( offset_on_road )
+    if geom is None:
+        return ( 0.0, 0.0 )
+    point = geom.positionByOffsetRaw( offset_on_road - geom.offset() )
+    return ( float( point.x ), float( point.y ) )
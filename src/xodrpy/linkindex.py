@@ -0,0 +1,224 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import logging
+import json
+from typing import List, Dict, Tuple, TYPE_CHECKING
+
+from xodrpy.snapshot import file_hash, snapshot_path
+from xodrpy.xodr import load as load_xodr
+from xodrpy.rrdata import load_stream as load_rrdata
+
+if TYPE_CHECKING:
+    from xodrpy.rrdata import RRMetadata
+    from xodrpy.types import OpenDRIVE, RoadSignalReference
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## version of serialized index layout
+LINK_INDEX_VERSION = 1
+
+## extension of link index file stored in cache directory
+LINK_INDEX_EXTENSION = ".links.json"
+
+
+## ===========================================================
+
+
+##
+class LinkIndex():
+    """Mapping between identifiers of XODR file and RoadRunner metadata file.
+
+    Index consists of:
+        - RR signal UUID <-> XODR signal id,
+        - RR junction UUID <-> XODR junction id (several RR junctions can match one XODR junction),
+        - gate UUID <-> signal reference given as tuple (road id, signal id, reference catalog index).
+
+    Hashes of content of source files are stored to detect outdated index.
+    """
+
+    def __init__(self, xodr_hash=None, rrdata_hash=None):
+        self.xodr_hash   = xodr_hash
+        self.rrdata_hash = rrdata_hash
+        self.signal_ids: Dict[ str, str ]   = {}         ## signal UUID -> signal id
+        self.signal_uuids: Dict[ str, str ] = {}         ## signal id -> signal UUID
+        self.junction_ids: Dict[ str, str ] = {}         ## RR junction UUID -> junction id
+        self.junction_uuids: Dict[ str, List[ str ] ] = {}     ## junction id -> RR junctions UUIDs
+        self.gates: Dict[ str, Tuple[ str, str, int ] ] = {}   ## gate UUID -> reference tuple
+        self.reference_gates: Dict[ Tuple[ str, str ], List[ str ] ] = {}    ## (road id, signal id) -> gates UUIDs
+
+    def signalId(self, signal_uuid) -> str:
+        return self.signal_ids.get( signal_uuid, None )
+
+    def signalUUID(self, signal_id) -> str:
+        return self.signal_uuids.get( signal_id, None )
+
+    def junctionId(self, junction_uuid) -> str:
+        """Return id of XODR junction matching RR junction or None."""
+        return self.junction_ids.get( junction_uuid, None )
+
+    def junctionUUIDs(self, junction_id) -> List[ str ]:
+        return self.junction_uuids.get( junction_id, [] )
+
+    def gateReference(self, gate_uuid) -> Tuple[ str, str, int ]:
+        """Return tuple (road id, signal id, reference catalog index) or None."""
+        return self.gates.get( gate_uuid, None )
+
+    def gateUUIDs(self, road_id, signal_id) -> List[ str ]:
+        """Return gates UUIDs of signal references of given signal placed on given road."""
+        return self.reference_gates.get( ( road_id, signal_id ), [] )
+
+    def signalReference(self, opendrive: 'OpenDRIVE', gate_uuid) -> 'RoadSignalReference':
+        """Return signal reference element of gate."""
+        reference = self.gates.get( gate_uuid, None )
+        if reference is None:
+            return None
+        return opendrive.mapIndex().references_list[ reference[2] ]
+
+    def isValid(self, xodr_hash, rrdata_hash):
+        return self.xodr_hash == xodr_hash and self.rrdata_hash == rrdata_hash
+
+    ## ==============================================
+
+    def addSignal(self, signal_uuid, signal_id):
+        self.signal_ids.setdefault( signal_uuid, signal_id )
+        self.signal_uuids.setdefault( signal_id, signal_uuid )
+
+    def addJunction(self, junction_uuid, junction_id):
+        self.junction_ids[ junction_uuid ] = junction_id
+        self.junction_uuids.setdefault( junction_id, [] ).append( junction_uuid )
+
+    def addGate(self, gate_uuid, road_id, signal_id, reference_index):
+        self.gates.setdefault( gate_uuid, ( road_id, signal_id, reference_index ) )
+        self.reference_gates.setdefault( ( road_id, signal_id ), [] ).append( gate_uuid )
+
+    ## ==============================================
+
+    def toDict(self):
+        return { "version":     LINK_INDEX_VERSION,
+                 "xodr_hash":   self.xodr_hash,
+                 "rrdata_hash": self.rrdata_hash,
+                 "signals":     self.signal_ids,
+                 "junctions":   self.junction_ids,
+                 "gates":       self.gates }
+
+    def save(self, index_path):
+        """Store index in JSON file."""
+        index_dir = os.path.dirname( os.path.abspath( index_path ) )
+        os.makedirs( index_dir, exist_ok=True )
+        temp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open( temp_path, 'w', encoding="utf-8" ) as out_file:
+            json.dump( self.toDict(), out_file, separators=( ",", ":" ) )
+        os.replace( temp_path, index_path )
+
+
+## ===========================================================
+
+
+def index_from_dict( data_dict ) -> LinkIndex:
+    index = LinkIndex( data_dict.get( "xodr_hash" ), data_dict.get( "rrdata_hash" ) )
+    for signal_uuid, signal_id in data_dict.get( "signals", {} ).items():
+        index.addSignal( signal_uuid, signal_id )
+    for junction_uuid, junction_id in data_dict.get( "junctions", {} ).items():
+        index.addJunction( junction_uuid, junction_id )
+    for gate_uuid, reference in data_dict.get( "gates", {} ).items():
+        index.addGate( gate_uuid, reference[0], reference[1], int( reference[2] ) )
+    return index
+
+
+def build_link_index( opendrive: 'OpenDRIVE', metadata: 'RRMetadata', xodr_hash=None, rrdata_hash=None ) -> LinkIndex:
+    """Build index matching elements of XODR and RR metadata."""
+    index = LinkIndex( xodr_hash, rrdata_hash )
+    map_index = opendrive.mapIndex()
+    for signal_uuid, signal in map_index.signals_uuid.items():
+        signal_id = signal.get( "@id", None )
+        if signal_id is not None:
+            index.addSignal( signal_uuid, signal_id )
+    for ref_index in map_index.gate_indexes:
+        index.addGate( map_index.reference_gates[ ref_index ], map_index.reference_roads[ ref_index ],
+                       map_index.reference_ids[ ref_index ], ref_index )
+    ## junctions are matched by heuristic of RRMetadata
+    for junc_data in metadata.getPhasesDict( opendrive ):
+        if junc_data[ "id" ] is not None:
+            index.addJunction( junc_data[ "uuid" ], junc_data[ "id" ] )
+    return index
+
+
+def load_link_index( index_path, xodr_path=None, rrdata_path=None ) -> LinkIndex:
+    """Load index from file.
+
+    If paths of source files are given, then index is validated against content hashes
+    of the files. Return None if index does not exist, is invalid or is outdated.
+    """
+    if not os.path.isfile( index_path ):
+        return None
+    try:
+        with open( index_path, 'r', encoding="utf-8" ) as in_file:
+            data_dict = json.load( in_file )
+        if data_dict.get( "version" ) != LINK_INDEX_VERSION:
+            return None
+        index = index_from_dict( data_dict )
+    except ( OSError, ValueError, TypeError, IndexError, AttributeError ) as exc:
+        _LOGGER.warning( "unable to load link index %s: %s", index_path, exc )
+        return None
+    if xodr_path is not None and index.xodr_hash != file_hash( xodr_path ):
+        return None
+    if rrdata_path is not None and index.rrdata_hash != file_hash( rrdata_path ):
+        return None
+    return index
+
+
+def cached_link_index( xodr_path, rrdata_path, index_path=None,
+                       opendrive: 'OpenDRIVE' = None, metadata: 'RRMetadata' = None, cache_dir=None ) -> LinkIndex:
+    """Return index loaded from 'index_path' if up to date, otherwise build and store new index.
+
+    Sources are loaded only if index have to be rebuilt and objects are not given.
+    If 'index_path' is not given, then index is stored in 'cache_dir' (see 'snapshot.snapshot_path()').
+    If none of them is given, then index is built and not stored.
+    """
+    if index_path is None and cache_dir is not None:
+        index_path = snapshot_path( rrdata_path, cache_dir, LINK_INDEX_EXTENSION )
+    xodr_hash   = file_hash( xodr_path )
+    rrdata_hash = file_hash( rrdata_path )
+    if index_path is not None:
+        index = load_link_index( index_path )
+        if index is not None and index.isValid( xodr_hash, rrdata_hash ):
+            return index
+
+    if opendrive is None:
+        opendrive = load_xodr( xodr_path )
+    if metadata is None:
+        metadata = load_rrdata( rrdata_path )
+    index = build_link_index( opendrive, metadata, xodr_hash, rrdata_hash )
+    if index_path is None:
+        return index
+    try:
+        index.save( index_path )
+    except OSError as exc:
+        _LOGGER.warning( "unable to store link index %s: %s", index_path, exc )
+    return index
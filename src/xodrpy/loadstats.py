@@ -0,0 +1,176 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import sys
+import time
+import logging
+from typing import Dict, Tuple, Callable, Any, TYPE_CHECKING
+
+import xmltodict
+
+from xodrpy.dicttoobject import ConvertTraverser, BaseElementConverter
+from xodrpy.xodr import create_lookup
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## ===========================================================
+
+
+##
+class LoadStats():
+    """Statistics of loading map gathered by 'load_with_stats()'.
+
+    Times are in seconds. Allocations are numbers of memory blocks allocated by interpreter
+    ('sys.getallocatedblocks()' difference). Converter time does not include converting of nested elements.
+    """
+
+    def __init__(self):
+        self.stages: Dict[ str, float ] = {}                ## stage name -> wall time
+        self.allocations: Dict[ str, int ] = {}             ## stage name -> allocated blocks
+        self.node_counts: Dict[ str, int ] = {}             ## element path -> number of nodes
+        self.lookup_calls = 0
+        self.lookup_time  = 0.0
+        self.converter_calls: Dict[ str, int ] = {}         ## converter name -> number of calls
+        self.converter_times: Dict[ str, float ] = {}       ## converter name -> total time
+
+    def totalTime(self):
+        return sum( self.stages.values() )
+
+    def nodesNumber(self):
+        return sum( self.node_counts.values() )
+
+    def startStage(self):
+        return ( time.perf_counter(), sys.getallocatedblocks() )
+
+    def endStage(self, name, start_data):
+        start_time, start_blocks = start_data
+        self.stages[ name ]      = self.stages.get( name, 0.0 ) + time.perf_counter() - start_time
+        self.allocations[ name ] = self.allocations.get( name, 0 ) + sys.getallocatedblocks() - start_blocks
+
+    def addNode(self, path: Tuple[ str, ... ]):
+        key = "/".join( str( item ) for item in path )
+        self.node_counts[ key ] = self.node_counts.get( key, 0 ) + 1
+
+    def addLookup(self, duration):
+        self.lookup_calls += 1
+        self.lookup_time  += duration
+
+    def addConverterCall(self, name, duration):
+        self.converter_calls[ name ] = self.converter_calls.get( name, 0 ) + 1
+        self.converter_times[ name ] = self.converter_times.get( name, 0.0 ) + duration
+
+    def toDict(self):
+        return { "stages":          dict( self.stages ),
+                 "allocations":     dict( self.allocations ),
+                 "node_counts":     dict( self.node_counts ),
+                 "lookup_calls":    self.lookup_calls,
+                 "lookup_time":     self.lookup_time,
+                 "converter_calls": dict( self.converter_calls ),
+                 "converter_times": dict( self.converter_times ) }
+
+    def report(self, nodes_limit=10) -> str:
+        """Return human readable summary."""
+        lines = [ f"total time: {self.totalTime():.6f}s" ]
+        for name, value in self.stages.items():
+            lines.append( f"  stage {name:10} {value:.6f}s  allocated blocks: {self.allocations.get( name, 0 )}" )
+        lines.append( f"  path lookups: {self.lookup_calls} calls {self.lookup_time:.6f}s" )
+        for name, value in sorted( self.converter_times.items(), key=lambda item: -item[1] ):
+            lines.append( f"  converter {name:24} {self.converter_calls[ name ]:8} calls {value:.6f}s" )
+        lines.append( f"  nodes: {self.nodesNumber()}" )
+        nodes_list = sorted( self.node_counts.items(), key=lambda item: -item[1] )
+        for path, counter in nodes_list[ :nodes_limit ]:
+            lines.append( f"    {counter:8} {path}" )
+        return "\n".join( lines )
+
+    def log(self, level=logging.INFO):
+        _LOGGER.log( level, "map load statistics:\n%s", self.report() )
+
+
+##
+class InstrumentedConvertTraverser( ConvertTraverser ):
+    """Converter traverser gathering statistics. Used instead of base class only when stats are requested."""
+
+    def __init__(self, lookup, stats: LoadStats):
+        super().__init__( lookup )
+        self.stats = stats
+
+    def _traversePost( self, data_container, data_key, data_value ):
+        if self.lookup is None:
+            return
+        stats = self.stats
+        stats.addNode( self.curr_path )
+        start_time = time.perf_counter()
+        converter: Callable[ [Dict], Any ] = self.lookup.lookupConverter( self.curr_path )
+        lookup_end = time.perf_counter()
+        stats.addLookup( lookup_end - start_time )
+        if converter is None:
+            return
+        result = converter( data_value )
+        stats.addConverterCall( converter_name( converter ), time.perf_counter() - lookup_end )
+        data_container[ data_key ] = result
+
+
+def converter_name( converter ):
+    if isinstance( converter, BaseElementConverter ):
+        if converter.class_type is None:
+            return "None"
+        return converter.class_type.__name__
+    return getattr( converter, "__name__", type( converter ).__name__ )
+
+
+## ===========================================================
+
+
+def load_with_stats( xodr_path, log_level=None ) -> Tuple[ 'OpenDRIVE', LoadStats ]:
+    """Load map the same way as 'xodr.load()' gathering statistics of each stage.
+
+    Return tuple (OpenDRIVE, LoadStats). If 'log_level' is given then statistics are logged.
+    """
+    stats = LoadStats()
+
+    stage_data = stats.startStage()
+    with open( xodr_path, 'r', encoding="utf-8" ) as xodr_file:
+        content = xodr_file.read()
+    stats.endStage( "read", stage_data )
+
+    stage_data = stats.startStage()
+    data_dict = xmltodict.parse( content )
+    stats.endStage( "parse", stage_data )
+    del content
+
+    stage_data = stats.startStage()
+    traverser = InstrumentedConvertTraverser( create_lookup(), stats )
+    traverser.convert( data_dict )
+    stats.endStage( "convert", stage_data )
+
+    if log_level is not None:
+        stats.log( log_level )
+    return ( data_dict[ "OpenDRIVE" ], stats )
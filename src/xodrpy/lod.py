@@ -0,0 +1,185 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import logging
+from typing import List, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from xodrpy.types import Road
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## step of approximation of reference line (base level)
+BASE_STEP = 1.0
+
+## tolerances [m] of simplification levels (level 0 is base approximation)
+LOD_TOLERANCES = ( 0.0, 0.02, 0.1, 0.5, 2.0, 10.0 )
+
+## maximal allowed error of rendered line in pixels
+PIXEL_TOLERANCE = 0.5
+
+
+## ===========================================================
+
+
+##
+class PolylineLOD():
+    """Levels of detail of polylines approximating reference line of road.
+
+    Each level is list of polylines (numpy arrays of shape (N, 2)). Contiguous geometries
+    are merged into single polyline. Level of index 'i' deviates from base approximation
+    by at most 'tolerances[i]'.
+    """
+
+    def __init__(self, base_strips: List[ np.ndarray ], tolerances=LOD_TOLERANCES):
+        self.tolerances = tuple( tolerances )
+        self.levels: List[ List[ np.ndarray ] ] = []
+        for tolerance in self.tolerances:
+            if tolerance <= 0.0:
+                self.levels.append( base_strips )
+                continue
+            level_strips = []
+            for strip in base_strips:
+                indexes = simplify_polyline( strip, tolerance )
+                level_strips.append( strip[ indexes ] )
+            self.levels.append( level_strips )
+
+    def levelsNumber(self):
+        return len( self.levels )
+
+    def strips(self, level) -> List[ np.ndarray ]:
+        return self.levels[ level ]
+
+    def pointsNumber(self, level):
+        return sum( len( strip ) for strip in self.levels[ level ] )
+
+    def levelByScale(self, scale) -> int:
+        """Return index of level for output scale given in pixels per meter (see 'select_level()')."""
+        return select_level( self.tolerances, scale )
+
+    def stripsByScale(self, scale) -> List[ np.ndarray ]:
+        return self.levels[ self.levelByScale( scale ) ]
+
+
+## ===========================================================
+
+
+def build_road_lod( road: 'Road', step=BASE_STEP, tolerances=LOD_TOLERANCES ) -> PolylineLOD:
+    """Approximate reference line of road and calculate simplification levels."""
+    base_strips = road_strips( road, step )
+    return PolylineLOD( base_strips, tolerances )
+
+
+def road_strips_by_scale( road: 'Road', scale, step=BASE_STEP, tolerances=LOD_TOLERANCES ) -> List[ np.ndarray ]:
+    """Return polylines of single level suitable for given scale (see 'select_level()').
+
+    Other levels are not calculated and nothing is cached in road.
+    """
+    base_strips = road_strips( road, step )
+    tolerance   = tolerances[ select_level( tolerances, scale ) ]
+    if tolerance <= 0.0:
+        return base_strips
+    return [ strip[ simplify_polyline( strip, tolerance ) ] for strip in base_strips ]
+
+
+def road_strips( road: 'Road', step=BASE_STEP ) -> List[ np.ndarray ]:
+    """Approximate reference line of road. Contiguous geometries are merged into single polyline."""
+    base_strips = []
+    curr_strip  = []
+    for geom in road.geometries():
+        points = geom.lineApprox( step )
+        points = [ ( point.x, point.y ) for point in points ]
+        if not points:
+            continue
+        if curr_strip and np.hypot( curr_strip[-1][0] - points[0][0], curr_strip[-1][1] - points[0][1] ) < 1.0e-6:
+            ## geometry continues previous one
+            curr_strip.extend( points[1:] )
+            continue
+        if curr_strip:
+            base_strips.append( np.array( curr_strip, dtype=np.float64 ) )
+        curr_strip = points
+    if curr_strip:
+        base_strips.append( np.array( curr_strip, dtype=np.float64 ) )
+    return base_strips
+
+
+def select_level( tolerances, scale ) -> int:
+    """Return index of coarsest level with tolerance not exceeding 'PIXEL_TOLERANCE' in given scale [px/m].
+
+    If 'scale' is None, then base level is returned.
+    """
+    if scale is None or scale <= 0.0:
+        return 0
+    max_error = PIXEL_TOLERANCE / scale
+    ret_level = 0
+    for level, tolerance in enumerate( tolerances ):
+        if tolerance <= max_error:
+            ret_level = level
+    return ret_level
+
+
+def simplify_polyline( points: np.ndarray, tolerance ) -> np.ndarray:
+    """Simplify polyline using Douglas-Peucker algorithm.
+
+    Return sorted array of indexes of kept points (first and last point are always kept).
+    """
+    points_num = len( points )
+    if points_num < 3 or tolerance <= 0.0:
+        return np.arange( points_num )
+    keep = np.zeros( points_num, dtype=bool )
+    keep[0]  = True
+    keep[-1] = True
+    stack = [ ( 0, points_num - 1 ) ]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        inner = points[ start + 1:end ]
+        distances = segment_distances( inner, points[ start ], points[ end ] )
+        max_index = int( np.argmax( distances ) )
+        if distances[ max_index ] <= tolerance:
+            continue
+        split = start + 1 + max_index
+        keep[ split ] = True
+        stack.append( ( start, split ) )
+        stack.append( ( split, end ) )
+    return np.nonzero( keep )[0]
+
+
+def segment_distances( points: np.ndarray, seg_start, seg_end ) -> np.ndarray:
+    """Return distances of points from segment."""
+    direction = seg_end - seg_start
+    length2   = float( direction.dot( direction ) )
+    relative  = points - seg_start
+    if length2 <= 0.0:
+        return np.hypot( relative[:, 0], relative[:, 1] )
+    ratio   = np.clip( relative.dot( direction ) / length2, 0.0, 1.0 )
+    nearest = relative - ratio[:, None] * direction
+    return np.hypot( nearest[:, 0], nearest[:, 1] )
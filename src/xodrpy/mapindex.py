@@ -0,0 +1,150 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import os
+import logging
+from typing import List, Dict, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE, Road, RoadSignal, RoadSignalReference, RoadObject, SignalController
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## ===========================================================
+
+
+##
+class MapIndex():
+    """Hash lookups and flat catalog of map elements.
+
+    Lookups map ids and RoadRunner UUIDs to elements. In case of duplicated identifiers
+    the first element (in order of data) is indexed, so lookups give the same results
+    as linear scans.
+
+    Catalog consists of tuples aligned by element index, e.g. 'signal_roads[i]' is owner
+    of 'signals_list[i]'. Tuples are shared, so they should not be modified.
+    """
+
+    def __init__(self):
+        ## lookups
+        self.roads: Dict[ str, 'Road' ] = {}
+        self.signals: Dict[ str, 'RoadSignal' ] = {}
+        self.signals_uuid: Dict[ str, 'RoadSignal' ] = {}
+        self.references: Dict[ str, List[ 'RoadSignalReference' ] ] = {}
+        self.references_uuid: Dict[ str, List[ 'RoadSignalReference' ] ] = {}
+        self.objects: Dict[ str, 'RoadObject' ] = {}
+        self.controllers: Dict[ str, 'SignalController' ] = {}
+
+        ## catalog
+        self.signals_list: Tuple[ 'RoadSignal', ...] = ()
+        self.signal_roads: Tuple[ str, ...] = ()
+        self.signal_ids: Tuple[ str, ...] = ()
+        self.signal_uuids: Tuple[ str, ...] = ()
+        self.references_list: Tuple[ 'RoadSignalReference', ...] = ()
+        self.reference_roads: Tuple[ str, ...] = ()
+        self.reference_ids: Tuple[ str, ...] = ()
+        self.reference_uuids: Tuple[ str, ...] = ()
+        self.reference_gates: Tuple[ str, ...] = ()
+        self.objects_list: Tuple[ 'RoadObject', ...] = ()
+        self.object_roads: Tuple[ str, ...] = ()
+        self.object_ids: Tuple[ str, ...] = ()
+
+        ## catalog indexes of references having gate UUID
+        self.gate_indexes: Tuple[ int, ...] = ()
+
+
+def build_map_index( opendrive: 'OpenDRIVE' ) -> MapIndex:
+    """Build index and catalog in single pass over roads."""
+    index = MapIndex()
+
+    signals_list    = []
+    signal_roads    = []
+    signal_ids      = []
+    signal_uuids    = []
+    references_list = []
+    reference_roads = []
+    reference_ids   = []
+    reference_uuids = []
+    reference_gates = []
+    objects_list    = []
+    object_roads    = []
+    object_ids      = []
+
+    for road in opendrive.roads():
+        road_id = road.id()
+        index.roads.setdefault( road_id, road )
+
+        for sig in road.signalsList():
+            sig_id   = sig.get( "@id", None )
+            sig_uuid = sig.uuid()
+            if sig_id is not None:
+                index.signals.setdefault( sig_id, sig )
+            if sig_uuid is not None:
+                index.signals_uuid.setdefault( sig_uuid, sig )
+            signals_list.append( sig )
+            signal_roads.append( road_id )
+            signal_ids.append( sig_id )
+            signal_uuids.append( sig_uuid )
+
+        for sig in road.signalReferencesList():
+            sig_id   = sig.id()
+            sig_uuid = sig.uuid()
+            index.references.setdefault( sig_id, [] ).append( sig )
+            index.references_uuid.setdefault( sig_uuid, [] ).append( sig )
+            references_list.append( sig )
+            reference_roads.append( road_id )
+            reference_ids.append( sig_id )
+            reference_uuids.append( sig_uuid )
+            reference_gates.append( sig.gateUUID() )
+
+        for obj in road.objectsList():
+            obj_id = obj.get( "@id", None )
+            if obj_id is not None:
+                index.objects.setdefault( obj_id, obj )
+            objects_list.append( obj )
+            object_roads.append( road_id )
+            object_ids.append( obj_id )
+
+    for controller in opendrive.controllers():
+        index.controllers.setdefault( controller.id(), controller )
+
+    index.signals_list    = tuple( signals_list )
+    index.signal_roads    = tuple( signal_roads )
+    index.signal_ids      = tuple( signal_ids )
+    index.signal_uuids    = tuple( signal_uuids )
+    index.references_list = tuple( references_list )
+    index.reference_roads = tuple( reference_roads )
+    index.reference_ids   = tuple( reference_ids )
+    index.reference_uuids = tuple( reference_uuids )
+    index.reference_gates = tuple( reference_gates )
+    index.objects_list    = tuple( objects_list )
+    index.object_roads    = tuple( object_roads )
+    index.object_ids      = tuple( object_ids )
+    index.gate_indexes    = tuple( i for i, gate_id in enumerate( reference_gates ) if gate_id )
+    return index
@@ -0,0 +1,139 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import logging
+from typing import Dict
+from xml.etree import ElementTree
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## elements of root of map - nested elements of the same tag (e.g. 'controller' of 'junction')
+## are counted under key "<parent tag>/<tag>"
+TOP_LEVEL_TAGS = ( "header", "road", "controller", "junction", "junctionGroup", "station" )
+
+
+## ===========================================================
+
+
+##
+class MapSummary():
+    """Header data and aggregate statistics of map gathered by 'scan()' without building map objects."""
+
+    def __init__(self):
+        self.header: Dict[ str, str ] = {}          ## attributes of 'header' element
+        self.counts: Dict[ str, int ]  = {}         ## element tag -> number of elements (see 'TOP_LEVEL_TAGS')
+        self.roads_length = 0.0                     ## sum of 'length' attribute of roads
+        self.min_pos = None                         ## (x, y) of minimal start point of geometries
+        self.max_pos = None
+
+    def getStandardVesion(self):
+        major = self.header.get( "revMajor", None )
+        minor = self.header.get( "revMinor", None )
+        if major is None or minor is None:
+            return "unknown"
+        return f"{major}.{minor}"
+
+    def getDataVesion(self):
+        return self.header.get( "version", "unknown" )
+
+    def count(self, tag):
+        return self.counts.get( tag, 0 )
+
+    def roadsNumber(self):
+        return self.count( "road" )
+
+    def junctionsNumber(self):
+        return self.count( "junction" )
+
+    def boundingBox(self):
+        """Return approximate extent ( (min x, min y), (max x, max y) ) based on start points of geometries."""
+        return ( self.min_pos, self.max_pos )
+
+    def toDict(self):
+        return { "header":         dict( self.header ),
+                 "counts":         dict( self.counts ),
+                 "roads_length":   self.roads_length,
+                 "bbox":           self.boundingBox(),
+                 "standard":       self.getStandardVesion(),
+                 "version":        self.getDataVesion() }
+
+
+## ===========================================================
+
+
+def scan( xodr_path ) -> MapSummary:
+    """Read header and statistics of map in single pass of incremental parser.
+
+    Elements are released just after they are read, so memory usage does not depend on map size.
+    """
+    summary = MapSummary()
+    counts = summary.counts
+    min_x = min_y = float( "inf" )
+    max_x = max_y = float( "-inf" )
+    depth = 0
+    root_elem = None
+    tags_stack = []
+    for event, elem in ElementTree.iterparse( xodr_path, events=( "start", "end" ) ):
+        if event == "start":
+            depth += 1
+            tag = elem.tag
+            key = tag
+            if depth > 2 and tag in TOP_LEVEL_TAGS:
+                key = f"{tags_stack[-1]}/{tag}"
+            counts[ key ] = counts.get( key, 0 ) + 1
+            tags_stack.append( tag )
+            if depth == 1:
+                root_elem = elem
+            elif tag == "geometry":
+                x_coord = float( elem.get( "x", 0.0 ) )
+                y_coord = float( elem.get( "y", 0.0 ) )
+                min_x = min( min_x, x_coord )
+                min_y = min( min_y, y_coord )
+                max_x = max( max_x, x_coord )
+                max_y = max( max_y, y_coord )
+            elif depth == 2:
+                if tag == "road":
+                    summary.roads_length += float( elem.get( "length", 0.0 ) )
+                elif tag == "header":
+                    summary.header = dict( elem.attrib )
+            continue
+        depth -= 1
+        tags_stack.pop()
+        if depth == 1:
+            ## top level element read - drop it
+            elem.clear()
+            root_elem.remove( elem )
+
+    root_tag = "OpenDRIVE"
+    if root_elem is not None:
+        root_tag = root_elem.tag
+    counts.pop( root_tag, None )
+    if min_x <= max_x:
+        summary.min_pos = ( min_x, min_y )
+        summary.max_pos = ( max_x, max_y )
+    return summary
@@ -0,0 +1,429 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import os
+import logging
+from typing import List, Dict, TYPE_CHECKING
+
+import math
+import numpy as np
+
+from xodrpy.OdrSpiral import OdrSpiral
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE, GeometryBase
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## values of 'MapTables.geom_type'
+GEOM_LINE   = 0
+GEOM_ARC    = 1
+GEOM_SPIRAL = 2
+
+## curvature below the value is treated as straight line
+MIN_CURVATURE = 0.00001
+
+## names of numpy arrays of 'MapTables'
+TABLE_ARRAYS = ( "road_length",
+                 "geom_offsets", "geom_s", "geom_x", "geom_y", "geom_hdg", "geom_length", "geom_type",
+                 "geom_curv_start", "geom_curv_end",
+                 "elev_offsets", "elev_s", "elev_coeffs" )
+
+
+## ===========================================================
+
+
+##
+class MapTables():
+    """Plan view and elevation profile of all roads compiled into flat numpy arrays.
+
+    Items of road with index 'i' are stored in range '[ geom_offsets[i], geom_offsets[i + 1] )'
+    of 'geom_*' arrays (and respectively in range of 'elev_offsets' for 'elev_*' arrays).
+    """
+
+    def __init__(self):
+        self.road_ids: List[ str ] = []
+        self.road_index: Dict[ str, int ] = {}
+        self.road_length = np.zeros( 0 )
+
+        self.geom_offsets    = np.zeros( 1, dtype=np.int64 )
+        self.geom_s          = np.zeros( 0 )
+        self.geom_x          = np.zeros( 0 )
+        self.geom_y          = np.zeros( 0 )
+        self.geom_hdg        = np.zeros( 0 )
+        self.geom_length     = np.zeros( 0 )
+        self.geom_type       = np.zeros( 0, dtype=np.int8 )
+        self.geom_curv_start = np.zeros( 0 )
+        self.geom_curv_end   = np.zeros( 0 )
+
+        self.elev_offsets = np.zeros( 1, dtype=np.int64 )
+        self.elev_s       = np.zeros( 0 )
+        self.elev_coeffs  = np.zeros( (0, 4) )          ## polynomial coefficients (a, b, c, d)
+
+        ## object owning memory of arrays if they are not owned by numpy (e.g. shared memory block)
+        self.buffer_owner = None
+
+    def roadsNumber(self):
+        return len( self.road_ids )
+
+    def roadIndexes(self, road_ids) -> np.ndarray:
+        """Convert list of road ids to array of road indexes (-1 for unknown roads)."""
+        return np.array( [ self.road_index.get( item, -1 ) for item in road_ids ], dtype=np.int64 )
+
+    def geometryIndexes(self, road_indexes, s_coords) -> np.ndarray:
+        """Return indexes of geometries containing given points (-1 for roads without geometry)."""
+        return find_items( self.geom_offsets, self.geom_s, road_indexes, s_coords )
+
+    def elevationIndexes(self, road_indexes, s_coords) -> np.ndarray:
+        return find_items( self.elev_offsets, self.elev_s, road_indexes, s_coords )
+
+    def headings(self, road_indexes, s_coords) -> np.ndarray:
+        """Return heading of reference line in given points."""
+        road_indexes = np.asarray( road_indexes, dtype=np.int64 )
+        s_coords     = np.asarray( s_coords, dtype=np.float64 )
+        geom_indexes = self.geometryIndexes( road_indexes, s_coords )
+        return self._headings( geom_indexes, s_coords )
+
+    def elevations(self, road_indexes, s_coords) -> np.ndarray:
+        road_indexes = np.asarray( road_indexes, dtype=np.int64 )
+        s_coords     = np.asarray( s_coords, dtype=np.float64 )
+        elev_indexes = self.elevationIndexes( road_indexes, s_coords )
+        ret_values   = np.zeros( len( s_coords ) )
+        valid = elev_indexes >= 0
+        if valid.any():
+            items  = elev_indexes[ valid ]
+            ds     = s_coords[ valid ] - self.elev_s[ items ]
+            coeffs = self.elev_coeffs[ items ]
+            ret_values[ valid ] = coeffs[:, 0] + ds * ( coeffs[:, 1] + ds * ( coeffs[:, 2] + ds * coeffs[:, 3] ) )
+        return ret_values
+
+    def positions(self, road_indexes, s_coords, t_coords, z_coords=None):
+        """Calculate world positions of points given in track coordinates.
+
+        Returns tuple: (N, 3) array of positions and (N,) array of reference line headings.
+        Rows of points on unknown roads are filled with NaN.
+        """
+        road_indexes = np.asarray( road_indexes, dtype=np.int64 )
+        s_coords     = np.asarray( s_coords, dtype=np.float64 )
+        t_coords     = np.asarray( t_coords, dtype=np.float64 )
+        geom_indexes = self.geometryIndexes( road_indexes, s_coords )
+
+        points_num = len( s_coords )
+        positions  = np.full( ( points_num, 3 ), np.nan )
+        headings   = np.full( points_num, np.nan )
+        valid = geom_indexes >= 0
+        if not valid.any():
+            return ( positions, headings )
+
+        items    = geom_indexes[ valid ]
+        s_valid  = s_coords[ valid ]
+        ref_x, ref_y = self._referencePoints( items, s_valid )
+        hdg = self._headings( items, s_valid )
+        t_valid  = t_coords[ valid ]
+        positions[ valid, 0 ] = ref_x - t_valid * np.sin( hdg )
+        positions[ valid, 1 ] = ref_y + t_valid * np.cos( hdg )
+        elevation = self.elevations( road_indexes[ valid ], s_valid )
+        if z_coords is not None:
+            elevation += np.asarray( z_coords, dtype=np.float64 )[ valid ]
+        positions[ valid, 2 ] = elevation
+        headings[ valid ] = hdg
+        return ( positions, headings )
+
+    def project(self, road_indexes, points_x, points_y, step=2.0, iterations=4):
+        """Project world points (X, Y) on reference lines of given roads (inverse of 'positions()').
+
+        Returns tuple of arrays (s, t) of track coordinates. Offset 's' is clamped to range of road,
+        so for points beyond ends of road 't' is lateral offset from end of reference line.
+        Rows of points on unknown roads are filled with NaN.
+
+        Nearest sample of reference line (taken with 'step') is refined with Newton iterations.
+        """
+        road_indexes = np.asarray( road_indexes, dtype=np.int64 )
+        points_x     = np.asarray( points_x, dtype=np.float64 )
+        points_y     = np.asarray( points_y, dtype=np.float64 )
+        points_num   = len( points_x )
+        s_coords     = np.full( points_num, np.nan )
+        t_coords     = np.full( points_num, np.nan )
+        roads_num    = len( self.road_ids )
+        known = ( road_indexes >= 0 ) & ( road_indexes < roads_num )
+        if known.any():
+            known[ known ] = self.geom_offsets[ road_indexes[ known ] + 1 ] > self.geom_offsets[ road_indexes[ known ] ]
+        if not known.any():
+            return ( s_coords, t_coords )
+
+        ## initial guess - nearest sample of reference line
+        for road_index in np.unique( road_indexes[ known ] ).tolist():
+            points = np.nonzero( known & ( road_indexes == road_index ) )[0]
+            length = float( self.road_length[ road_index ] )
+            samples_s = np.linspace( 0.0, length, max( int( math.ceil( length / step ) ) + 1, 2 ) )
+            sample_roads = np.full( len( samples_s ), road_index, dtype=np.int64 )
+            samples_x, samples_y = self._referencePoints( self.geometryIndexes( sample_roads, samples_s ), samples_s )
+            ## limit size of distances matrix
+            chunk_size = max( 1000000 // len( samples_s ), 1 )
+            for chunk_start in range( 0, len( points ), chunk_size ):
+                chunk = points[ chunk_start:chunk_start + chunk_size ]
+                diff_x = points_x[ chunk, None ] - samples_x[ None, : ]
+                diff_y = points_y[ chunk, None ] - samples_y[ None, : ]
+                nearest = np.argmin( diff_x * diff_x + diff_y * diff_y, axis=1 )
+                s_coords[ chunk ] = samples_s[ nearest ]
+
+        items    = road_indexes[ known ]
+        s_valid  = s_coords[ known ]
+        x_valid  = points_x[ known ]
+        y_valid  = points_y[ known ]
+        length   = self.road_length[ items ]
+        for _ in range( iterations ):
+            along, t_valid, geom_indexes = self._trackOffsets( items, s_valid, x_valid, y_valid )
+            ## derivative of 'along' by 's' is -(1 - curvature * t)
+            denominator = 1.0 - self._curvatures( geom_indexes, s_valid ) * t_valid
+            denominator[ np.abs( denominator ) < 0.1 ] = 1.0
+            s_valid = np.clip( s_valid + along / denominator, 0.0, length )
+        _, t_valid, _ = self._trackOffsets( items, s_valid, x_valid, y_valid )
+        s_coords[ known ] = s_valid
+        t_coords[ known ] = t_valid
+        return ( s_coords, t_coords )
+
+    def _trackOffsets(self, road_indexes, s_coords, points_x, points_y):
+        """Return tuple (offset along, offset across, geometry indexes) of points relative to reference line in 's'."""
+        geom_indexes = self.geometryIndexes( road_indexes, s_coords )
+        ref_x, ref_y = self._referencePoints( geom_indexes, s_coords )
+        hdg    = self._headings( geom_indexes, s_coords )
+        diff_x = points_x - ref_x
+        diff_y = points_y - ref_y
+        hdg_cos = np.cos( hdg )
+        hdg_sin = np.sin( hdg )
+        return ( diff_x * hdg_cos + diff_y * hdg_sin, diff_y * hdg_cos - diff_x * hdg_sin, geom_indexes )
+
+    def _curvatures(self, geom_indexes, s_coords):
+        ds         = s_coords - self.geom_s[ geom_indexes ]
+        curv_start = self.geom_curv_start[ geom_indexes ]
+        curv_dot   = np.zeros( len( geom_indexes ) )
+        spirals    = self.geom_type[ geom_indexes ] == GEOM_SPIRAL
+        if spirals.any():
+            spiral_items = geom_indexes[ spirals ]
+            curv_dot[ spirals ] = ( self.geom_curv_end[ spiral_items ] - curv_start[ spirals ] ) / self.geom_length[ spiral_items ]
+        return curv_start + curv_dot * ds
+
+    def _headings(self, geom_indexes, s_coords):
+        ds         = s_coords - self.geom_s[ geom_indexes ]
+        hdg        = self.geom_hdg[ geom_indexes ]
+        curv_start = self.geom_curv_start[ geom_indexes ]
+        ## for line curvature is zero, for arc curvature change is zero
+        curv_dot   = np.zeros( len( geom_indexes ) )
+        spirals    = self.geom_type[ geom_indexes ] == GEOM_SPIRAL
+        if spirals.any():
+            spiral_items = geom_indexes[ spirals ]
+            curv_dot[ spirals ] = ( self.geom_curv_end[ spiral_items ] - curv_start[ spirals ] ) / self.geom_length[ spiral_items ]
+        return hdg + ds * curv_start + 0.5 * curv_dot * ds * ds
+
+    def geometryBounds(self, step=1.0):
+        """Return tuple of arrays (G, 2) of minimal and maximal points of reference line of each geometry.
+
+        Geometries are sampled with given step and bounds are extended by maximal deviation
+        of arc between samples.
+        """
+        geoms_num = len( self.geom_s )
+        if geoms_num < 1:
+            return ( np.zeros( ( 0, 2 ) ), np.zeros( ( 0, 2 ) ) )
+        samples_num  = np.maximum( np.ceil( self.geom_length / step ).astype( np.int64 ) + 1, 2 )
+        geom_indexes = np.repeat( np.arange( geoms_num ), samples_num )
+        starts       = np.cumsum( samples_num ) - samples_num
+        ratio = ( np.arange( len( geom_indexes ) ) - starts[ geom_indexes ] ) / ( samples_num[ geom_indexes ] - 1 )
+        s_coords = self.geom_s[ geom_indexes ] + self.geom_length[ geom_indexes ] * ratio
+        ref_x, ref_y = self._referencePoints( geom_indexes, s_coords )
+        min_pos = np.stack( ( np.minimum.reduceat( ref_x, starts ), np.minimum.reduceat( ref_y, starts ) ), axis=1 )
+        max_pos = np.stack( ( np.maximum.reduceat( ref_x, starts ), np.maximum.reduceat( ref_y, starts ) ), axis=1 )
+        ## sagitta of arc between samples
+        max_curv = np.maximum( np.abs( self.geom_curv_start ), np.abs( self.geom_curv_end ) )
+        sample_step = self.geom_length / ( samples_num - 1 )
+        margin = ( sample_step * sample_step * max_curv / 8.0 )[ :, None ]
+        return ( min_pos - margin, max_pos + margin )
+
+    def _referencePoints(self, geom_indexes, s_coords):
+        ds    = s_coords - self.geom_s[ geom_indexes ]
+        hdg   = self.geom_hdg[ geom_indexes ]
+        ret_x = self.geom_x[ geom_indexes ].copy()
+        ret_y = self.geom_y[ geom_indexes ].copy()
+        gtype = self.geom_type[ geom_indexes ]
+
+        lines = gtype == GEOM_LINE
+        if lines.any():
+            ret_x[ lines ] += ds[ lines ] * np.cos( hdg[ lines ] )
+            ret_y[ lines ] += ds[ lines ] * np.sin( hdg[ lines ] )
+
+        arcs = gtype == GEOM_ARC
+        if arcs.any():
+            curv    = self.geom_curv_start[ geom_indexes[ arcs ] ]
+            arc_hdg = hdg[ arcs ]
+            end_hdg = arc_hdg + ds[ arcs ] * curv
+            ret_x[ arcs ] += ( np.sin( end_hdg ) - np.sin( arc_hdg ) ) / curv
+            ret_y[ arcs ] -= ( np.cos( end_hdg ) - np.cos( arc_hdg ) ) / curv
+
+        spirals = gtype == GEOM_SPIRAL
+        if spirals.any():
+            spiral_items = geom_indexes[ spirals ]
+            curv_start   = self.geom_curv_start[ spiral_items ]
+            curv_dot     = ( self.geom_curv_end[ spiral_items ] - curv_start ) / self.geom_length[ spiral_items ]
+            curv_offset  = curv_start / curv_dot
+            spiral = OdrSpiral()
+            ref_x, ref_y, ref_hdg = spiral.odrSpiralArray( curv_offset, curv_dot )
+            pos_x, pos_y, _       = spiral.odrSpiralArray( ds[ spirals ] + curv_offset, curv_dot )
+            pos_x   -= ref_x
+            pos_y   -= ref_y
+            rot_ang  = hdg[ spirals ] - ref_hdg
+            rot_cos  = np.cos( rot_ang )
+            rot_sin  = np.sin( rot_ang )
+            ret_x[ spirals ] += pos_x * rot_cos - pos_y * rot_sin
+            ret_y[ spirals ] += pos_x * rot_sin + pos_y * rot_cos
+
+        return ( ret_x, ret_y )
+
+
+## ===========================================================
+
+
+def build_map_tables( opendrive: 'OpenDRIVE' ) -> MapTables:
+    tables = MapTables()
+
+    road_length  = []
+    geom_offsets = [ 0 ]
+    geom_rows    = []       ## (s, x, y, hdg, length, type, curv start, curv end)
+    elev_offsets = [ 0 ]
+    elev_rows    = []       ## (s, a, b, c, d)
+
+    for road in opendrive.roads():
+        road_id = road.id()
+        if road_id in tables.road_index:
+            ## duplicated road id - keep first (consistent with 'OpenDRIVE.roadById()')
+            continue
+        tables.road_index[ road_id ] = len( tables.road_ids )
+        tables.road_ids.append( road_id )
+        road_length.append( road.length() )
+
+        for geom in road.geometries():
+            geom_rows.append( geometry_row( geom ) )
+        geom_offsets.append( len( geom_rows ) )
+
+        elevation_profile = road.get( "elevationProfile", None ) or {}
+        for elev in elevation_profile.get( "elevation", [] ):
+            elev_rows.append( ( elev.offset(), float( elev.attr("a") ), float( elev.attr("b") ),
+                                float( elev.attr("c") ), float( elev.attr("d") ) ) )
+        elev_offsets.append( len( elev_rows ) )
+
+    tables.road_length  = np.array( road_length, dtype=np.float64 )
+    tables.geom_offsets = np.array( geom_offsets, dtype=np.int64 )
+    tables.elev_offsets = np.array( elev_offsets, dtype=np.int64 )
+
+    geom_data = np.array( geom_rows, dtype=np.float64 ).reshape( -1, 8 )
+    tables.geom_s          = geom_data[ :, 0 ].copy()
+    tables.geom_x          = geom_data[ :, 1 ].copy()
+    tables.geom_y          = geom_data[ :, 2 ].copy()
+    tables.geom_hdg        = geom_data[ :, 3 ].copy()
+    tables.geom_length     = geom_data[ :, 4 ].copy()
+    tables.geom_type       = geom_data[ :, 5 ].astype( np.int8 )
+    tables.geom_curv_start = geom_data[ :, 6 ].copy()
+    tables.geom_curv_end   = geom_data[ :, 7 ].copy()
+
+    elev_data = np.array( elev_rows, dtype=np.float64 ).reshape( -1, 5 )
+    tables.elev_s      = elev_data[ :, 0 ].copy()
+    tables.elev_coeffs = elev_data[ :, 1: ].copy()
+    return tables
+
+
+def geometry_row( geom: 'GeometryBase' ):
+    """Return tuple (s, x, y, hdg, length, type, curv start, curv end) describing geometry."""
+    start  = geom.startPosition()
+    length = geom.length()
+    row    = [ geom.offset(), start.x, start.y, geom.hdg(), length, GEOM_LINE, 0.0, 0.0 ]
+    if geom.isLine():
+        return tuple( row )
+    curv_start = geom.attr( "curvature" )
+    if curv_start is not None:
+        ## arc
+        curv_start = float( curv_start )
+        curv_end   = curv_start
+    else:
+        ## spiral
+        curv_start = float( geom.attr( "curvStart" ) )
+        curv_end   = float( geom.attr( "curvEnd" ) )
+    row[6] = curv_start
+    row[7] = curv_end
+    if abs( curv_end - curv_start ) > 0.0 and length > 0.0:
+        row[5] = GEOM_SPIRAL
+    elif abs( curv_start ) >= MIN_CURVATURE:
+        row[5] = GEOM_ARC
+    else:
+        row[6] = 0.0
+        row[7] = 0.0
+    return tuple( row )
+
+
+## find items in per-road sorted 'items_s' arrays
+## semantics is the same as of 'types.get_item_by_offset()'
+def find_items( offsets, items_s, road_indexes, s_coords ) -> np.ndarray:
+    road_indexes = np.asarray( road_indexes, dtype=np.int64 )
+    s_coords     = np.asarray( s_coords, dtype=np.float64 )
+    ret_indexes  = np.full( len( s_coords ), -1, dtype=np.int64 )
+    if len( s_coords ) < 1:
+        return ret_indexes
+    roads_num = len( offsets ) - 1
+    known = ( road_indexes >= 0 ) & ( road_indexes < roads_num )
+    order = np.argsort( road_indexes, kind="stable" )
+    sorted_roads = road_indexes[ order ]
+    unique_roads, group_starts = np.unique( sorted_roads, return_index=True )
+    group_ends = np.append( group_starts[1:], len( order ) )
+    for road_index, start, end in zip( unique_roads.tolist(), group_starts.tolist(), group_ends.tolist() ):
+        if road_index < 0 or road_index >= roads_num:
+            continue
+        items_start = offsets[ road_index ]
+        items_end   = offsets[ road_index + 1 ]
+        if items_end <= items_start:
+            continue
+        points    = order[ start:end ]
+        road_s    = items_s[ items_start:items_end ]
+        local_idx = np.searchsorted( road_s, s_coords[ points ], side="right" ) - 1
+        local_idx = np.clip( local_idx, 0, items_end - items_start - 1 )
+        ret_indexes[ points ] = items_start + local_idx
+    ret_indexes[ ~known ] = -1
+    return ret_indexes
+
+
+def calculate_poses( tables: MapTables, road_ids, coords ):
+    """Calculate poses of road items (e.g. signals).
+
+    'coords' is list of tuples (s, t, z offset, heading offset) aligned with 'road_ids'.
+    Returns tuple: (N, 3) array of positions and (N,) array of headings. Arrays are read-only.
+    """
+    data = np.array( coords, dtype=np.float64 ).reshape( -1, 4 )
+    road_indexes = tables.roadIndexes( road_ids )
+    positions, headings = tables.positions( road_indexes, data[:, 0], data[:, 1], data[:, 2] )
+    headings += data[:, 3]
+    positions.flags.writeable = False
+    headings.flags.writeable  = False
+    return ( positions, headings )
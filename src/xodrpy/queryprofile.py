@@ -0,0 +1,183 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import time
+import inspect
+import logging
+import functools
+from contextlib import contextmanager
+from typing import Dict, List
+
+from xodrpy import types as xodr_types
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+## methods are patched in classes (process-wide), so only one profiler can be enabled at a time
+_ACTIVE_PROFILER = None
+
+
+## ===========================================================
+
+
+def query_classes() -> List[ type ]:
+    """Return classes defined in 'types' module."""
+    ret_list = []
+    for _, item in inspect.getmembers( xodr_types, inspect.isclass ):
+        if item.__module__ == xodr_types.__name__:
+            ret_list.append( item )
+    return ret_list
+
+
+def query_methods( class_type ) -> List[ str ]:
+    """Return names of public methods defined directly in given class (static methods are skipped)."""
+    ret_list = []
+    for name, value in class_type.__dict__.items():
+        if name.startswith( "_" ):
+            continue
+        if inspect.isfunction( value ) is False:
+            continue
+        ret_list.append( name )
+    return ret_list
+
+
+##
+class QueryProfiler():
+    """Counts calls and accumulates time of public query methods of classes from 'types' module.
+
+    Methods are wrapped only while profiler is enabled, so disabled profiler costs nothing.
+    Time is inclusive (contains time of nested profiled calls). Time of generator methods
+    is accumulated over steps of iteration (time spent by consumer between steps is excluded).
+    Only one profiler can be enabled at a time.
+    """
+
+    def __init__(self):
+        self.calls: Dict[ str, int ]   = {}     ## "Class.method" -> number of calls
+        self.times: Dict[ str, float ] = {}     ## "Class.method" -> total time in seconds
+        self._originals = []                    ## list of (class, method name, original function)
+
+    def isEnabled(self):
+        return _ACTIVE_PROFILER is self
+
+    def enable(self, classes: List[ type ] = None):
+        global _ACTIVE_PROFILER     # pylint: disable=W0603
+        if self.isEnabled():
+            return
+        if _ACTIVE_PROFILER is not None:
+            raise RuntimeError( "other query profiler is already enabled" )
+        _ACTIVE_PROFILER = self
+        if classes is None:
+            classes = query_classes()
+        for class_type in classes:
+            for name in query_methods( class_type ):
+                original = class_type.__dict__[ name ]
+                key = f"{class_type.__name__}.{name}"
+                setattr( class_type, name, self._wrap( original, key ) )
+                self._originals.append( ( class_type, name, original ) )
+
+    def disable(self):
+        global _ACTIVE_PROFILER     # pylint: disable=W0603
+        for class_type, name, original in reversed( self._originals ):
+            setattr( class_type, name, original )
+        self._originals = []
+        if _ACTIVE_PROFILER is self:
+            _ACTIVE_PROFILER = None
+
+    def reset(self):
+        ## clear in place - wrappers of enabled profiler hold references to dicts
+        self.calls.clear()
+        self.times.clear()
+
+    def _wrap(self, function, key):
+        calls = self.calls
+        times = self.times
+
+        @functools.wraps( function )
+        def wrapper( *args, **kwargs ):
+            start_time = time.perf_counter()
+            try:
+                return function( *args, **kwargs )
+            finally:
+                times[ key ] = times.get( key, 0.0 ) + time.perf_counter() - start_time
+                calls[ key ] = calls.get( key, 0 ) + 1
+
+        @functools.wraps( function )
+        def generator_wrapper( *args, **kwargs ):
+            calls[ key ] = calls.get( key, 0 ) + 1
+            start_time = time.perf_counter()
+            iterator   = function( *args, **kwargs )
+            while True:
+                try:
+                    item = next( iterator )
+                except StopIteration:
+                    return
+                finally:
+                    times[ key ] = times.get( key, 0.0 ) + time.perf_counter() - start_time
+                yield item
+                start_time = time.perf_counter()
+
+        if inspect.isgeneratorfunction( function ):
+            return generator_wrapper
+        return wrapper
+
+    def toDict(self):
+        """Return dict: "Class.method" -> (calls, total time), sorted by time descending."""
+        items_list = sorted( self.times.items(), key=lambda item: -item[1] )
+        return { key: ( self.calls[ key ], value ) for key, value in items_list }
+
+    def report(self, limit=None) -> str:
+        lines = []
+        items_list = list( self.toDict().items() )
+        if limit is not None:
+            items_list = items_list[ :limit ]
+        for key, ( calls, total_time ) in items_list:
+            mean_time = total_time / calls if calls else 0.0
+            lines.append( f"{key:40} {calls:10} calls {total_time:12.6f}s {mean_time * 1000000:10.3f}us/call" )
+        return "\n".join( lines )
+
+    def log(self, level=logging.INFO, limit=None):
+        _LOGGER.log( level, "query profile:\n%s", self.report( limit ) )
+
+
+## ===========================================================
+
+
+@contextmanager
+def profile_queries( classes: List[ type ] = None, profiler: QueryProfiler = None ):
+    """Context manager enabling profiling of queries. Yields 'QueryProfiler' holding report.
+
+    Example:
+        with profile_queries() as profiler:
+            road.position( 10.0, 0.0, 0.0 )
+        print( profiler.report() )
+    """
+    if profiler is None:
+        profiler = QueryProfiler()
+    profiler.enable( classes )
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
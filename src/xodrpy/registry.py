@@ -0,0 +1,191 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import sys
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from xodrpy.snapshot import file_fingerprint, load_with_snapshot
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## default memory budget of registry
+DEFAULT_MEMORY_BUDGET = 1024 * 1024 * 1024
+
+
+## ===========================================================
+
+
+def estimate_memory( data ) -> int:
+    """Return approximate number of bytes occupied by object and all objects reachable from it.
+
+    Objects shared several times are counted once. Modules and classes are not followed.
+    """
+    visited = set()
+    total   = 0
+    stack   = [ data ]
+    while stack:
+        item = stack.pop()
+        item_id = id( item )
+        if item_id in visited:
+            continue
+        visited.add( item_id )
+        if isinstance( item, ( type, type( sys ) ) ):
+            continue
+        if isinstance( item, np.ndarray ):
+            total += sys.getsizeof( item )
+            if item.base is not None:
+                ## view - count owner of memory instead
+                stack.append( item.base )
+            continue
+        total += sys.getsizeof( item )
+        if isinstance( item, ( str, bytes, int, float, bool ) ) or item is None:
+            continue
+        if isinstance( item, dict ):
+            stack.extend( item.keys() )
+            stack.extend( item.values() )
+        elif isinstance( item, ( list, tuple, set, frozenset ) ):
+            stack.extend( item )
+        item_dict = getattr( item, "__dict__", None )
+        if item_dict is not None:
+            stack.append( item_dict )
+        for slot in getattr( type( item ), "__slots__", () ):
+            if hasattr( item, slot ):
+                stack.append( getattr( item, slot ) )
+    return total
+
+
+##
+class MapRegistry():
+    """Cache of loaded maps with memory budget.
+
+    Maps are keyed by absolute path and fingerprint of file, so modified file is loaded again.
+    When estimated memory of cached maps exceeds budget, then least recently used maps are dropped.
+    If 'cache_dir' is given, then maps are loaded through snapshot cache stored in the directory
+    (see 'snapshot.load_with_snapshot()'), so loading of dropped map on next access is fast.
+    Snapshots are not written next to maps unless 'snapshots' is explicitly True.
+    """
+
+    def __init__(self, memory_budget=DEFAULT_MEMORY_BUDGET, cache_dir=None, loader: Callable = None, snapshots=None):
+        if loader is None:
+            ## deferred import - registry can be used with custom loader
+            from xodrpy.xodr import load as loader
+        self.memory_budget = memory_budget
+        if snapshots is None:
+            snapshots = cache_dir is not None
+        self.cache_dir     = cache_dir
+        self.loader        = loader
+        self.snapshots     = snapshots
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+        ## (path, fingerprint) -> (map, estimated memory)
+        self._entries: OrderedDict = OrderedDict()
+        ## (path, fingerprint) -> estimated memory, kept after eviction to not estimate reloaded maps again
+        self._estimates: Dict[ Tuple, int ] = {}
+
+    def mapsNumber(self):
+        return len( self._entries )
+
+    def keys(self):
+        return list( self._entries.keys() )
+
+    def memoryUsage(self):
+        """Return estimated memory of cached maps."""
+        return sum( item[1] for item in self._entries.values() )
+
+    def contains(self, xodr_path):
+        return self._key( xodr_path ) in self._entries
+
+    def get(self, xodr_path) -> 'OpenDRIVE':
+        """Return map of given file, load it if not cached."""
+        key = self._key( xodr_path )
+        entry = self._entries.get( key, None )
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end( key )
+            return entry[0]
+
+        self.misses += 1
+        ## drop outdated versions of map
+        self._remove( key[0], key )
+        opendrive = self._load( key[0] )
+        memory = self._estimates.get( key, None )
+        if memory is None:
+            memory = estimate_memory( opendrive )
+            self._estimates[ key ] = memory
+        _LOGGER.debug( "loaded map %s estimated memory: %s", key[0], memory )
+        self._entries[ key ] = ( opendrive, memory )
+        self._evict()
+        return opendrive
+
+    def release(self, xodr_path):
+        """Drop given map from registry."""
+        self._remove( os.path.abspath( xodr_path ) )
+
+    def clear(self):
+        self._entries.clear()
+        self._estimates.clear()
+
+    def updateEstimates(self):
+        """Estimate memory again (e.g. after building caches of maps) and drop maps exceeding budget."""
+        for key, entry in self._entries.items():
+            memory = estimate_memory( entry[0] )
+            self._estimates[ key ] = memory
+            self._entries[ key ] = ( entry[0], memory )
+        self._evict()
+
+    def _key(self, xodr_path) -> Tuple:
+        abs_path = os.path.abspath( xodr_path )
+        return ( abs_path, file_fingerprint( abs_path ) )
+
+    def _load(self, xodr_path):
+        if self.snapshots:
+            return load_with_snapshot( xodr_path, self.loader, cache_dir=self.cache_dir )
+        return self.loader( xodr_path )
+
+    def _remove(self, abs_path, keep_key=None):
+        for key in list( self._entries.keys() ):
+            if key[0] == abs_path and key != keep_key:
+                del self._entries[ key ]
+        for key in list( self._estimates.keys() ):
+            if key[0] == abs_path and key != keep_key:
+                del self._estimates[ key ]
+
+    def _evict(self):
+        ## recently loaded map is kept even if exceeds budget on its own
+        while len( self._entries ) > 1 and self.memoryUsage() > self.memory_budget:
+            key, _ = self._entries.popitem( last=False )
+            self.evictions += 1
+            _LOGGER.debug( "evicted map %s", key[0] )
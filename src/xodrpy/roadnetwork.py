@@ -0,0 +1,213 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import os
+import logging
+from typing import List, Dict, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE, Road
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## ===========================================================
+
+
+@dataclass( frozen=True )
+class JunctionPath():
+    """Path through junction: incoming road -> connecting road -> outgoing road."""
+    junction_id: str
+    incoming_id: str
+    connecting_id: str
+    connecting_contact: str         ## contact point of connecting road with incoming road
+    outgoing_id: str                ## None if connecting road has no further link
+    outgoing_contact: str
+
+
+##
+class RoadNetwork():
+    """Road level topology built from 'road/link' and 'junction/connection' elements.
+
+    Link of road is tuple (contact point on road, other road id, contact point on other road, junction id),
+    where junction id is None for direct road to road links.
+    """
+
+    def __init__(self):
+        self.road_ids: List[ str ] = []
+        self._links_dict: Dict[ str, List[ Tuple ] ] = {}
+        self._neighbours_dict: Dict[ str, Tuple[ str, ...] ] = {}
+        self._paths_by_incoming: Dict[ str, List[ JunctionPath ] ] = {}
+        self._paths_by_junction: Dict[ str, List[ JunctionPath ] ] = {}
+
+    def roadsNumber(self):
+        return len( self.road_ids )
+
+    def links(self, road_id) -> List[ Tuple ]:
+        """Return list of links of road (see class description)."""
+        return self._links_dict.get( road_id, [] )
+
+    def neighbours(self, road_id) -> Tuple[ str, ...]:
+        """Return ids of roads directly linked with given road."""
+        return self._neighbours_dict.get( road_id, () )
+
+    def junctionPaths(self, junction_id) -> List[ JunctionPath ]:
+        return self._paths_by_junction.get( junction_id, [] )
+
+    def pathsFromRoad(self, incoming_id) -> List[ JunctionPath ]:
+        """Return paths through junctions starting at given incoming road."""
+        return self._paths_by_incoming.get( incoming_id, [] )
+
+    def connectingRoads(self, incoming_id) -> List[ str ]:
+        return [ item.connecting_id for item in self.pathsFromRoad( incoming_id ) ]
+
+    def outgoingRoads(self, incoming_id) -> List[ str ]:
+        ret_list = []
+        for item in self.pathsFromRoad( incoming_id ):
+            if item.outgoing_id is not None and item.outgoing_id not in ret_list:
+                ret_list.append( item.outgoing_id )
+        return ret_list
+
+    ## ==============================================
+
+    def adjacencyDict(self) -> Dict[ str, List[ str ] ]:
+        """Return dict mapping road id to list of neighbour roads ids."""
+        return { road_id: list( self.neighbours( road_id ) ) for road_id in self.road_ids }
+
+    def edgesList(self) -> List[ Tuple[ str, str ] ]:
+        """Return list of pairs of linked roads (each pair is given in both directions)."""
+        ret_list = []
+        for road_id in self.road_ids:
+            for other_id in self.neighbours( road_id ):
+                ret_list.append( ( road_id, other_id ) )
+        return ret_list
+
+    def adjacencyCSR(self):
+        """Return tuple (roads ids list, indptr array, indices array) describing adjacency in CSR format."""
+        index_dict = { road_id: index for index, road_id in enumerate( self.road_ids ) }
+        indptr  = [ 0 ]
+        indices = []
+        for road_id in self.road_ids:
+            indices.extend( index_dict[ item ] for item in self.neighbours( road_id ) )
+            indptr.append( len( indices ) )
+        return ( list( self.road_ids ), np.array( indptr, dtype=np.int64 ), np.array( indices, dtype=np.int64 ) )
+
+    ## ==============================================
+
+    def addLink(self, road_id, contact_point, other_id, other_contact, junction_id=None):
+        link = ( contact_point, other_id, other_contact, junction_id )
+        road_links = self._links_dict.setdefault( road_id, [] )
+        if link not in road_links:
+            road_links.append( link )
+
+    def addJunctionPath(self, path: JunctionPath):
+        self._paths_by_incoming.setdefault( path.incoming_id, [] ).append( path )
+        self._paths_by_junction.setdefault( path.junction_id, [] ).append( path )
+
+    def updateNeighbours(self):
+        """Rebuild neighbours lookup (have to be called after adding links)."""
+        self._neighbours_dict = {}
+        for road_id in self.road_ids:
+            neighbours = []
+            for link in self.links( road_id ):
+                if link[1] not in neighbours:
+                    neighbours.append( link[1] )
+            self._neighbours_dict[ road_id ] = tuple( neighbours )
+
+
+## ===========================================================
+
+
+def build_road_network( opendrive: 'OpenDRIVE' ) -> RoadNetwork:
+    network = RoadNetwork()
+    roads_list = opendrive.roads()
+    roads_dict = { road.id(): road for road in roads_list }
+    network.road_ids = list( roads_dict.keys() )
+
+    def road_junction( road ):
+        junc_id = road.junctionId()
+        if junc_id in ( None, "-1" ):
+            return None
+        return junc_id
+
+    for road in roads_list:
+        road_id = road.id()
+        for contact_point, link_data in ( ( "start", road.predecessorData() ), ( "end", road.successorData() ) ):
+            if link_data is None:
+                continue
+            elem_type, elem_id, other_contact = link_data
+            if elem_type != "road" or elem_id not in roads_dict:
+                continue
+            ## link belongs to junction if any of roads is connecting road
+            link_junc = road_junction( road )
+            if link_junc is None:
+                link_junc = road_junction( roads_dict[ elem_id ] )
+            network.addLink( road_id, contact_point, elem_id, other_contact, link_junc )
+            ## links are symmetrical
+            network.addLink( elem_id, other_contact, road_id, contact_point, link_junc )
+
+    for junc in opendrive.junctions():
+        junc_id = junc.id()
+        for incoming_id, connecting_id, contact_point, _ in junc.connectionsData():
+            connecting_road = roads_dict.get( connecting_id, None )
+            if connecting_road is None:
+                continue
+            if contact_point == "end":
+                outgoing_data = connecting_road.predecessorData()
+            else:
+                outgoing_data = connecting_road.successorData()
+            outgoing_id      = None
+            outgoing_contact = None
+            if outgoing_data is not None and outgoing_data[0] == "road":
+                outgoing_id      = outgoing_data[1]
+                outgoing_contact = outgoing_data[2]
+            path = JunctionPath( junc_id, incoming_id, connecting_id, contact_point, outgoing_id, outgoing_contact )
+            network.addJunctionPath( path )
+
+            ## incoming road contact point is not given by connection - find it by road link
+            incoming_road = roads_dict.get( incoming_id, None )
+            if incoming_road is None:
+                continue
+            incoming_contact = find_junction_contact( incoming_road, junc_id )
+            network.addLink( incoming_id, incoming_contact, connecting_id, contact_point, junc_id )
+            network.addLink( connecting_id, contact_point, incoming_id, incoming_contact, junc_id )
+
+    network.updateNeighbours()
+    return network
+
+
+def find_junction_contact( road: 'Road', junction_id ):
+    """Return contact point ("start" or "end") of road with given junction or None."""
+    for contact_point, link_data in ( ( "start", road.predecessorData() ), ( "end", road.successorData() ) ):
+        if link_data is None:
+            continue
+        if link_data[0] == "junction" and link_data[1] == junction_id:
+            return contact_point
+    return None
@@ -25,17 +25,22 @@
 import os
 import logging
 # import abc
-from typing import List, Dict, Any
-import pprint
-import xmltodict
+from typing import List, Dict, Any, TYPE_CHECKING
+from xml.etree import ElementTree
 
 # from xodrpy.utils import get_min_point2d, get_max_point2d, get_min_point,\
 #     get_max_point, Vector2D
 from xodrpy.dicttoobject import convert,\
     DictLookup, BaseElement, ensure_list, convert_to_list
+from xodrpy.snapshot import load_with_snapshot
  
 # from xodrpy.types import *
 
+if TYPE_CHECKING:
+    from xodrpy.linkindex import LinkIndex
+    from xodrpy.signaltimeline import SignalTimeline
+    from xodrpy.types import OpenDRIVE
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -46,6 +51,9 @@ SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
 
 
 def load( rrdata_path ) -> 'RRMetadata':
+    ## deferred import - 'load_stream()' does not need xmltodict
+    import xmltodict
+
     with open( rrdata_path, 'r', encoding="utf-8" ) as rrdata_file:
         content   = rrdata_file.read()
         data_dict = xmltodict.parse( content )
@@ -64,46 +72,116 @@ def load( rrdata_path ) -> 'RRMetadata':
         return data_dict[ "RoadRunnerMetadata" ]
 
 
+def load_stream( rrdata_path ) -> 'RRMetadata':
+    """Load metadata using incremental parser.
+
+    Only configuration and serialization tables are built, raw data dict of returned object is empty.
+    Memory usage is bounded by size of single junction element.
+    """
+    configuration_dict = {}
+    serialization_dict = {}
+    path = []
+    for event, elem in ElementTree.iterparse( rrdata_path, events=( "start", "end" ) ):
+        if event == "start":
+            path.append( elem.tag )
+            continue
+        path.pop()
+        if len( path ) != 2:
+            continue
+        if path[1] == "SignalConfigurations" and elem.tag == "Signal":
+            sig_id = elem_text( elem, "ID" )
+            cfg_list = [ elem_text( item, "Name" ) for item in elem.findall( "Configuration" ) ]
+            configuration_dict[ sig_id ] = { "type": elem_text( elem, "Type" ),
+                                             "cfg":  cfg_list }
+            elem.clear()
+        elif path[1] == "Signalization" and elem.tag == "Junction":
+            junc_id = elem_text( elem, "ID" )
+            intervals_list = serialization_dict.setdefault( junc_id, [] )
+            for phase in elem.findall( "SignalPhase" ):
+                for interval in phase.findall( "Interval" ):
+                    sigs_config = []
+                    for signal in interval.findall( "Signal" ):
+                        sigs_config.append( { "uuid": elem_text( signal, "ID" ),
+                                              "asset": elem_text( signal, "SignalAsset" ),
+                                              "cfg_index": int( elem_text( signal, "ConfigurationIndex" ) ) } )
+                    intervals_list.append( { "duration": elem_text( interval, "Time" ),
+                                             "signals":  sigs_config } )
+            elem.clear()
+
+    metadata = RRMetadata()
+    metadata.initializeTables( configuration_dict, serialization_dict )
+    return metadata
+
+
+def load_cached( rrdata_path, snapshot_file=None, cache_dir=None ) -> 'RRMetadata':
+    """Load metadata tables using snapshot if it is up to date, otherwise parse file and store snapshot."""
+    return load_with_snapshot( rrdata_path, load_stream, snapshot_file, cache_dir )
+
+
+def elem_text( elem, child_tag ):
+    """Return stripped text of child element or None if child does not exist."""
+    text = elem.findtext( child_tag )
+    if text is None:
+        return None
+    return text.strip()
+
+
 ## ===========================================================
 
 
 class RRMetadata( BaseElement ):
 
+    def __init__(self):
+        super().__init__()
+        self._configuration_dict = None     ## cached configuration table
+        self._serialization_dict = None     ## cached serialization table
+
+    def initializeTables(self, configuration_dict, serialization_dict):
+        """Set tables directly (used by streaming loader, raw data is not needed then)."""
+        self._configuration_dict = configuration_dict
+        self._serialization_dict = serialization_dict
+
+    def invalidateCache(self):
+        """Drop cached tables (have to be called after modification of raw data)."""
+        if not self.data:
+            ## tables are the only source of data
+            return
+        self._configuration_dict = None
+        self._serialization_dict = None
+
     def getConfigurationSignaUUIDs(self):
-        configurations = self[ "SignalConfigurations" ]
-        signal_list = configurations[ "Signal" ]
-        signal_ids = set()
-        for signal in signal_list:
-            sig_id = signal["ID"]
-            signal_ids.add( sig_id )
-        return signal_ids
+        return set( self.getConfigurationDict().keys() )
 
     def getSignalizationSignalUUIDs(self):
-        signalization = self[ "Signalization" ]
-        junction_list = signalization[ "Junction" ]
         signal_ids = set()
-        for junc in junction_list:
-            ## pprint.pprint( junc )
-            phase_list = junc[ "SignalPhase" ]
-            for phase in phase_list:
-                interval_list = phase[ "Interval" ]
-                for interval in interval_list:
-                    signal_list = interval[ "Signal" ]
-                    for signal in signal_list:
-                        asset_id = signal["ID"]
-                        signal_ids.add( asset_id )
+        for intervals_list in self.getSerializationDict().values():
+            for interval in intervals_list:
+                for signal in interval[ "signals" ]:
+                    signal_ids.add( signal["uuid"] )
         return signal_ids
 
     def getJunctionUUIDs(self):
-        signalization = self[ "Signalization" ]
-        junction_list = signalization[ "Junction" ]
-        junction_ids = set()
-        for junc in junction_list:
-            junc_id = junc["ID"]
-            junction_ids.add( junc_id )
-        return junction_ids
+        return set( self.getSerializationDict().keys() )
 
     def getConfigurationDict(self):
+        """Return dict mapping signal asset UUID to dict with 'type' and 'cfg' (list of states names).
+
+        Table is built on first call and cached - do not modify it.
+        """
+        if self._configuration_dict is None:
+            self._configuration_dict = self._collectConfigurationDict()
+        return self._configuration_dict
+
+    def getSerializationDict(self):
+        """Return dict mapping junction UUID to list of intervals.
+
+        Table is built on first call and cached - do not modify it.
+        """
+        if self._serialization_dict is None:
+            self._serialization_dict = self._collectSerializationDict()
+        return self._serialization_dict
+
+    def _collectConfigurationDict(self):
         ret_config = {}
         configuration = self[ "SignalConfigurations" ]
         signal_list = configuration[ "Signal" ]
@@ -120,7 +198,7 @@ class RRMetadata( BaseElement ):
             sig_data["cfg"]  = cfg_list
         return ret_config
 
-    def getSerializationDict(self):
+    def _collectSerializationDict(self):
         ret_config = {}
         signalization = self[ "Signalization" ]
         junction_list = signalization[ "Junction" ]
@@ -145,14 +223,21 @@ class RRMetadata( BaseElement ):
                                              "signals":  sigs_config } )
         return ret_config
     
-    def getPhasesDict(self, opendrive: 'OpenDRIVE' = None) -> List[ Dict[Any, Any] ]:
+    def getPhasesDict(self, opendrive: 'OpenDRIVE' = None, link_index: 'LinkIndex' = None) -> List[ Dict[Any, Any] ]:
+        """Return list of junctions with phases of signals.
+
+        XODR ids of signals and junctions are resolved using 'link_index' if given (then 'opendrive' is not needed)
+        or by matching with 'opendrive'.
+        """
         configuration_dict = self.getConfigurationDict()
         serialization_dict = self.getSerializationDict()
         junction_matches = {}
-        junction_signals_dict = None
-        if opendrive:
+        signal_junctions = None
+        if opendrive and link_index is None:
             junction_signals_dict = opendrive.junctionControllerSignals()
+            signal_junctions = build_signal_junctions_index( junction_signals_dict )
         ret_config = []
+        config_by_uuid = {}
         for rr_junc_uuid, rr_junc_data_list in serialization_dict.items():
             if not rr_junc_data_list:
                 continue
@@ -177,7 +262,9 @@ class RRMetadata( BaseElement ):
                                        "id":    None,
                                        "type":  sig_type,
                                        "state": sig_state }
-                    if opendrive:
+                    if link_index is not None:
+                        sign_data_dict['id'] = link_index.signalId( sig_uuid )
+                    elif opendrive:
                         sig = opendrive.signalByUUID( sig_uuid )
                         if sig:
                             sign_data_dict['id'] = sig.id()
@@ -188,56 +275,83 @@ class RRMetadata( BaseElement ):
                                       "signals":  signals_list } )
 
             best_junc_id = None
-            if junction_signals_dict:
+            if link_index is not None:
+                best_junc_id = link_index.junctionId( rr_junc_uuid )
+            elif signal_junctions:
                 ## find matching junctions from XODR to junction in RRDATA
                 ## in XODR junction contains UUID in 'userData/vectorJunction' element, but surprisingly
                 ## it does not match UUID in 'Signalization/Junction/ID' element in RRDATA file
                 ## so the only way to match junction is to compare controlled signals IDs lists
-
-                for junc_id, junc_signals in junction_signals_dict.items():
-                    junk_signs_set  = set( junc_signals )
-                    signs_intersect = controller_signals.intersection( junk_signs_set )
-                    intersect_size  = len( signs_intersect )
-                    if intersect_size < 1:
-                        continue
-                    if intersect_size == len(controller_signals):
+                junc_hits = count_junction_hits( signal_junctions, controller_signals )
+                for junc_id, hits_num in junc_hits.items():
+                    if hits_num == len(controller_signals):
+                        ## first full match wins
                         best_junc_id = junc_id
-                        if rr_junc_uuid in junction_matches:
-                            del junction_matches[ rr_junc_uuid ]
                         break
-                    junc_sub_matches = junction_matches.setdefault( rr_junc_uuid, {} )
-                    junc_sub_matches[ junc_id ] = intersect_size
-
-                # if best_junc_id is None:
-                #     _LOGGER.warning( "could not match XODR junction with junction from RRDATA" )
-                #     dict_string = pprint.pformat( junction_signals_dict, indent=2 )
-                #     _LOGGER.info( "XODR junctions signals:\n%s", dict_string )
-                #     _LOGGER.info( "RRDATA controller signals:\n%s", controller_signals )
+                if best_junc_id is None and junc_hits:
+                    junction_matches[ rr_junc_uuid ] = junc_hits
 
             junction_dict = { "uuid":   rr_junc_uuid,
                               "id":     best_junc_id,
                               "phases": phases_list
                               }
             ret_config.append( junction_dict )
-        
+            config_by_uuid[ rr_junc_uuid ] = junction_dict
+
         ## find best matches
         if junction_matches:
-            for rr_id in list( junction_matches ):
-                rr_matches   = junction_matches[ rr_id ]
-                best_junc    = max( rr_matches, key=rr_matches.get )
-                found_config = filter( lambda element: element["uuid"] == rr_id, ret_config )
-                found_config = list( found_config )
-                if found_config:
-                    found_config = found_config[0]
-                    found_config[ "id" ] = best_junc
-                    ## remove items
-                    del junction_matches[ rr_id ]
-                    for subdict in junction_matches.values():
-                        if best_junc in subdict:
-                            del subdict[ best_junc ]
+            ## XODR junction id -> RRDATA junctions partially matching it
+            junc_candidates = {}
+            for rr_id, rr_matches in junction_matches.items():
+                for junc_id in rr_matches:
+                    junc_candidates.setdefault( junc_id, [] ).append( rr_id )
+
+            for rr_id, rr_matches in junction_matches.items():
+                if not rr_matches:
+                    ## all candidates already taken
+                    continue
+                best_junc = max( rr_matches, key=rr_matches.get )
+                config_by_uuid[ rr_id ][ "id" ] = best_junc
+                ## remove items
+                for other_id in junc_candidates[ best_junc ]:
+                    junction_matches[ other_id ].pop( best_junc, None )
 
         return ret_config
 
+    def getSignalTimeline(self, opendrive: 'OpenDRIVE' = None, link_index: 'LinkIndex' = None) -> 'SignalTimeline':
+        """Return timeline of signals states compiled from phases (see 'getPhasesDict()')."""
+        ## deferred import - timeline needs numpy
+        from xodrpy.signaltimeline import build_signal_timeline
+        phases_config = self.getPhasesDict( opendrive, link_index )
+        return build_signal_timeline( phases_config )
+
+
+## ===========================================================
+
+
+def build_signal_junctions_index( junction_signals_dict: Dict[ Any, List ] ) -> Dict[ Any, List ]:
+    """Return dict mapping signal id to list of tuples (junction position, junction id) of junctions controlling the signal.
+
+    Junction position is index of junction in 'junction_signals_dict'.
+    """
+    ret_dict = {}
+    for junc_pos, ( junc_id, junc_signals ) in enumerate( junction_signals_dict.items() ):
+        for sig_id in set( junc_signals ):
+            ret_dict.setdefault( sig_id, [] ).append( ( junc_pos, junc_id ) )
+    return ret_dict
+
+
+def count_junction_hits( signal_junctions: Dict[ Any, List ], signals_ids ) -> Dict[ Any, int ]:
+    """Return dict mapping junction id to number of given signals controlled by the junction.
+
+    Only junctions controlling at least one signal are returned. Items are ordered by junction position.
+    """
+    junc_hits = {}
+    for sig_id in signals_ids:
+        for junc_key in signal_junctions.get( sig_id, [] ):
+            junc_hits[ junc_key ] = junc_hits.get( junc_key, 0 ) + 1
+    return { junc_key[1]: junc_hits[ junc_key ] for junc_key in sorted( junc_hits ) }
+
 
 ## ===========================================================
  
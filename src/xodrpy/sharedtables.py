@@ -0,0 +1,182 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import logging
+from typing import Dict, Tuple, TYPE_CHECKING
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from xodrpy.maptables import MapTables, TABLE_ARRAYS
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## alignment of arrays in shared block
+ARRAY_ALIGNMENT = 64
+
+
+## ===========================================================
+
+
+##
+class SharedTables():
+    """Map tables published in shared memory block.
+
+    Publisher keeps the object as long as tables are in use and unlinks the block at the end.
+    Workers attach with 'attach_tables( shared.descriptor() )' - arrays are not copied.
+    Workers have to be children of publishing process (e.g. pool), otherwise resource tracker
+    of worker may remove the block when worker exits.
+    """
+
+    def __init__(self, block: shared_memory.SharedMemory, descriptor: dict):
+        self.block       = block
+        self._descriptor = descriptor
+
+    def name(self):
+        return self.block.name
+
+    def size(self):
+        return self.block.size
+
+    def descriptor(self) -> dict:
+        """Return small picklable description of block (passed to workers)."""
+        return self._descriptor
+
+    def close(self, unlink=True):
+        if self.block is None:
+            return
+        self.block.close()
+        if unlink:
+            self.block.unlink()
+        self.block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+## ===========================================================
+
+
+def arrays_layout( arrays: Dict[ str, np.ndarray ] ):
+    """Return tuple (layout dict: name -> (offset, dtype, shape), total size) of arrays placed in one buffer."""
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        layout[ name ] = ( offset, array.dtype.str, array.shape )
+        offset += array.nbytes
+        offset  = ( offset + ARRAY_ALIGNMENT - 1 ) // ARRAY_ALIGNMENT * ARRAY_ALIGNMENT
+    return ( layout, max( offset, 1 ) )
+
+
+def copy_arrays( buffer, arrays: Dict[ str, np.ndarray ], layout ):
+    for name, array in arrays.items():
+        offset, dtype, shape = layout[ name ]
+        target = np.ndarray( shape, dtype=np.dtype( dtype ), buffer=buffer, offset=offset )
+        target[...] = array
+
+
+def view_arrays( buffer, layout ) -> Dict[ str, np.ndarray ]:
+    """Return read-only arrays placed in buffer."""
+    ret_dict = {}
+    for name, ( offset, dtype, shape ) in layout.items():
+        array = np.ndarray( shape, dtype=np.dtype( dtype ), buffer=buffer, offset=offset )
+        array.flags.writeable = False
+        ret_dict[ name ] = array
+    return ret_dict
+
+
+def publish_tables( tables: MapTables, extra_arrays: Dict[ str, np.ndarray ] = None, name=None ) -> SharedTables:
+    """Copy arrays of tables (and additional arrays) to new shared memory block."""
+    arrays = { key: np.ascontiguousarray( getattr( tables, key ) ) for key in TABLE_ARRAYS }
+    extra_names = []
+    if extra_arrays:
+        for key, array in extra_arrays.items():
+            extra_names.append( key )
+            arrays[ "extra:" + key ] = np.ascontiguousarray( array )
+    layout, size = arrays_layout( arrays )
+    block = shared_memory.SharedMemory( name=name, create=True, size=size )
+    try:
+        copy_arrays( block.buf, arrays, layout )
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    descriptor = { "name":     block.name,
+                   "road_ids": list( tables.road_ids ),
+                   "layout":   layout,
+                   "extra":    extra_names }
+    _LOGGER.debug( "published tables in shared block %s of size %s", block.name, size )
+    return SharedTables( block, descriptor )
+
+
+def publish_map( opendrive: 'OpenDRIVE', name=None ) -> SharedTables:
+    """Publish tables of map together with poses of signals ('signal_positions' and 'signal_headings').
+
+    Ids of signals are stored in descriptor under 'signal_ids' key.
+    """
+    positions, headings = opendrive.signalPoses()
+    shared = publish_tables( opendrive.mapTables(), { "signal_positions": positions, "signal_headings": headings }, name )
+    shared.descriptor()[ "signal_ids" ] = [ signal.id() for signal in opendrive.signalsView() ]
+    return shared
+
+
+def attach_tables( descriptor: dict ) -> Tuple[ MapTables, Dict[ str, np.ndarray ] ]:
+    """Attach to tables published in shared memory. Return tuple (MapTables, dict of extra arrays).
+
+    Arrays are read-only views of shared block. Block is closed when returned tables and
+    arrays are released (see 'detach_tables()').
+    """
+    block  = shared_memory.SharedMemory( name=descriptor[ "name" ] )
+    arrays = view_arrays( block.buf, descriptor[ "layout" ] )
+
+    tables = MapTables()
+    tables.road_ids   = list( descriptor[ "road_ids" ] )
+    tables.road_index = { road_id: index for index, road_id in enumerate( tables.road_ids ) }
+    for key in TABLE_ARRAYS:
+        setattr( tables, key, arrays[ key ] )
+    tables.buffer_owner = block
+    extra_arrays = { key: arrays[ "extra:" + key ] for key in descriptor[ "extra" ] }
+    return ( tables, extra_arrays )
+
+
+def detach_tables( tables: MapTables, extra_arrays: Dict[ str, np.ndarray ] = None ):
+    """Release arrays of attached tables and close shared block (block is not removed)."""
+    block = tables.buffer_owner
+    for key in TABLE_ARRAYS:
+        setattr( tables, key, None )
+    if extra_arrays:
+        extra_arrays.clear()
+    tables.buffer_owner = None
+    if block is not None:
+        block.close()
@@ -0,0 +1,178 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import logging
+from typing import List, Dict, Any
+import bisect
+
+import numpy as np
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## state of signal in phase not controlling the signal
+UNKNOWN_STATE = "unknown"
+
+
+## ===========================================================
+
+
+##
+class SignalTimeline():
+    """Compiled signal phases of junctions allowing to query state of signals in given time.
+
+    Phases of each junction are cycled infinitely starting at time 0. Signal is identified
+    by XODR id (if matched) or by RR UUID. If signal is controlled by more than one junction,
+    then first junction is used.
+    """
+
+    def __init__(self):
+        self.junction_uuids: List[ str ] = []          ## RR UUID of each junction
+        self.junction_ids: List[ str ]   = []          ## XODR id of each junction (None if not matched)
+        self.phase_starts: List[ np.ndarray ] = []     ## per junction cumulative start times (last item is cycle length)
+        self.state_names: List[ str ] = [ UNKNOWN_STATE ]
+        self.signal_ids: List[ str ]  = []
+        self.signal_uuids: List[ str ] = []
+        self.signal_junctions = np.zeros( 0, dtype=np.int64 )   ## junction index of each signal
+        self.signal_states    = np.zeros( ( 0, 0 ), dtype=np.int64 )    ## (signals, max phases) states indexes
+
+        self._signal_dict: Dict[ str, int ] = {}
+        self._starts_list: List[ List[ float ] ] = []
+        self._padded_starts = np.zeros( ( 0, 0 ) )     ## (junctions, max phases) starts padded with inf
+        self._cycles        = np.zeros( 0 )
+
+    def signalsNumber(self):
+        return len( self.signal_ids )
+
+    def junctionsNumber(self):
+        return len( self.junction_uuids )
+
+    def signalIndex(self, signal_id) -> int:
+        """Return index of signal (by XODR id or RR UUID) or -1 if signal is unknown."""
+        return self._signal_dict.get( signal_id, -1 )
+
+    def cycleLength(self, junction_index):
+        return self._cycles[ junction_index ]
+
+    def phaseIndex(self, junction_index, time):
+        """Return index of phase of junction active in given time."""
+        cycle = self._cycles[ junction_index ]
+        if cycle <= 0.0:
+            return 0
+        phase = bisect.bisect_right( self._starts_list[ junction_index ], time % cycle ) - 1
+        return min( phase, len( self._starts_list[ junction_index ] ) - 2 )
+
+    def stateAt(self, signal_id, time) -> str:
+        """Return state of signal in given time or None if signal is unknown."""
+        sig_index = self._signal_dict.get( signal_id, -1 )
+        if sig_index < 0:
+            return None
+        junc_index = self.signal_junctions[ sig_index ]
+        phase = self.phaseIndex( junc_index, time )
+        return self.state_names[ self.signal_states[ sig_index, phase ] ]
+
+    def phasesAt(self, time) -> np.ndarray:
+        """Return array of active phase indexes of all junctions in given time."""
+        cycles  = self._cycles
+        local_t = np.mod( time, np.where( cycles > 0.0, cycles, 1.0 ) )
+        local_t = np.where( cycles > 0.0, local_t, 0.0 )
+        phases  = np.count_nonzero( self._padded_starts <= local_t[ :, None ], axis=1 ) - 1
+        return np.clip( phases, 0, None )
+
+    def stateCodesAt(self, time) -> np.ndarray:
+        """Return array of states indexes (see 'state_names') of all signals in given time."""
+        if len( self.signal_ids ) < 1:
+            return np.zeros( 0, dtype=np.int64 )
+        phases = self.phasesAt( time )
+        return self.signal_states[ np.arange( len( self.signal_ids ) ), phases[ self.signal_junctions ] ]
+
+    def statesAt(self, time) -> np.ndarray:
+        """Return array of states names of all signals (ordered as 'signal_ids') in given time."""
+        names = np.array( self.state_names )
+        return names[ self.stateCodesAt( time ) ]
+
+    def statesDict(self, time) -> Dict[ str, str ]:
+        """Return dict mapping signal id to state in given time."""
+        return dict( zip( self.signal_ids, self.statesAt( time ).tolist() ) )
+
+
+## ===========================================================
+
+
+def build_signal_timeline( phases_config: List[ Dict[ Any, Any ] ] ) -> SignalTimeline:
+    """Build timeline from list returned by 'RRMetadata.getPhasesDict()'."""
+    timeline = SignalTimeline()
+    state_dict = { UNKNOWN_STATE: 0 }
+    signals_phases = []         ## list of dicts: phase index -> state index
+    for junc_data in phases_config:
+        phases_list = junc_data[ "phases" ]
+        if not phases_list:
+            continue
+        junc_index = len( timeline.junction_uuids )
+        timeline.junction_uuids.append( junc_data[ "uuid" ] )
+        timeline.junction_ids.append( junc_data[ "id" ] )
+        starts = [ 0.0 ]
+        for phase_index, phase in enumerate( phases_list ):
+            duration = max( float( phase[ "duration" ] ), 0.0 )
+            starts.append( starts[-1] + duration )
+            for signal in phase[ "signals" ]:
+                sig_key = signal[ "id" ]
+                if sig_key is None:
+                    sig_key = signal[ "uuid" ]
+                sig_index = timeline._signal_dict.get( sig_key, -1 )
+                if sig_index < 0:
+                    sig_index = len( timeline.signal_ids )
+                    timeline._signal_dict[ sig_key ] = sig_index
+                    timeline._signal_dict.setdefault( signal[ "uuid" ], sig_index )
+                    timeline.signal_ids.append( sig_key )
+                    timeline.signal_uuids.append( signal[ "uuid" ] )
+                    signals_phases.append( ( junc_index, {} ) )
+                sig_junc, sig_phases = signals_phases[ sig_index ]
+                if sig_junc != junc_index:
+                    continue
+                state_index = state_dict.setdefault( signal[ "state" ], len( state_dict ) )
+                sig_phases[ phase_index ] = state_index
+        timeline._starts_list.append( starts )
+        timeline.phase_starts.append( np.array( starts, dtype=np.float64 ) )
+
+    timeline.state_names = list( state_dict.keys() )
+
+    junc_num   = len( timeline.junction_uuids )
+    max_phases = max( [ len( starts ) - 1 for starts in timeline._starts_list ], default=0 )
+    timeline._cycles = np.array( [ starts[-1] for starts in timeline._starts_list ], dtype=np.float64 )
+    ## padding with infinity keeps padded phases never active
+    timeline._padded_starts = np.full( ( junc_num, max_phases ), np.inf )
+    for junc_index, starts in enumerate( timeline._starts_list ):
+        timeline._padded_starts[ junc_index, :len( starts ) - 1 ] = starts[ :-1 ]
+
+    sig_num = len( timeline.signal_ids )
+    timeline.signal_junctions = np.array( [ item[0] for item in signals_phases ], dtype=np.int64 )
+    timeline.signal_states = np.zeros( ( sig_num, max_phases ), dtype=np.int64 )
+    for sig_index, ( _, sig_phases ) in enumerate( signals_phases ):
+        for phase_index, state_index in sig_phases.items():
+            timeline.signal_states[ sig_index, phase_index ] = state_index
+    return timeline
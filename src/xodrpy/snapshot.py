@@ -0,0 +1,131 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import logging
+import pickle
+import hashlib
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## version of snapshot layout - snapshots of other versions are ignored
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_EXTENSION = ".snapshot"
+
+
+## ===========================================================
+
+
+def file_fingerprint( file_path ):
+    """Return tuple (size, modification time in ns) describing state of file."""
+    file_stat = os.stat( file_path )
+    return ( file_stat.st_size, file_stat.st_mtime_ns )
+
+
+def file_hash( file_path, chunk_size=1024 * 1024 ) -> str:
+    """Return SHA-1 hex digest of content of file."""
+    hasher = hashlib.sha1()
+    with open( file_path, 'rb' ) as data_file:
+        while True:
+            chunk = data_file.read( chunk_size )
+            if not chunk:
+                break
+            hasher.update( chunk )
+    return hasher.hexdigest()
+
+
+def snapshot_path( source_path, cache_dir=None, extension=SNAPSHOT_EXTENSION ):
+    """Return path of snapshot of given source file.
+
+    If 'cache_dir' is not given, then snapshot is placed next to source file.
+    """
+    if cache_dir is None:
+        return source_path + extension
+    source_name = os.path.basename( source_path )
+    path_hash   = hashlib.sha1( os.path.abspath( source_path ).encode( "utf-8" ) ).hexdigest()[:16]
+    return os.path.join( cache_dir, f"{source_name}.{path_hash}{extension}" )
+
+
+def save_snapshot( data, snapshot_file, source_path=None ):
+    """Store data in snapshot file.
+
+    If 'source_path' is given, then fingerprint of source is stored to detect outdated snapshots.
+    File is replaced atomically, so concurrent readers never see partial snapshot.
+    """
+    fingerprint = None
+    if source_path is not None:
+        fingerprint = file_fingerprint( source_path )
+    header = { "version": SNAPSHOT_VERSION, "fingerprint": fingerprint }
+    snapshot_dir = os.path.dirname( os.path.abspath( snapshot_file ) )
+    os.makedirs( snapshot_dir, exist_ok=True )
+    temp_file = f"{snapshot_file}.{os.getpid()}.tmp"
+    try:
+        with open( temp_file, 'wb' ) as out_file:
+            pickle.dump( header, out_file, protocol=pickle.HIGHEST_PROTOCOL )
+            pickle.dump( data, out_file, protocol=pickle.HIGHEST_PROTOCOL )
+        os.replace( temp_file, snapshot_file )
+    finally:
+        if os.path.exists( temp_file ):
+            os.remove( temp_file )
+
+
+def load_snapshot( snapshot_file, source_path=None ):
+    """Load data from snapshot file.
+
+    Return None if snapshot does not exist, is invalid or is outdated with respect to 'source_path'.
+    """
+    if not os.path.isfile( snapshot_file ):
+        return None
+    try:
+        with open( snapshot_file, 'rb' ) as in_file:
+            header = pickle.load( in_file )
+            if not isinstance( header, dict ) or header.get( "version" ) != SNAPSHOT_VERSION:
+                _LOGGER.debug( "snapshot version mismatch: %s", snapshot_file )
+                return None
+            if source_path is not None and header.get( "fingerprint" ) != file_fingerprint( source_path ):
+                _LOGGER.debug( "outdated snapshot: %s", snapshot_file )
+                return None
+            return pickle.load( in_file )
+    except ( OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError ) as exc:
+        _LOGGER.warning( "unable to load snapshot %s: %s", snapshot_file, exc )
+        return None
+
+
+def load_with_snapshot( source_path, loader, snapshot_file=None, cache_dir=None ):
+    """Load data of source file using snapshot if valid, otherwise call 'loader( source_path )' and store snapshot."""
+    if snapshot_file is None:
+        snapshot_file = snapshot_path( source_path, cache_dir )
+    data = load_snapshot( snapshot_file, source_path )
+    if data is not None:
+        return data
+    data = loader( source_path )
+    try:
+        save_snapshot( data, snapshot_file, source_path )
+    except OSError as exc:
+        _LOGGER.warning( "unable to store snapshot %s: %s", snapshot_file, exc )
+    return data
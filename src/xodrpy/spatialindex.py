@@ -0,0 +1,174 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+
+import os
+import logging
+from typing import List
+
+import math
+import numpy as np
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## ===========================================================
+
+
+##
+class GridIndex():
+    """Uniform grid hashing axis aligned 2D boxes (point is box of zero size).
+
+    Box is stored in every cell it overlaps, queries check candidates from overlapped cells
+    against exact boxes.
+    """
+
+    def __init__(self, min_points, max_points=None, cell_size=None):
+        self.min_points = np.asarray( min_points, dtype=np.float64 ).reshape( -1, 2 )
+        if max_points is None:
+            self.max_points = self.min_points
+        else:
+            self.max_points = np.asarray( max_points, dtype=np.float64 ).reshape( -1, 2 )
+        if cell_size is None:
+            cell_size = estimate_cell_size( self.min_points, self.max_points )
+        self.cell_size = float( cell_size )
+        self.cells = {}
+
+        if len( self.min_points ) < 1:
+            return
+        min_cells = np.floor( self.min_points / self.cell_size ).astype( np.int64 )
+        max_cells = np.floor( self.max_points / self.cell_size ).astype( np.int64 )
+        for item, ( min_x, min_y, max_x, max_y ) in enumerate( np.hstack( ( min_cells, max_cells ) ).tolist() ):
+            for cell_x in range( min_x, max_x + 1 ):
+                for cell_y in range( min_y, max_y + 1 ):
+                    self.cells.setdefault( ( cell_x, cell_y ), [] ).append( item )
+
+    def size(self):
+        return len( self.min_points )
+
+    def queryBox(self, min_pos, max_pos) -> np.ndarray:
+        """Return sorted array of indexes of items intersecting given box."""
+        candidates = self._candidates( min_pos[0], min_pos[1], max_pos[0], max_pos[1] )
+        if len( candidates ) < 1:
+            return candidates
+        mins = self.min_points[ candidates ]
+        maxs = self.max_points[ candidates ]
+        hit  = ( maxs[:, 0] >= min_pos[0] ) & ( mins[:, 0] <= max_pos[0] ) & \
+               ( maxs[:, 1] >= min_pos[1] ) & ( mins[:, 1] <= max_pos[1] )
+        return candidates[ hit ]
+
+    def queryRadius(self, center, radius) -> np.ndarray:
+        """Return sorted array of indexes of items closer to 'center' than 'radius'."""
+        candidates = self._candidates( center[0] - radius, center[1] - radius,
+                                       center[0] + radius, center[1] + radius )
+        if len( candidates ) < 1:
+            return candidates
+        ## distance from center to box
+        mins  = self.min_points[ candidates ]
+        maxs  = self.max_points[ candidates ]
+        diff_x = np.maximum( np.maximum( mins[:, 0] - center[0], center[0] - maxs[:, 0] ), 0.0 )
+        diff_y = np.maximum( np.maximum( mins[:, 1] - center[1], center[1] - maxs[:, 1] ), 0.0 )
+        hit    = diff_x * diff_x + diff_y * diff_y <= radius * radius
+        return candidates[ hit ]
+
+    def _candidates(self, min_x, min_y, max_x, max_y) -> np.ndarray:
+        cell_min_x = math.floor( min_x / self.cell_size )
+        cell_min_y = math.floor( min_y / self.cell_size )
+        cell_max_x = math.floor( max_x / self.cell_size )
+        cell_max_y = math.floor( max_y / self.cell_size )
+        cells_num  = ( cell_max_x - cell_min_x + 1 ) * ( cell_max_y - cell_min_y + 1 )
+        found = []
+        if cells_num > len( self.cells ):
+            ## query bigger than grid - iterate over occupied cells
+            for ( cell_x, cell_y ), items in self.cells.items():
+                if cell_min_x <= cell_x <= cell_max_x and cell_min_y <= cell_y <= cell_max_y:
+                    found.extend( items )
+        else:
+            for cell_x in range( cell_min_x, cell_max_x + 1 ):
+                for cell_y in range( cell_min_y, cell_max_y + 1 ):
+                    items = self.cells.get( ( cell_x, cell_y ), None )
+                    if items:
+                        found.extend( items )
+        return np.unique( np.array( found, dtype=np.int64 ) )
+
+
+def estimate_cell_size( min_points, max_points ):
+    """Estimate cell size giving few items per cell."""
+    items_num = len( min_points )
+    if items_num < 1:
+        return 1.0
+    extent = np.max( max_points, axis=0 ) - np.min( min_points, axis=0 )
+    area   = max( float( extent[0] ) * float( extent[1] ), 1.0 )
+    boxes  = max_points - min_points
+    mean_box = float( np.mean( np.maximum( boxes[:, 0], boxes[:, 1] ) ) )
+    return max( math.sqrt( area / items_num ) * 2.0, mean_box, 1.0 )
+
+
+def clip_polyline( points: np.ndarray, min_pos, max_pos ) -> List[ np.ndarray ]:
+    """Clip polyline to axis aligned box (Liang-Barsky algorithm applied to all segments).
+
+    Return list of polylines lying inside box.
+    """
+    points = np.asarray( points, dtype=np.float64 ).reshape( -1, 2 )
+    if len( points ) < 2:
+        inside = ( points >= min_pos ).all( axis=1 ) & ( points <= max_pos ).all( axis=1 )
+        return [ points[ inside ] ] if inside.any() else []
+    starts = points[ :-1 ]
+    deltas = np.diff( points, axis=0 )
+    enter  = np.zeros( len( deltas ) )
+    leave  = np.ones( len( deltas ) )
+    visible = np.ones( len( deltas ), dtype=bool )
+    for axis in range( 2 ):
+        axis_start = starts[:, axis]
+        axis_delta = deltas[:, axis]
+        parallel   = axis_delta == 0.0
+        visible   &= ~parallel | ( ( axis_start >= min_pos[ axis ] ) & ( axis_start <= max_pos[ axis ] ) )
+        with np.errstate( divide="ignore", invalid="ignore" ):
+            ratio_a = ( min_pos[ axis ] - axis_start ) / axis_delta
+            ratio_b = ( max_pos[ axis ] - axis_start ) / axis_delta
+        enter = np.where( parallel, enter, np.maximum( enter, np.minimum( ratio_a, ratio_b ) ) )
+        leave = np.where( parallel, leave, np.minimum( leave, np.maximum( ratio_a, ratio_b ) ) )
+    visible &= enter <= leave
+    if not visible.any():
+        return []
+
+    clip_start = starts + deltas * enter[:, None]
+    clip_end   = starts + deltas * leave[:, None]
+    ## new polyline begins if previous segment is hidden or clipped at its end, or segment is clipped at start
+    prev_continues = np.zeros( len( deltas ), dtype=bool )
+    prev_continues[ 1: ] = visible[ :-1 ] & ( leave[ :-1 ] >= 1.0 )
+    begins = visible & ( ~prev_continues | ( enter > 0.0 ) )
+
+    ret_list = []
+    begin_indexes = np.nonzero( begins )[0].tolist()
+    for index, begin in enumerate( begin_indexes ):
+        end = begin + 1
+        limit = begin_indexes[ index + 1 ] if index + 1 < len( begin_indexes ) else len( deltas )
+        while end < limit and visible[ end ]:
+            end += 1
+        ret_list.append( np.vstack( ( clip_start[ begin ][ None, : ], clip_end[ begin:end ] ) ) )
+    return ret_list
@@ -0,0 +1,157 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import logging
+import gzip
+from typing import List
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## ===========================================================
+
+
+##
+class SvgStreamWriter():
+    """Write SVG document element by element directly to file (without building DOM).
+
+    Paths are given as lists of polylines (numpy arrays of shape (N, 2)) and are written
+    with relative coordinates rounded to fixed precision. Rounding is done on absolute
+    coordinates, so relative coordinates do not accumulate error.
+    """
+
+    def __init__(self, out_file, size, precision=2, viewbox=None):
+        self.out_file  = out_file
+        self.precision = int( precision )
+        self._scale    = 10 ** self.precision
+        self._groups   = 0
+        width  = format_number( size[0] )
+        height = format_number( size[1] )
+        out_file.write( '<?xml version="1.0" encoding="utf-8" ?>\n' )
+        viewbox_attr = ""
+        if viewbox is not None:
+            viewbox_attr = f' viewBox="0 0 {format_number( viewbox[0] )} {format_number( viewbox[1] )}"'
+        out_file.write( f'<svg baseProfile="tiny" height="{height}" version="1.2"{viewbox_attr} width="{width}"'
+                        ' xmlns="http://www.w3.org/2000/svg">\n' )
+
+    def beginGroup(self, **attribs):
+        self.out_file.write( f"<g{format_attribs( attribs )}>\n" )
+        self._groups += 1
+
+    def endGroup(self):
+        self.out_file.write( "</g>\n" )
+        self._groups -= 1
+
+    def addPath(self, strips: List[ np.ndarray ], **attribs):
+        data = path_data( strips, self.precision )
+        if not data:
+            return
+        self.out_file.write( f'<path d="{data}"{format_attribs( attribs )}/>\n' )
+
+    def close(self):
+        while self._groups > 0:
+            self.endGroup()
+        self.out_file.write( "</svg>\n" )
+
+
+## ===========================================================
+
+
+def open_svg( svg_path ):
+    """Open output file for writing, file is compressed with gzip if path ends with '.svgz'."""
+    if svg_path.endswith( ".svgz" ):
+        return gzip.open( svg_path, 'wt', encoding="utf-8" )
+    return open( svg_path, 'w', encoding="utf-8" )
+
+
+def path_data( strips: List[ np.ndarray ], precision=2 ) -> str:
+    """Return content of 'd' attribute of SVG path consisting of given polylines.
+
+    First point is absolute, all other are relative. Polyline starting at end
+    of previous one is continued without move command.
+    """
+    scale = 10 ** precision
+    parts = []
+    line_deltas = []        ## deltas of current 'lineto' sequence
+    prev_point  = None
+    for strip in strips:
+        if len( strip ) < 1:
+            continue
+        units = np.rint( np.asarray( strip, dtype=np.float64 ).reshape( -1, 2 ) * scale ).astype( np.int64 )
+        if prev_point is None:
+            parts.append( "M" + format_units( units[0], precision ) )
+        else:
+            move = units[0] - prev_point
+            if move.any():
+                flush_lines( parts, line_deltas, precision )
+                parts.append( "m" + format_units( move, precision ) )
+        deltas = np.diff( units, axis=0 )
+        deltas = deltas[ deltas.any( axis=1 ) ]
+        if len( deltas ) > 0:
+            line_deltas.append( deltas.ravel() )
+        prev_point = units[-1]
+    flush_lines( parts, line_deltas, precision )
+    return "".join( parts )
+
+
+def flush_lines( parts: List[ str ], line_deltas: List[ np.ndarray ], precision ):
+    if not line_deltas:
+        return
+    parts.append( "l" + format_units( np.concatenate( line_deltas ), precision ) )
+    line_deltas.clear()
+
+
+def format_units( values, precision ) -> str:
+    """Format integer values given in units of 10^-precision as compact numbers list."""
+    scale = 10 ** precision
+    ret_list = []
+    for value in values.tolist():
+        if precision < 1 or value % scale == 0:
+            ret_list.append( str( value // scale ) )
+            continue
+        sign = "-" if value < 0 else ""
+        integer, fraction = divmod( abs( value ), scale )
+        fraction_str = str( fraction ).rjust( precision, "0" ).rstrip( "0" )
+        if integer == 0:
+            ret_list.append( f"{sign}.{fraction_str}" )
+        else:
+            ret_list.append( f"{sign}{integer}.{fraction_str}" )
+    ## separator is not needed before negative number
+    return " ".join( ret_list ).replace( " -", "-" )
+
+
+def format_number( value ) -> str:
+    return f"{value:.6f}".rstrip( "0" ).rstrip( "." )
+
+
+def format_attribs( attribs ) -> str:
+    ## underscore in keyword names stands for dash (e.g. 'stroke_width')
+    return "".join( f" {key.replace( '_', '-' )}={quoteattr( str( value ) )}" for key, value in attribs.items() )
+
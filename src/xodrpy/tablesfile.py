@@ -0,0 +1,231 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import json
+import struct
+import logging
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from xodrpy.maptables import MapTables, TABLE_ARRAYS
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+## file layout:
+##   magic (8 bytes), version (uint32), reserved (uint32), header size (uint64), JSON header,
+##   arrays aligned to 'ARRAY_ALIGNMENT' (offsets, dtypes and shapes are given in header)
+TABLES_MAGIC   = b"XODRTBL\x00"
+TABLES_VERSION = 1
+TABLES_EXTENSION = ".xodrtbl"
+
+PREFIX_FORMAT = "<8sIIQ"
+PREFIX_SIZE   = struct.calcsize( PREFIX_FORMAT )
+
+ARRAY_ALIGNMENT = 64
+
+
+## ===========================================================
+
+
+##
+class MapTablesFile():
+    """Map tables and sampled polylines read from memory mapped file.
+
+    Arrays are read-only views of mapped file, so opening does not read data of roads
+    and only pages of accessed roads are loaded by the system.
+
+    Reference line of road with index 'i' is 'line_points[ line_offsets[i]:line_offsets[i + 1] ]'.
+    Lane borders of road 'i' are items '[ border_offsets[i], border_offsets[i + 1] )' of 'border_*'
+    arrays, points of border 'j' are 'border_points[ border_point_offsets[j]:border_point_offsets[j + 1] ]'.
+    """
+
+    def __init__(self, file_path):
+        with open( file_path, 'rb' ) as in_file:
+            prefix = in_file.read( PREFIX_SIZE )
+            if len( prefix ) < PREFIX_SIZE:
+                raise RuntimeError( f"invalid tables file: {file_path}" )
+            magic, version, _, header_size = struct.unpack( PREFIX_FORMAT, prefix )
+            if magic != TABLES_MAGIC:
+                raise RuntimeError( f"invalid tables file: {file_path}" )
+            if version != TABLES_VERSION:
+                raise RuntimeError( f"unsupported version {version} of tables file: {file_path}" )
+            header = json.loads( in_file.read( header_size ).decode( "utf-8" ) )
+
+        self.file_path = file_path
+        self.header    = header
+        self.step      = header[ "step" ]
+        self.road_ids: List[ str ] = header[ "road_ids" ]
+        self.road_index: Dict[ str, int ] = { road_id: index for index, road_id in enumerate( self.road_ids ) }
+        self._buffer = np.memmap( file_path, dtype=np.uint8, mode="r" )
+        self.arrays: Dict[ str, np.ndarray ] = {}
+        for name, ( offset, dtype, shape ) in header[ "arrays" ].items():
+            self.arrays[ name ] = np.ndarray( tuple( shape ), dtype=np.dtype( dtype ), buffer=self._buffer, offset=offset )
+
+    def roadsNumber(self):
+        return len( self.road_ids )
+
+    def tables(self) -> MapTables:
+        """Return map tables backed by mapped file (supports all vectorized queries)."""
+        tables = MapTables()
+        tables.road_ids   = list( self.road_ids )
+        tables.road_index = dict( self.road_index )
+        for name in TABLE_ARRAYS:
+            setattr( tables, name, self.arrays[ name ] )
+        tables.buffer_owner = self._buffer
+        return tables
+
+    def referenceLine(self, road_id) -> np.ndarray:
+        """Return (N, 2) array of sampled reference line of road (None if road is unknown)."""
+        road_index = self.road_index.get( road_id, -1 )
+        if road_index < 0:
+            return None
+        offsets = self.arrays[ "line_offsets" ]
+        return self.arrays[ "line_points" ][ offsets[ road_index ]:offsets[ road_index + 1 ] ]
+
+    def laneBorders(self, road_id) -> List[ Tuple[ int, int, np.ndarray ] ]:
+        """Return list of tuples (lane section index, lane id, (N, 2) array of outer border of lane)."""
+        road_index = self.road_index.get( road_id, -1 )
+        if road_index < 0:
+            return []
+        offsets       = self.arrays[ "border_offsets" ]
+        sections      = self.arrays[ "border_section" ]
+        lanes         = self.arrays[ "border_lane" ]
+        point_offsets = self.arrays[ "border_point_offsets" ]
+        points        = self.arrays[ "border_points" ]
+        ret_list = []
+        for border in range( offsets[ road_index ], offsets[ road_index + 1 ] ):
+            border_points = points[ point_offsets[ border ]:point_offsets[ border + 1 ] ]
+            ret_list.append( ( int( sections[ border ] ), int( lanes[ border ] ), border_points ) )
+        return ret_list
+
+
+## ===========================================================
+
+
+def sample_polylines( opendrive: 'OpenDRIVE', step=1.0, lanes=True ) -> Dict[ str, np.ndarray ]:
+    """Return arrays of sampled reference lines and outer borders of lanes (layout as in 'MapTablesFile')."""
+    ## deferred import - tiles module is not needed to read file
+    from xodrpy.tiles import sample_offsets
+
+    tables = opendrive.mapTables()
+    roads_list = [ opendrive.roadById( road_id ) for road_id in tables.road_ids ]
+
+    line_offsets = [ 0 ]
+    line_points  = []
+    border_offsets = [ 0 ]
+    border_section = []
+    border_lane    = []
+    border_point_offsets = [ 0 ]
+    border_points  = []
+    for road_index, road in enumerate( roads_list ):
+        s_coords = sample_offsets( 0.0, float( tables.road_length[ road_index ] ), step )
+        road_indexes = np.full( len( s_coords ), road_index )
+        positions, _ = tables.positions( road_indexes, s_coords, np.zeros( len( s_coords ) ) )
+        line_points.append( positions[:, :2] )
+        line_offsets.append( line_offsets[-1] + len( s_coords ) )
+
+        if lanes and road.get( "lanes", None ):
+            for section_index, section in enumerate( road.laneSections() ):
+                start_s, end_s = road.laneSectionRange( section_index )
+                if end_s <= start_s:
+                    continue
+                s_coords = sample_offsets( start_s, end_s, step )
+                road_indexes = np.full( len( s_coords ), road_index )
+                for lane in section.lanesList():
+                    lane_id = int( lane.id() )
+                    if lane_id == 0:
+                        continue
+                    offsets = [ section.minMaxTOffset( lane_id, s_coord ) for s_coord in s_coords.tolist() ]
+                    outer_index = 1 if lane_id > 0 else 0
+                    t_coords = np.array( [ item[ outer_index ] for item in offsets ], dtype=np.float64 )
+                    positions, _ = tables.positions( road_indexes, s_coords, t_coords )
+                    border_points.append( positions[:, :2] )
+                    border_point_offsets.append( border_point_offsets[-1] + len( s_coords ) )
+                    border_section.append( section_index )
+                    border_lane.append( lane_id )
+        border_offsets.append( len( border_lane ) )
+
+    def stack_points( points_list ):
+        if not points_list:
+            return np.zeros( ( 0, 2 ) )
+        return np.concatenate( points_list )
+
+    return { "line_offsets":         np.array( line_offsets, dtype=np.int64 ),
+             "line_points":          stack_points( line_points ),
+             "border_offsets":       np.array( border_offsets, dtype=np.int64 ),
+             "border_section":       np.array( border_section, dtype=np.int32 ),
+             "border_lane":          np.array( border_lane, dtype=np.int32 ),
+             "border_point_offsets": np.array( border_point_offsets, dtype=np.int64 ),
+             "border_points":        stack_points( border_points ) }
+
+
+def align_offset( offset ):
+    return ( offset + ARRAY_ALIGNMENT - 1 ) // ARRAY_ALIGNMENT * ARRAY_ALIGNMENT
+
+
+def save_tables_file( opendrive: 'OpenDRIVE', file_path, step=1.0, lanes=True ):
+    """Write map tables and sampled polylines to binary file (see 'MapTablesFile')."""
+    tables = opendrive.mapTables()
+    arrays = { name: np.ascontiguousarray( getattr( tables, name ) ) for name in TABLE_ARRAYS }
+    arrays.update( sample_polylines( opendrive, step, lanes ) )
+
+    ## header size depends on offsets - reserve space for offsets of maximal length
+    def make_header( arrays_dict ):
+        header = { "step": step, "road_ids": list( tables.road_ids ), "arrays": arrays_dict }
+        return json.dumps( header ).encode( "utf-8" )
+
+    max_offsets = { name: [ 2 ** 62, array.dtype.str, list( array.shape ) ] for name, array in arrays.items() }
+    data_start  = align_offset( PREFIX_SIZE + len( make_header( max_offsets ) ) )
+    layout = {}
+    offset = data_start
+    for name, array in arrays.items():
+        layout[ name ] = [ offset, array.dtype.str, list( array.shape ) ]
+        offset = align_offset( offset + array.nbytes )
+    header_data = make_header( layout )
+
+    temp_file = f"{file_path}.{os.getpid()}.tmp"
+    try:
+        with open( temp_file, 'wb' ) as out_file:
+            out_file.write( struct.pack( PREFIX_FORMAT, TABLES_MAGIC, TABLES_VERSION, 0, len( header_data ) ) )
+            out_file.write( header_data )
+            for name, array in arrays.items():
+                out_file.write( b"\x00" * ( layout[ name ][0] - out_file.tell() ) )
+                out_file.write( array.tobytes() )
+            out_file.write( b"\x00" * ( offset - out_file.tell() ) )
+        os.replace( temp_file, file_path )
+    finally:
+        if os.path.exists( temp_file ):
+            os.remove( temp_file )
+
+
+def open_tables_file( file_path ) -> MapTablesFile:
+    return MapTablesFile( file_path )
@@ -0,0 +1,398 @@
+#
+# MIT License
+#
+# Copyright (c) 2022 Arkadiusz Netczuk <dev.arnet@gmail.com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+import os
+import sys
+import logging
+import math
+import struct
+import zlib
+from typing import List, Tuple, Set, TYPE_CHECKING
+
+
+SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
+
+
+if __name__ == '__main__':
+    ## allow having executable script inside package and have proper imports
+    ## replace directory of main package (prevent inconsistent imports)
+    sys.path[0] = os.path.join( SCRIPT_DIR, os.pardir )
+
+
+import numpy as np
+
+from xodrpy.spatialindex import GridIndex
+
+if TYPE_CHECKING:
+    from xodrpy.types import OpenDRIVE
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+TILE_SIZE = 256
+
+## RGBA colors
+BACKGROUND_COLOR = ( 0, 0, 0, 0 )
+DRIVING_COLOR    = ( 96, 96, 96, 255 )
+LANE_COLOR       = ( 160, 160, 160, 255 )
+LINE_COLOR       = ( 255, 0, 0, 255 )
+
+
+## ===========================================================
+
+
+##
+class TileScene():
+    """Map data prepared for rasterization: lane polygons and reference lines in world coordinates.
+
+    Items are indexed by spatial grid, so tile renders only items overlapping it.
+    """
+
+    def __init__(self, polygons: List[ np.ndarray ], polygon_colors: List[ Tuple ], lines: List[ np.ndarray ]):
+        self.polygons       = polygons
+        self.polygon_colors = polygon_colors
+        self.lines          = lines
+        items = polygons + lines
+        if items:
+            mins = np.array( [ item.min( axis=0 ) for item in items ] )
+            maxs = np.array( [ item.max( axis=0 ) for item in items ] )
+            self.min_pos = mins.min( axis=0 )
+            self.max_pos = maxs.max( axis=0 )
+        else:
+            mins = np.zeros( ( 0, 2 ) )
+            maxs = np.zeros( ( 0, 2 ) )
+            self.min_pos = np.zeros( 2 )
+            self.max_pos = np.zeros( 2 )
+        self.grid = GridIndex( mins, maxs )
+
+    def extent(self):
+        """Return tuple (min x, min y, size) of square covering whole scene (extent of tile at level 0)."""
+        size = float( max( self.max_pos[0] - self.min_pos[0], self.max_pos[1] - self.min_pos[1], 1.0 ) )
+        return ( float( self.min_pos[0] ), float( self.min_pos[1] ), size )
+
+    def tileBox(self, level, tile_x, tile_y):
+        """Return world box ((min x, min y), (max x, max y)) of tile (row 0 is at top of map)."""
+        min_x, min_y, size = self.extent()
+        tile_world = size / ( 2 ** level )
+        max_y = min_y + size
+        return ( ( min_x + tile_x * tile_world, max_y - ( tile_y + 1 ) * tile_world ),
+                 ( min_x + ( tile_x + 1 ) * tile_world, max_y - tile_y * tile_world ) )
+
+    def renderTile(self, level, tile_x, tile_y, tile_size=TILE_SIZE) -> np.ndarray:
+        """Return RGBA image (tile_size, tile_size, 4) of tile."""
+        min_box, max_box = self.tileBox( level, tile_x, tile_y )
+        return self.renderBox( min_box, max_box, tile_size, tile_size )
+
+    def renderBox(self, min_box, max_box, width, height) -> np.ndarray:
+        image = np.zeros( ( height, width, 4 ), dtype=np.uint8 )
+        image[:, :] = BACKGROUND_COLOR
+        scale_x = width / ( max_box[0] - min_box[0] )
+        scale_y = height / ( max_box[1] - min_box[1] )
+        ## one pixel margin for lines crossing border
+        margin = 1.0 / min( scale_x, scale_y )
+        found = self.grid.queryBox( ( min_box[0] - margin, min_box[1] - margin ),
+                                    ( max_box[0] + margin, max_box[1] + margin ) ).tolist()
+        polygons_num = len( self.polygons )
+
+        def to_pixels( points ):
+            pixels = np.empty( points.shape )
+            pixels[:, 0] = ( points[:, 0] - min_box[0] ) * scale_x
+            pixels[:, 1] = ( max_box[1] - points[:, 1] ) * scale_y
+            return pixels
+
+        for item in found:
+            if item < polygons_num:
+                fill_polygon( image, to_pixels( self.polygons[ item ] ), self.polygon_colors[ item ] )
+        for item in found:
+            if item >= polygons_num:
+                draw_polyline( image, to_pixels( self.lines[ item - polygons_num ] ), LINE_COLOR )
+        return image
+
+
+## ===========================================================
+
+
+def build_tile_scene( opendrive: 'OpenDRIVE', step=1.0, lanes=True ) -> TileScene:
+    """Sample reference lines and lanes boundaries of all roads."""
+    tables = opendrive.mapTables()
+    polygons       = []
+    polygon_colors = []
+    lines          = []
+    for road in opendrive.roads():
+        road_index = tables.road_index.get( road.id(), -1 )
+        if road_index < 0:
+            continue
+        length   = road.length()
+        s_coords = sample_offsets( 0.0, length, step )
+        road_indexes = np.full( len( s_coords ), road_index )
+        positions, _ = tables.positions( road_indexes, s_coords, np.zeros( len( s_coords ) ) )
+        lines.append( positions[:, :2] )
+        if not lanes or not road.get( "lanes", None ):
+            continue
+        for section_index, section in enumerate( road.laneSections() ):
+            start_s, end_s = road.laneSectionRange( section_index )
+            if end_s <= start_s:
+                continue
+            s_coords = sample_offsets( start_s, end_s, step )
+            road_indexes = np.full( len( s_coords ), road_index )
+            for lane in section.lanesList():
+                lane_id = int( lane.id() )
+                if lane_id == 0:
+                    continue
+                offsets = [ section.minMaxTOffset( lane_id, s_coord ) for s_coord in s_coords.tolist() ]
+                offsets = np.array( offsets, dtype=np.float64 )
+                if np.abs( offsets[:, 1] - offsets[:, 0] ).max() <= 0.0:
+                    continue
+                inner, _ = tables.positions( road_indexes, s_coords, offsets[:, 0] )
+                outer, _ = tables.positions( road_indexes, s_coords, offsets[:, 1] )
+                polygon  = np.concatenate( ( inner[:, :2], outer[::-1, :2] ) )
+                polygons.append( polygon )
+                polygon_colors.append( DRIVING_COLOR if lane.type() == "driving" else LANE_COLOR )
+    return TileScene( polygons, polygon_colors, lines )
+
+
+def sample_offsets( start_s, end_s, step ) -> np.ndarray:
+    steps_num = max( int( ( end_s - start_s ) / step ) + 1, 1 )
+    return np.linspace( start_s, end_s, steps_num + 1 )
+
+
+## ===========================================================
+
+
+def fill_polygon( image: np.ndarray, points: np.ndarray, color ):
+    """Fill polygon given in pixel coordinates using even-odd scanline rule (pixel centers are sampled)."""
+    height, width = image.shape[:2]
+    if len( points ) < 3:
+        return
+    min_row = max( int( math.floor( points[:, 1].min() ) ), 0 )
+    max_row = min( int( math.ceil( points[:, 1].max() ) ), height )
+    if min_row >= max_row:
+        return
+    start = points
+    end   = np.roll( points, -1, axis=0 )
+    rows_y = np.arange( min_row, max_row ) + 0.5
+    y0 = start[:, 1][ None, : ]
+    y1 = end[:, 1][ None, : ]
+    yc = rows_y[ :, None ]
+    crossing = ( ( y0 <= yc ) & ( yc < y1 ) ) | ( ( y1 <= yc ) & ( yc < y0 ) )
+    with np.errstate( divide="ignore", invalid="ignore" ):
+        ratio = ( yc - y0 ) / ( y1 - y0 )
+    cross_x = start[:, 0][ None, : ] + ratio * ( end[:, 0] - start[:, 0] )[ None, : ]
+    cross_x = np.where( crossing, cross_x, np.inf )
+    cross_x.sort( axis=1 )
+    counts = crossing.sum( axis=1 )
+
+    ## spans between consecutive pairs of crossings
+    pairs_num = cross_x.shape[1] // 2
+    span_x0 = cross_x[ :, 0:pairs_num * 2:2 ]
+    span_x1 = cross_x[ :, 1:pairs_num * 2:2 ]
+    valid   = ( 2 * np.arange( pairs_num ) + 1 )[ None, : ] < counts[ :, None ]
+    ## pixel is filled if its center is inside span
+    col_start = np.clip( np.ceil( np.where( valid, span_x0, 0.0 ) - 0.5 ), 0, width ).astype( np.int64 )
+    col_end   = np.clip( np.floor( np.where( valid, span_x1, 0.0 ) - 0.5 ) + 1, 0, width ).astype( np.int64 )
+    valid    &= col_start < col_end
+    span_rows, _ = np.nonzero( valid )
+    if len( span_rows ) < 1:
+        return
+    ## coverage is accumulated from span boundaries
+    coverage = np.zeros( ( len( rows_y ), width + 1 ), dtype=np.int32 )
+    np.add.at( coverage, ( span_rows, col_start[ valid ] ), 1 )
+    np.add.at( coverage, ( span_rows, col_end[ valid ] ), -1 )
+    covered = np.cumsum( coverage[ :, :width ], axis=1 ) > 0
+    image[ min_row:max_row ][ covered ] = color
+
+
+def draw_polyline( image: np.ndarray, points: np.ndarray, color ):
+    """Draw one pixel wide polyline given in pixel coordinates."""
+    height, width = image.shape[:2]
+    if len( points ) < 1:
+        return
+    if len( points ) < 2:
+        samples = points
+    else:
+        deltas = np.diff( points, axis=0 )
+        steps  = np.ceil( np.abs( deltas ).max( axis=1 ) ).astype( np.int64 ) + 1
+        seg_index = np.repeat( np.arange( len( deltas ) ), steps )
+        ## position of sample inside its segment in range [0, 1]
+        seg_start = np.repeat( np.cumsum( steps ) - steps, steps )
+        ratio     = ( np.arange( len( seg_index ) ) - seg_start ) / np.maximum( steps[ seg_index ] - 1, 1 )
+        samples   = points[ seg_index ] + deltas[ seg_index ] * ratio[:, None]
+    cols = np.floor( samples[:, 0] ).astype( np.int64 )
+    rows = np.floor( samples[:, 1] ).astype( np.int64 )
+    inside = ( cols >= 0 ) & ( cols < width ) & ( rows >= 0 ) & ( rows < height )
+    image[ rows[ inside ], cols[ inside ] ] = color
+
+
+## ===========================================================
+
+
+def encode_png( image: np.ndarray, compress_level=6 ) -> bytes:
+    """Encode image (H, W, 3) RGB or (H, W, 4) RGBA of type uint8 as PNG."""
+    image = np.ascontiguousarray( image, dtype=np.uint8 )
+    height, width, channels = image.shape
+    color_type = { 3: 2, 4: 6 }[ channels ]
+
+    def chunk( chunk_type, data ):
+        chunk_data = chunk_type + data
+        return struct.pack( ">I", len( data ) ) + chunk_data + struct.pack( ">I", zlib.crc32( chunk_data ) & 0xFFFFFFFF )
+
+    ## filter type 0 (none) at beginning of every row
+    raw = np.zeros( ( height, width * channels + 1 ), dtype=np.uint8 )
+    raw[:, 1:] = image.reshape( height, width * channels )
+    header = struct.pack( ">IIBBBBB", width, height, 8, color_type, 0, 0, 0 )
+    return b"".join( [ b"\x89PNG\r\n\x1a\n",
+                       chunk( b"IHDR", header ),
+                       chunk( b"IDAT", zlib.compress( raw.tobytes(), compress_level ) ),
+                       chunk( b"IEND", b"" ) ] )
+
+
+def write_png( png_path, image: np.ndarray ):
+    with open( png_path, 'wb' ) as png_file:
+        png_file.write( encode_png( image ) )
+
+
+## ===========================================================
+
+
+## scene of worker process
+_WORKER_SCENE: TileScene = None
+
+
+def _init_worker( scene: TileScene ):
+    global _WORKER_SCENE        # pylint: disable=W0603
+    _WORKER_SCENE = scene
+
+
+def _render_tile_task( task ):
+    level, tile_x, tile_y, tile_size, out_dir, skip_empty = task
+    return render_tile_file( _WORKER_SCENE, level, tile_x, tile_y, tile_size, out_dir, skip_empty )
+
+
+def render_tile_file( scene: TileScene, level, tile_x, tile_y, tile_size, out_dir, skip_empty=True ):
+    """Render tile to '<out_dir>/<level>/<x>/<y>.png'. Return path of file or None if tile is empty and skipped."""
+    image = scene.renderTile( level, tile_x, tile_y, tile_size )
+    if skip_empty and not image[:, :, 3].any():
+        return None
+    tile_dir = os.path.join( out_dir, str( level ), str( tile_x ) )
+    os.makedirs( tile_dir, exist_ok=True )
+    tile_path = os.path.join( tile_dir, f"{tile_y}.png" )
+    write_png( tile_path, image )
+    return tile_path
+
+
+def tile_tasks( scene: TileScene, levels, tile_size, out_dir, skip_empty ):
+    """Generate tasks of tiles overlapping any item of scene (all tiles if 'skip_empty' is False)."""
+    for level in levels:
+        tiles_num = 2 ** level
+        if skip_empty:
+            tiles_list = sorted( occupied_tiles( scene, level ) )
+        else:
+            tiles_list = [ ( tile_x, tile_y ) for tile_x in range( tiles_num ) for tile_y in range( tiles_num ) ]
+        for tile_x, tile_y in tiles_list:
+            yield ( level, tile_x, tile_y, tile_size, out_dir, skip_empty )
+
+
+def occupied_tiles( scene: TileScene, level ) -> Set[ Tuple[ int, int ] ]:
+    """Return set of tiles (x, y) of given level overlapped by bounds of any item of scene."""
+    grid = scene.grid
+    if grid.size() < 1:
+        return set()
+    min_x, min_y, size = scene.extent()
+    tiles_num  = 2 ** level
+    tile_world = size / tiles_num
+    max_y = min_y + size
+    ## tile of index 'i' covers range [i, i + 1] (in tile units), borders are shared by neighbours
+    range_x = np.stack( ( np.ceil( ( grid.min_points[:, 0] - min_x ) / tile_world - 1.0 ),
+                          np.floor( ( grid.max_points[:, 0] - min_x ) / tile_world ) ), axis=1 )
+    ## rows are counted from top of map
+    range_y = np.stack( ( np.ceil( ( max_y - grid.max_points[:, 1] ) / tile_world - 1.0 ),
+                          np.floor( ( max_y - grid.min_points[:, 1] ) / tile_world ) ), axis=1 )
+    range_x = np.clip( range_x, 0, tiles_num - 1 ).astype( np.int64 )
+    range_y = np.clip( range_y, 0, tiles_num - 1 ).astype( np.int64 )
+    tiles_set = set()
+    for start_x, end_x, start_y, end_y in np.hstack( ( range_x, range_y ) ).tolist():
+        for tile_x in range( start_x, end_x + 1 ):
+            for tile_y in range( start_y, end_y + 1 ):
+                tiles_set.add( ( tile_x, tile_y ) )
+    return tiles_set
+
+
+def render_tiles( opendrive: 'OpenDRIVE', out_dir, levels, tile_size=TILE_SIZE, workers=None, skip_empty=True,
+                  scene: TileScene = None ) -> List[ str ]:
+    """Render tiles pyramid of given levels using process pool.
+
+    Tiles are written to '<out_dir>/<level>/<x>/<y>.png'. If 'workers' is 1, then tiles are rendered
+    in current process. Return list of written files.
+    """
+    if scene is None:
+        scene = build_tile_scene( opendrive )
+    tasks = list( tile_tasks( scene, levels, tile_size, out_dir, skip_empty ) )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max( min( workers, len( tasks ) ), 1 )
+    if workers == 1:
+        results = [ render_tile_file( scene, *task[:4], out_dir, skip_empty ) for task in tasks ]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        chunk_size = max( len( tasks ) // ( workers * 4 ), 1 )
+        with ProcessPoolExecutor( max_workers=workers, initializer=_init_worker, initargs=( scene, ) ) as executor:
+            results = list( executor.map( _render_tile_task, tasks, chunksize=chunk_size ) )
+    return [ item for item in results if item is not None ]
+
+
+## ===========================================================
+
+
+def main():
+    parser = argparse.ArgumentParser(description='XODR tiles renderer')
+    parser.add_argument( '-la', '--logall', action='store_true', help='Log all messages' )
+    parser.add_argument( '--xodr', action='store', required=True, help="Input XODR file" )
+    parser.add_argument( '--outdir', action='store', required=True, help="Output directory of tiles" )
+    parser.add_argument( '--levels', action='store', type=int, default=3, help="Number of pyramid levels" )
+    parser.add_argument( '--tilesize', action='store', type=int, default=TILE_SIZE, help="Size of tile in pixels" )
+    parser.add_argument( '--workers', action='store', type=int, default=None, help="Number of worker processes" )
+
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    if args.logall is True:
+        logging.getLogger().setLevel( logging.DEBUG )
+    else:
+        logging.getLogger().setLevel( logging.INFO )
+
+    opendrive: 'OpenDRIVE' = load( args.xodr )
+    if opendrive is None:
+        _LOGGER.error( "unable to find file: %s", args.xodr )
+        return 1
+
+    tiles_list = render_tiles( opendrive, args.outdir, range( args.levels ), args.tilesize, args.workers )
+    _LOGGER.info( "written tiles: %s", len( tiles_list ) )
+    return 0
+
+
+if __name__ == '__main__':
+    import argparse
+    from xodrpy.xodr import load
+
+    sys.exit( main() )
@@ -25,11 +25,10 @@
 import os
 import abc
 import logging
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Tuple, Iterator, TYPE_CHECKING
 
 import math
 import numpy as np
-import pprint
 
 from xodrpy.utils import get_min_point2d, get_max_point2d, get_min_point,\
     get_max_point, Vector2D, Vector3D
@@ -37,6 +36,17 @@ from xodrpy.dicttoobject import convert,\
     DictLookup, BaseElement
 from xodrpy.OdrSpiral import OdrSpiral
 
+## modules of derived structures (lane graph, indexes, tables etc.) are imported
+## in accessors on first use to keep import of this module cheap
+if TYPE_CHECKING:
+    from xodrpy.horizon import RoadItemsIndex
+    from xodrpy.lanegraph import LaneGraph
+    from xodrpy.lod import PolylineLOD
+    from xodrpy.mapindex import MapIndex
+    from xodrpy.maptables import MapTables
+    from xodrpy.roadnetwork import RoadNetwork
+    from xodrpy.spatialindex import GridIndex
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,8 +59,19 @@ SCRIPT_DIR = os.path.dirname( os.path.abspath(__file__) )
 ##
 class OpenDRIVE( BaseElement ):
 
-#     def __init__(self):
-#         super().__init__()
+    def __init__(self):
+        super().__init__()
+        self._lane_graph = None     ## cached 'LaneGraph'
+        self._road_network = None   ## cached 'RoadNetwork'
+        self._map_index = None      ## cached 'MapIndex'
+        self._map_tables = None     ## cached 'MapTables'
+        self._signal_poses = None
+        self._reference_poses = None
+        self._object_poses = None
+        self._signal_grid = None
+        self._object_grid = None
+        self._road_items = None     ## cached 'RoadItemsIndex'
+        self._geometry_grid = None  ## cached 'GridIndex' of geometries bounds
 
     def getStandardVesion(self):
         header_dict = self.get( "header", None )
@@ -72,21 +93,192 @@ class OpenDRIVE( BaseElement ):
         return version
 
     def roads(self) -> List[ 'Road' ]:
+        """Return list of roads (not a copy).
+
+        After modifying the list (or any other data of map) 'invalidateCache()' has to be called.
+        """
         return self.get("road")
 
     def roadsNumber(self):
         return len( self.roads() )
 
     def roadById(self, road_id: str ) -> 'Road':
-        roads_list = self.roads()
-        for road in roads_list:
-            if road.id() == road_id:
-                return road
-        return None
+        """Return road by id using cached index - call 'invalidateCache()' after modifying map."""
+        return self.mapIndex().roads.get( road_id, None )
 
     def junctions(self) -> List[ 'Junction' ]:
         return self.get("junction")
 
+    def laneGraph(self) -> 'LaneGraph':
+        """Return lane connectivity graph (built on first call and cached)."""
+        if self._lane_graph is None:
+            from xodrpy.lanegraph import build_lane_graph
+            self._lane_graph = build_lane_graph( self )
+        return self._lane_graph
+
+    def roadNetwork(self) -> 'RoadNetwork':
+        """Return road topology index (built on first call and cached)."""
+        if self._road_network is None:
+            from xodrpy.roadnetwork import build_road_network
+            self._road_network = build_road_network( self )
+        return self._road_network
+
+    def invalidateCache(self):
+        """Drop cached structures built from data (call after modifying the map)."""
+        self._lane_graph = None
+        self._road_network = None
+        self._map_index = None
+        self._map_tables = None
+        self._signal_poses = None
+        self._reference_poses = None
+        self._object_poses = None
+        self._signal_grid = None
+        self._object_grid = None
+        self._road_items = None
+        self._geometry_grid = None
+        for road in self.roads():
+            road.invalidateCache()
+
+    def mapIndex(self) -> 'MapIndex':
+        """Return id lookups of map elements (built on first call and cached)."""
+        if self._map_index is None:
+            from xodrpy.mapindex import build_map_index
+            self._map_index = build_map_index( self )
+        return self._map_index
+
+    def mapTables(self) -> 'MapTables':
+        """Return geometry of roads compiled to numpy arrays (built on first call and cached)."""
+        if self._map_tables is None:
+            from xodrpy.maptables import build_map_tables
+            self._map_tables = build_map_tables( self )
+        return self._map_tables
+
+    def positions(self, road_ids, s_coords, t_coords, z_coords=None):
+        """Convert points given in track coordinates of roads to world coordinates (vectorized 'Road.position()').
+
+        Returns tuple: (N, 3) array of positions and (N,) array of reference line headings.
+        Rows of points on unknown roads are filled with NaN.
+        """
+        road_ids = np.asarray( road_ids )
+        if road_ids.dtype.kind in "iu":
+            road_ids = road_ids.astype( str )
+        tables = self.mapTables()
+        road_indexes = tables.roadIndexes( road_ids.tolist() )
+        return tables.positions( road_indexes, s_coords, t_coords, z_coords )
+
+    def signalPoses(self):
+        """Return tuple (positions, headings) of all signals.
+
+        Positions is (N, 3) array, headings is (N,) array, both aligned with 'signalsView()'.
+        """
+        if self._signal_poses is None:
+            from xodrpy.maptables import calculate_poses
+            index  = self.mapIndex()
+            coords = [ ( float( sig.attr("s") ), float( sig.attr("t") ),
+                         float( sig.get( "@zOffset", 0.0 ) ), float( sig.get( "@hOffset", 0.0 ) ) )
+                       for sig in index.signals_list ]
+            self._signal_poses = calculate_poses( self.mapTables(), index.signal_roads, coords )
+        return self._signal_poses
+
+    def signalReferencePoses(self):
+        """Return tuple (positions, headings) of all signal references aligned with 'signalReferencesView()'."""
+        if self._reference_poses is None:
+            from xodrpy.maptables import calculate_poses
+            index  = self.mapIndex()
+            ## signal reference does not have Z coord
+            coords = [ ( float( sig.attr("s") ), float( sig.attr("t") ),
+                         0.0, math.pi if sig.orientation() == "+" else 0.0 )
+                       for sig in index.references_list ]
+            self._reference_poses = calculate_poses( self.mapTables(), index.reference_roads, coords )
+        return self._reference_poses
+
+    def objectPoses(self):
+        """Return tuple (positions, headings) of all objects aligned with 'objectsView()'."""
+        if self._object_poses is None:
+            from xodrpy.maptables import calculate_poses
+            index  = self.mapIndex()
+            coords = [ ( float( obj.attr("s") ), float( obj.attr("t") ),
+                         float( obj.get( "@zOffset", 0.0 ) ), float( obj.get( "@hdg", 0.0 ) ) )
+                       for obj in index.objects_list ]
+            self._object_poses = calculate_poses( self.mapTables(), index.object_roads, coords )
+        return self._object_poses
+
+    def signalsNear(self, x_coord, y_coord, radius) -> List[ 'RoadSignal' ]:
+        """Return signals in given distance from point (on XY plane)."""
+        if self._signal_grid is None:
+            from xodrpy.spatialindex import GridIndex
+            self._signal_grid = GridIndex( self.signalPoses()[0][:, :2] )
+        found = self._signal_grid.queryRadius( ( x_coord, y_coord ), radius )
+        signals = self.signalsView()
+        return [ signals[ item ] for item in found.tolist() ]
+
+    def signalsInBox(self, bbox) -> List[ 'RoadSignal' ]:
+        """Return signals inside bounding box ( (min x, min y), (max x, max y) ) (Z is ignored)."""
+        if self._signal_grid is None:
+            from xodrpy.spatialindex import GridIndex
+            self._signal_grid = GridIndex( self.signalPoses()[0][:, :2] )
+        found = self._signal_grid.queryBox( bbox[0], bbox[1] )
+        signals = self.signalsView()
+        return [ signals[ item ] for item in found.tolist() ]
+
+    def objectsNear(self, x_coord, y_coord, radius) -> List[ 'RoadObject' ]:
+        """Return objects in given distance from point (on XY plane)."""
+        if self._object_grid is None:
+            from xodrpy.spatialindex import GridIndex
+            self._object_grid = GridIndex( self.objectPoses()[0][:, :2] )
+        found = self._object_grid.queryRadius( ( x_coord, y_coord ), radius )
+        objects = self.objectsView()
+        return [ objects[ item ] for item in found.tolist() ]
+
+    def objectsInBox(self, bbox) -> List[ 'RoadObject' ]:
+        """Return objects inside bounding box ( (min x, min y), (max x, max y) ) (Z is ignored)."""
+        if self._object_grid is None:
+            from xodrpy.spatialindex import GridIndex
+            self._object_grid = GridIndex( self.objectPoses()[0][:, :2] )
+        found = self._object_grid.queryBox( bbox[0], bbox[1] )
+        objects = self.objectsView()
+        return [ objects[ item ] for item in found.tolist() ]
+
+    def geometryGrid(self) -> 'GridIndex':
+        """Return spatial index of bounds of geometries (items are rows of 'mapTables()')."""
+        if self._geometry_grid is None:
+            from xodrpy.spatialindex import GridIndex
+            min_pos, max_pos = self.mapTables().geometryBounds()
+            self._geometry_grid = GridIndex( min_pos, max_pos )
+        return self._geometry_grid
+
+    def geometriesInBox(self, bbox) -> List[ Tuple[ 'Road', 'GeometryBase' ] ]:
+        """Return list of tuples (road, geometry) of geometries which bounds intersect given bounding box."""
+        found  = self.geometryGrid().queryBox( bbox[0], bbox[1] )
+        tables = self.mapTables()
+        road_indexes = np.searchsorted( tables.geom_offsets, found, side="right" ) - 1
+        ret_list = []
+        for geom_index, road_index in zip( found.tolist(), road_indexes.tolist() ):
+            road = self.roadById( tables.road_ids[ road_index ] )
+            geom = road.geometries()[ geom_index - tables.geom_offsets[ road_index ] ]
+            ret_list.append( ( road, geom ) )
+        return ret_list
+
+    def roadsInBox(self, bbox) -> List[ 'Road' ]:
+        """Return roads having any geometry intersecting given bounding box."""
+        ret_list = []
+        for road, _ in self.geometriesInBox( bbox ):
+            if not ret_list or ret_list[-1] is not road:
+                ret_list.append( road )
+        return ret_list
+
+    def roadItemsIndex(self) -> 'RoadItemsIndex':
+        """Return signals, references and objects of roads sorted by offset (built on first call and cached)."""
+        if self._road_items is None:
+            from xodrpy.horizon import build_road_items_index
+            self._road_items = build_road_items_index( self )
+        return self._road_items
+
+    def electronicHorizon(self, route: List[ int ], start_s=None, max_distance=300.0, max_items=None):
+        """Return signals, references and objects ahead along lane route (see 'horizon.electronic_horizon()')."""
+        from xodrpy.horizon import electronic_horizon
+        return electronic_horizon( self, route, start_s, max_distance, max_items )
+
     def junctionControllerSignals(self) -> Dict[ Any, List ]:
         """Return dict mapping junction id to list of controlled signals"""
         ret_dict = {}
@@ -121,196 +313,70 @@ class OpenDRIVE( BaseElement ):
                  (max_pos[0] + margin, max_pos[1] + margin, max_pos[2] + margin) )
 
     def signalIDList(self):
-        road_list = self.roads()
-        signal_ids = set()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-            sig_list = signals.get( "signal", [] )
-            for sig in sig_list:
-                sig_id = sig.get( "@id", None )
-                if sig_id is None:
-                    continue
-                signal_ids.add( sig_id )
-
-            ## signalReference does not have own ID - attribute 'id' points to proper signal
-
-        return signal_ids
+        ## signalReference does not have own ID - attribute 'id' points to proper signal
+        return set( item for item in self.mapIndex().signal_ids if item is not None )
 
     def signalUUIDList(self):
-        road_list = self.roads()
-        signal_ids = set()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-
-            sig_list = []
-            sig_list.extend( signals.get( "signal", [] ) )
-            ## sig_list.extend( signals.get( "signalReference", [] ) )
-            
-            for sig in sig_list:
-                sig_uuid = sig.uuid()
-                if sig_uuid is None:
-                    continue
-                signal_ids.add( sig_uuid )
-
-        return signal_ids
+        return set( item for item in self.mapIndex().signal_uuids if item is not None )
 
     def signalList(self) -> List[ 'RoadSignal' ]:
-        ret_list  = list()
-        road_list = self.roads()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-            ret_list.extend( signals.get( "signal", [] ) )
-        return ret_list
+        return list( self.mapIndex().signals_list )
 
     def signalReferenceList(self) -> List[ 'RoadSignalReference' ]:
-        ret_list  = list()
-        road_list = self.roads()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-            ret_list.extend( signals.get( "signalReference", [] ) )
-        return ret_list
+        return list( self.mapIndex().references_list )
 
     def signalGateList(self) -> List[ 'RoadSignalReference' ]:
-        road_list = self.roads()
-        signal_ids = list()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-
-            sig_list = []
-            ## sig_list.extend( signals.get( "signal", [] ) )
-            sig_list.extend( signals.get( "signalReference", [] ) )
-
-            for sig in sig_list:
-                user_data   = sig.get( "userData", {} )
-                signal_meta = user_data.get( "vectorSignal", {} )
-                gate_id     = signal_meta.get("@gateId", None)
-                if gate_id:
-                    signal_ids.append( sig )
-        return signal_ids
+        index = self.mapIndex()
+        return [ index.references_list[ item ] for item in index.gate_indexes ]
 
     def signalGateUUIDList(self):
-        road_list = self.roads()
-        signal_ids = set()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-
-            sig_list = []
-            ## sig_list.extend( signals.get( "signal", [] ) )
-            sig_list.extend( signals.get( "signalReference", [] ) )
-
-            for sig in sig_list:
-                user_data   = sig.get( "userData", {} )
-                signal_meta = user_data.get( "vectorSignal", {} )
-                gate_id     = signal_meta.get("@gateId", None)
-                if gate_id:
-                    signal_ids.add( gate_id )
-        return signal_ids
+        index = self.mapIndex()
+        return set( index.reference_gates[ item ] for item in index.gate_indexes )
+
+    def signalsView(self) -> Tuple[ 'RoadSignal', ...]:
+        """Return shared tuple of all signals (without copying)."""
+        return self.mapIndex().signals_list
+
+    def signalReferencesView(self) -> Tuple[ 'RoadSignalReference', ...]:
+        """Return shared tuple of all signal references (without copying)."""
+        return self.mapIndex().references_list
+
+    def objectsView(self) -> Tuple[ 'RoadObject', ...]:
+        """Return shared tuple of all objects (without copying)."""
+        return self.mapIndex().objects_list
+
+    def iterSignals(self) -> Iterator[ 'RoadSignal' ]:
+        yield from self.mapIndex().signals_list
+
+    def iterSignalReferences(self) -> Iterator[ 'RoadSignalReference' ]:
+        yield from self.mapIndex().references_list
+
+    def iterSignalGates(self) -> Iterator[ 'RoadSignalReference' ]:
+        index = self.mapIndex()
+        for item in index.gate_indexes:
+            yield index.references_list[ item ]
+
+    def iterObjects(self) -> Iterator[ 'RoadObject' ]:
+        yield from self.mapIndex().objects_list
 
     def signalById(self, signal_id) -> 'RoadSignal':
-        road_list = self.roads()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-            sig_list = signals.get( "signal", [] )
-            for sig in sig_list:
-                sig_id = sig.get( "@id", None )
-                if sig_id == signal_id:
-                    return sig
-
-            ## signalReference does not have own ID - attribute 'id' points to proper signal
-        return None
+        ## signalReference does not have own ID - attribute 'id' points to proper signal
+        return self.mapIndex().signals.get( signal_id, None )
 
     def signalByUUID(self, signal_uuid) -> 'RoadSignal':
-        road_list = self.roads()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-            sig_list = signals.get( "signal", [] )
-            for sig in sig_list:
-                if sig.uuid() == signal_uuid:
-                    return sig
-            ## signalReference does not have own ID - attribute 'id' points to proper signal
-        return None
+        return self.mapIndex().signals_uuid.get( signal_uuid, None )
 
     def signalReferencesByID(self, signal_id) -> List[ 'RoadSignalReference' ]:
-        ret_list = []
-        road_list = self.roads()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-            sig_list = signals.get( "signalReference", [] )
-            for sig in sig_list:
-                if sig.id() == signal_id:
-                    ret_list.append( sig )
-        return ret_list
+        return list( self.mapIndex().references.get( signal_id, [] ) )
 
     def signalReferencesByUUID(self, signal_uuid) -> List[ 'RoadSignalReference' ]:
-        ret_list = []
-        road_list = self.roads()
-        for road in road_list:
-            ## pprint.pprint( road )
-            signals = road.get( "signals", None )
-            if signals is None:
-                continue
-            sig_list = signals.get( "signalReference", [] )
-            for sig in sig_list:
-                if sig.uuid() == signal_uuid:
-                    ret_list.append( sig )
-        return ret_list
+        return list( self.mapIndex().references_uuid.get( signal_uuid, [] ) )
 
     def objectIDList(self):
-        road_list = self.roads()
-        object_ids = set()
-        for road in road_list:
-            ## pprint.pprint( road )
-            objects = road.get( "objects", None )
-            if objects is None:
-                continue
-            object_list = objects.get( "object", [] )
-            for obj in object_list:
-                obj_id = obj.get( "@id", None )
-                if obj_id is None:
-                    continue
-                object_ids.add( obj_id )
-        return object_ids
+        return set( item for item in self.mapIndex().object_ids if item is not None )
 
     def objectById(self, object_id) -> 'RoadObject':
-        road_list = self.roads()
-        for road in road_list:
-            ## pprint.pprint( road )
-            objects = road.get( "objects", None )
-            if objects is None:
-                continue
-            obj_list = objects.get( "object", [] )
-            for obj in obj_list:
-                obj_id = obj.get( "@id", None )
-                if obj_id == object_id:
-                    return obj
-        return None
+        return self.mapIndex().objects.get( object_id, None )
 
     ## ==============================================
 
@@ -318,11 +384,7 @@ class OpenDRIVE( BaseElement ):
         return self.get("controller")
 
     def controllerById(self, controller_id) -> 'SignalController':
-        controller_list = self.controllers()
-        for controller in controller_list:
-            if controller.id() == controller_id:
-                return controller
-        return None
+        return self.mapIndex().controllers.get( controller_id, None )
 
 
 ## ================================================================
@@ -513,6 +575,11 @@ class ArcGeometry( GeometryBase ):
 #         center_vec  = -self.radiusVector()
 #         radius_vec  =  self.radiusVector( value_offset )
 #         return start_point + center_vec + radius_vec
+        if abs( self.curvature() ) < 0.00001:
+            ## line
+            heading_vec = Vector2D( value_offset, 0.0 )
+            heading_vec.rotateXY( self.hdg() )
+            return self.startPosition() + heading_vec
         center_point = self.centerPoint()
         radius_vec   = self.radiusVector( value_offset )
         return center_point + radius_vec
@@ -586,7 +653,10 @@ class ClothoidGeometry( GeometryBase ):
         return start_point + spiral_point
 
     def headingByOffsetRaw( self, value_offset ) -> float:
-        raise NotImplementedError('You need to define this method in derived class!')
+        curv_start = self.curvatureStart()
+        curv_diff  = self.curvatureEnd() - curv_start
+        curvDot    = curv_diff / self.length()
+        return self.hdg() + value_offset * curv_start + 0.5 * curvDot * value_offset * value_offset
 
 
 ## ================================================================
@@ -595,8 +665,9 @@ class ClothoidGeometry( GeometryBase ):
 ##
 class Road( BaseElement ):
 
-#     def __init__(self):
-#         super().__init__()
+    def __init__(self):
+        super().__init__()
+        self._lod = None        ## cached 'PolylineLOD'
 
     def id(self):
         return self.attr("id")
@@ -607,6 +678,26 @@ class Road( BaseElement ):
     def length(self):
         return float( self.attr("length") )
 
+    def linkData(self, link_type):
+        """Return tuple (element type, element id, contact point) of road link.
+
+        'link_type' is "predecessor" or "successor". Returns None if link is not defined.
+        """
+        link_dict = self.get( "link", None )
+        if not link_dict:
+            return None
+        link_item = link_dict.get( link_type, None )
+        if not link_item:
+            return None
+        return ( link_item.get( "@elementType", "road" ), link_item.get( "@elementId", None ),
+                 link_item.get( "@contactPoint", None ) )
+
+    def predecessorData(self):
+        return self.linkData( "predecessor" )
+
+    def successorData(self):
+        return self.linkData( "successor" )
+
     def geometries(self) -> List[ GeometryBase ]:
         planView = self.get( "planView" )
         return planView.get( "geometry" )
@@ -633,6 +724,14 @@ class Road( BaseElement ):
     def laneSections(self) -> List[ 'LaneSection' ]:
         lanes = self.get( "lanes" )
         return lanes.get( "laneSection" )
+
+    def laneSectionRange(self, section_index):
+        """Return tuple (start offset, end offset) of lane section on road."""
+        sections  = self.laneSections()
+        start_pos = sections[ section_index ].offset()
+        if section_index + 1 < len( sections ):
+            return ( start_pos, sections[ section_index + 1 ].offset() )
+        return ( start_pos, self.length() )
     
     def laneSectionById(self, section_id):
         sections = self.laneSections()
@@ -690,6 +789,16 @@ class Road( BaseElement ):
         min_z   = min( start_z, end_z )
         max_z   = max( start_z, end_z )
         return ( (min_pos[0], min_pos[1], min_z), (max_pos[0], max_pos[1], max_z) )
+
+    def lineLOD(self) -> 'PolylineLOD':
+        """Return levels of detail of reference line approximation (built on first call and cached)."""
+        if self._lod is None:
+            from xodrpy.lod import build_road_lod
+            self._lod = build_road_lod( self )
+        return self._lod
+
+    def invalidateCache(self):
+        self._lod = None
     
     def signalsList(self) -> List[ 'RoadSignal' ]:
         sigs_dict = self.get("signals")
@@ -746,6 +855,9 @@ class LaneSection( BaseElement ):
     def offset(self):
         return float( self.attr("s") )
 
+    def lanesList(self) -> List[ 'Lane' ]:
+        return self.get( "lanes", [] )
+
     def laneById(self, lane_id) -> 'Lane':
         lane_id = str( lane_id )
         lanes = self.get( "lanes", [] )
@@ -803,6 +915,28 @@ class Lane( BaseElement ):
     def id(self):
         return self.attr("id")
 
+    def type(self):
+        return self.attr("type")
+
+    def predecessorIds(self) -> List[ str ]:
+        """Return list of linked lanes ids in previous lane section."""
+        return self._linkIds( "predecessor" )
+
+    def successorIds(self) -> List[ str ]:
+        """Return list of linked lanes ids in next lane section."""
+        return self._linkIds( "successor" )
+
+    def _linkIds(self, link_type):
+        link_dict = self.get( "link", None )
+        if not link_dict:
+            return []
+        link_list = link_dict.get( link_type, None )
+        if not link_list:
+            return []
+        if isinstance( link_list, list ) is False:
+            link_list = [ link_list ]
+        return [ item["@id"] for item in link_list if "@id" in item ]
+
     def widthList(self):
         return self.get( "width", [] )
 
@@ -947,7 +1081,8 @@ class RoadSignal( RoadSignalBase ):
         return self.road.position( s_coord, t_coord, z_coord )
 
     def headingRaw(self):
-        return float( self.attr( "hOffset" ) )
+        ## attribute is optional
+        return float( self.get( "@hOffset", 0.0 ) )
 
     def heading(self):
         obj_heading = self.headingRaw()
@@ -1067,7 +1202,8 @@ class RoadObject( BaseElement ):
         return self.road.position( s_coord, t_coord, z_coord )
 
     def headingRaw(self):
-        return float( self.attr( "hdg" ) )
+        ## attribute is optional
+        return float( self.get( "@hdg", 0.0 ) )
 
     def heading(self):
         obj_heading = self.headingRaw()
@@ -1129,10 +1265,35 @@ class Junction( BaseElement ):
             return None
         return junc_meta.get( "@junctionId", None )
 
+    def connectionsList(self) -> List[ dict ]:
+        connection_list = self.get("connection")
+        if not connection_list:
+            return []
+        if isinstance( connection_list, list ) is False:
+            return [ connection_list ]
+        return connection_list
+
+    def connectionsData(self):
+        """Return list of tuples (incoming road id, connecting road id, contact point, lane links).
+
+        Lane links is list of pairs (from lane id, to lane id).
+        """
+        ret = []
+        for item in self.connectionsList():
+            lane_links = item.get( "laneLink", [] )
+            if isinstance( lane_links, list ) is False:
+                lane_links = [ lane_links ]
+            links_list = [ (link["@from"], link["@to"]) for link in lane_links ]
+            ret.append( (item.get("@incomingRoad"), item.get("@connectingRoad"),
+                         item.get("@contactPoint"), links_list) )
+        return ret
+
     def controllersData(self):
         controller_list = self.get("controller")
         if not controller_list:
             return []
+        if isinstance( controller_list, list ) is False:
+            controller_list = [ controller_list ]
         ret = []
         for item in controller_list:
             ret.append( (item["@id"], item["@type"], item["@sequence"]) )
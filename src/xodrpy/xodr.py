@@ -27,7 +27,6 @@ import abc
 import logging
 from typing import List
 import xmltodict
-import pprint
 
 from xodrpy.utils import get_min_point2d, get_max_point2d, get_min_point,\
     get_max_point, Vector2D
@@ -54,26 +53,31 @@ def load( xodr_path ) -> OpenDRIVE:
 #         dict_ids  = get_identifiers( data_dict )
 #         pprint.pprint( dict_ids )
 
-        lookup = DictLookup()
-        lookup.addConverter( ["OpenDRIVE"], convert_to_OpenDRIVE )
-        lookup.addClass( ["OpenDRIVE", "road", "planView", "geometry", "line"], LineGeometry )
-        lookup.addClass( ["OpenDRIVE", "road", "planView", "geometry", "arc"], ArcGeometry )
-        lookup.addClass( ["OpenDRIVE", "road", "planView", "geometry", "spiral"], ClothoidGeometry )
-        lookup.addClass( ["OpenDRIVE", "road", "elevationProfile", "elevation"], Polynomial3 )
-        lookup.addClass( ["lane", "width"], LaneWidth )
-        lookup.addConverter( ["OpenDRIVE", "road", "lanes", "laneSection"], convert_to_LaneSection )
-        lookup.addClass( ["OpenDRIVE", "road", "signals", "signal"], RoadSignal )
-        lookup.addClass( ["OpenDRIVE", "road", "signals", "signalReference"], RoadSignalReference )
-        lookup.addClass( ["OpenDRIVE", "road", "objects", "object"], RoadObject )
-        lookup.addConverter( ["OpenDRIVE", "road"], convert_to_Road )
-        lookup.addClass( ["OpenDRIVE", "junction"], Junction )
-        lookup.addClass( ["OpenDRIVE", "controller"], SignalController )
-
+        lookup = create_lookup()
         convert( data_dict, lookup )
 
         return data_dict[ "OpenDRIVE" ]
 
 
+def create_lookup() -> DictLookup:
+    """Return converters of OpenDRIVE elements used by 'load()'."""
+    lookup = DictLookup()
+    lookup.addConverter( ["OpenDRIVE"], convert_to_OpenDRIVE )
+    lookup.addClass( ["OpenDRIVE", "road", "planView", "geometry", "line"], LineGeometry )
+    lookup.addClass( ["OpenDRIVE", "road", "planView", "geometry", "arc"], ArcGeometry )
+    lookup.addClass( ["OpenDRIVE", "road", "planView", "geometry", "spiral"], ClothoidGeometry )
+    lookup.addClass( ["OpenDRIVE", "road", "elevationProfile", "elevation"], Polynomial3 )
+    lookup.addClass( ["lane", "width"], LaneWidth )
+    lookup.addConverter( ["OpenDRIVE", "road", "lanes", "laneSection"], convert_to_LaneSection )
+    lookup.addClass( ["OpenDRIVE", "road", "signals", "signal"], RoadSignal )
+    lookup.addClass( ["OpenDRIVE", "road", "signals", "signalReference"], RoadSignalReference )
+    lookup.addClass( ["OpenDRIVE", "road", "objects", "object"], RoadObject )
+    lookup.addConverter( ["OpenDRIVE", "road"], convert_to_Road )
+    lookup.addClass( ["OpenDRIVE", "junction"], Junction )
+    lookup.addClass( ["OpenDRIVE", "controller"], SignalController )
+    return lookup
+
+
 ## ===========================================================
 
 
@@ -82,6 +86,8 @@ def convert_to_OpenDRIVE( data_dict: dict ) -> OpenDRIVE:
     obj.initialize( data_dict )
 
     ensure_list( obj.data, "road" )
+    ensure_list( obj.data, "junction" )
+    ensure_list( obj.data, "controller" )
     return obj
 
 